@@ -0,0 +1,141 @@
+"""Benchmark the maps of zipzap.ds.maps on the symbol keys the codec produces.
+
+For each key distribution, every map is filled with the distinct symbols and their
+counts, one put at a time and with from_items, then looked up once per symbol of the
+input, as the encoder does. Reports operations per second, probe lengths per entry
+and memory per entry.
+
+Usage: python benchmarks/bench_maps.py [TEXT_FILE] [--symbols N] [--seed S]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from rich.console import Console
+from rich.table import Table
+
+from zipzap.ds.maps.chain_hashmap import ChainHashmap
+from zipzap.ds.maps.compact_probe_hashmap import CompactProbeHashmap
+from zipzap.ds.maps.dense_char_map import DenseCharMap
+from zipzap.ds.maps.hashmap import Hashmap
+from zipzap.ds.maps.map import Map
+from zipzap.ds.maps.probe_hashmap import ProbeHashmap
+from zipzap.ds.maps.robin_hood_hashmap import RobinHoodHashmap
+
+DEFAULT_TEXT = Path(__file__).parent.parent / "test_data" / "moby_dick.txt"
+DEFAULT_SYMBOLS = 200_000  # symbols looked up per distribution
+WIDE_ALPHABET = 3000  # distinct characters of the wide distribution
+MIN_PUTS = 100_000  # puts timed per map, over repeated builds
+
+# Maps compared, with the options they are created with
+MAPS: dict[str, tuple[type[Map], dict[str, Any]]] = {
+    "ProbeHashmap": (ProbeHashmap, {}),
+    "ProbeHashmap (builtin hash)": (ProbeHashmap, {"hash_strategy": "builtin"}),
+    "CompactProbeHashmap": (CompactProbeHashmap, {}),
+    "RobinHoodHashmap": (RobinHoodHashmap, {}),
+    "ChainHashmap": (ChainHashmap, {}),
+    "DenseCharMap": (DenseCharMap, {}),
+}
+
+
+def distributions(text: str, num_symbols: int, seed: int) -> dict[str, list[str]]:
+    """Return symbol sequences like those the codec counts and encodes."""
+    rng = random.Random(seed)
+    # Random bytes in byte mode, one Latin-1 character per byte value
+    byte_symbols = [chr(b) for b in rng.randbytes(num_symbols)]
+    # Random bytes in text mode decode to thousands of distinct characters, here a
+    # Zipf-like spread over the BMP
+    alphabet = [chr(c) for c in rng.sample(range(0x100, 0xD800), WIDE_ALPHABET)]
+    weights = [1 / (rank + 1) for rank in range(WIDE_ALPHABET)]
+    wide_symbols = rng.choices(alphabet, weights, k=num_symbols)
+    return {
+        "text": list(text[:num_symbols]),
+        "bytes": byte_symbols,
+        "wide": wide_symbols,
+    }
+
+
+def measure(
+    map_class: type[Map], options: dict[str, Any], symbols: list[str]
+) -> list[str]:
+    """Return the table row of one map on one symbol sequence."""
+    counts = list(Counter(symbols).items())
+    rounds = max(MIN_PUTS // len(counts), 1)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        m = map_class(**options)
+        for symbol, count in counts:
+            m.put(symbol, count)
+    put_time = (time.perf_counter() - start) / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        map_class.from_items(counts, unique=True, **options)
+    bulk_time = (time.perf_counter() - start) / rounds
+
+    tracemalloc.start()
+    m = map_class(**options)
+    m.put_many(counts)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    get = m.get
+    start = time.perf_counter()
+    for symbol in symbols:
+        get(symbol)
+    get_time = time.perf_counter() - start
+
+    if isinstance(m, Hashmap):
+        lengths = list(m.probe_lengths())
+        mean_probes = f"{sum(lengths) / len(lengths):.2f}"
+        max_probes = str(max(lengths))
+    else:
+        mean_probes = max_probes = "-"
+
+    return [
+        f"{len(counts) / put_time:,.0f}",
+        f"{len(counts) / bulk_time:,.0f}",
+        f"{len(symbols) / get_time:,.0f}",
+        mean_probes,
+        max_probes,
+        f"{memory / len(counts):,.0f}",
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("text_file", nargs="?", type=Path, default=DEFAULT_TEXT)
+    parser.add_argument("--symbols", type=int, default=DEFAULT_SYMBOLS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    text = args.text_file.read_text(encoding="utf-8")
+    console = Console()
+
+    for name, symbols in distributions(text, args.symbols, args.seed).items():
+        table = Table(
+            title=f"{name}: {len(set(symbols))} keys, {len(symbols):,} lookups"
+        )
+        table.add_column("Map")
+        for column in (
+            "Puts/s",
+            "Bulk/s",
+            "Gets/s",
+            "Mean probes",
+            "Max probes",
+            "B/entry",
+        ):
+            table.add_column(column, justify="right")
+        for map_name, (map_class, options) in MAPS.items():
+            table.add_row(map_name, *measure(map_class, options, symbols))
+        console.print(table)
+
+
+if __name__ == "__main__":
+    main()
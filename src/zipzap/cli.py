@@ -1,14 +1,31 @@
 from pathlib import Path
+from typing import Iterable, Optional
 
 import typer
 from rich.console import Console
 
-from zipzap.compressor.huffman_coder import HuffmanEncoder, HuffmanDecoder
-from zipzap.compressor.huffman_tree import HuffmanTreeBuilder
-from zipzap.io.reader import ZzReader
+from zipzap.compressor.block_decoder import decode_blocks_to_file
+from zipzap.compressor.block_encoder import BLOCK_SIZE, INDEX_INTERVAL, encode_blocks
+from zipzap.compressor.estimate import estimate_file, should_store
+from zipzap.compressor.freq_counter import (
+    NUM_BYTE_VALUES,
+    ByteFreqCounter,
+    FreqCounter,
+)
+from zipzap.compressor.huffman_coder import (
+    BaseHuffmanEncoder,
+    ByteHuffmanEncoder,
+    HuffmanDecoder,
+    HuffmanEncoder,
+)
+from zipzap.compressor.range_decoder import decode_range
+from zipzap.ds.bits.bit_stream import BitStream
+from zipzap.io.chunks import read_byte_chunks, read_text_chunks
+from zipzap.io.mapped_reader import MappedZzReader
 from zipzap.io.writer import ZzWriter
 from zipzap.ui.components import (
     codebook_table,
+    estimate_stats,
     file_content,
     file_stats,
     huffman_tree_diagram,
@@ -29,15 +46,34 @@ console = Console()
 def zip(
     input_file: str,
     output_file: str = typer.Option(None, "--output", "-o"),
-    show_time: bool = typer.Option(False, "--time", help="Show encode/write timing"),
+    show_time: bool = typer.Option(False, "--time", help="Show count/encode timing"),
     show_contents: bool = typer.Option(False, "--contents", help="Show file contents"),
     show_codebook: bool = typer.Option(False, "--codebook", help="Show codebook table"),
     show_tree: bool = typer.Option(False, "--tree", help="Show Huffman tree"),
     pager: bool = typer.Option(True, " /--no-pager", help="Use a pager to view output"),
+    jobs: int = typer.Option(1, "--jobs", "-j", help="Count and encode in N processes"),
+    block_size: int = typer.Option(
+        None, "--block-size", help="Characters per block (implied by --jobs)"
+    ),
+    index_interval: int = typer.Option(
+        None, "--index-interval", help="Characters between seek index checkpoints"
+    ),
+    max_code_len: int = typer.Option(
+        None, "--max-code-length", help="Limit codes to this many bits"
+    ),
+    byte_mode: bool = typer.Option(
+        False, "--bytes", help="Compress any file byte by byte instead of as text"
+    ),
+    sample_rate: float = typer.Option(
+        None, "--sample", help="Build the code from this fraction of the file"
+    ),
+    sample_budget: int = typer.Option(
+        None, "--sample-bytes", help="Build the code from about this many bytes"
+    ),
 ):
-    """Compress a text file into a .zz file."""
+    """Compress a text file (or any file, with --bytes) into a .zz file."""
 
-    SMALL_FILE_THRESHOLD = 50
+    CONTENTS_PREVIEW_SIZE = 1024
 
     if input_file.endswith(".zz"):
         logger.warning("Compressing a .zz file")
@@ -48,31 +84,145 @@ def zip(
         logger.error(f"The file {input_path} does not exist.")
         raise typer.Exit(code=1)
 
+    _check_sample_options(sample_rate, sample_budget)
+    _check_block_options(block_size, index_interval)
+    sampling = sample_rate is not None or sample_budget is not None
+
+    no_blocks = jobs == 1 and block_size is None and index_interval is None
+    if byte_mode and not no_blocks:
+        logger.error("Byte mode does not support block options yet.")
+        raise typer.Exit(code=1)
+    if sampling and not no_blocks:
+        logger.error("Sampling does not support block options.")
+        raise typer.Exit(code=1)
+
     output_path = (
         input_path.with_suffix(".zz") if output_file is None else Path(output_file)
     )
     confirm_overwrite(output_path)
 
-    text = input_path.read_text(encoding="utf-8-sig", errors="replace")
-
-    if len(text) < SMALL_FILE_THRESHOLD:
-        logger.warning("Very small files may compress poorly.")
+    # First pass: count character (or byte) frequencies chunk by chunk, or only
+    # those of a sample, escaping characters it misses
+    with timed_progress("Count", "Counting characters...") as count_timer:
+        if byte_mode:
+            byte_counter = (
+                ByteFreqCounter.from_sample(input_path, sample_rate, sample_budget)
+                if sampling
+                else ByteFreqCounter.from_chunks(read_byte_chunks(input_path))
+            )
+            freq_table = byte_counter.to_freq_table()
+        elif sampling:
+            freq_table = FreqCounter.from_sample(input_path, sample_rate, sample_budget)
+        else:
+            freq_table = FreqCounter.from_chunks(read_text_chunks(input_path), jobs)
+
+    # Sampled codes also need an escape, or a code for every byte value
+    num_symbols = len(freq_table)
+    if sampling:
+        num_symbols = NUM_BYTE_VALUES if byte_mode else num_symbols + 1
+    if max_code_len is not None and (
+        max_code_len < 1 or (1 << max_code_len) < num_symbols
+    ):
+        logger.error(
+            f"{num_symbols} unique characters need codes longer than "
+            f"{max_code_len} bits."
+        )
+        raise typer.Exit(code=1)
 
-    with timed_progress("Encode", "Encoding text...") as encode_timer:
-        encoder = HuffmanEncoder(text)
-        encoded = encoder.encode(text)
+    # Parallel encoding and seek indexes need block mode
+    if block_size is None and (jobs > 1 or index_interval is not None):
+        block_size = BLOCK_SIZE
+    if index_interval is None:
+        index_interval = INDEX_INTERVAL
+
+    # Second pass: encode chunk by chunk straight into the output file
+    with timed_progress("Encode", "Encoding and writing text...") as encode_timer:
+        encoder: HuffmanEncoder | ByteHuffmanEncoder
+        if byte_mode:
+            encoder = ByteHuffmanEncoder(
+                counter=byte_counter, max_code_len=max_code_len, escape=sampling
+            )
+        else:
+            encoder = HuffmanEncoder(
+                freq_table=freq_table, max_code_len=max_code_len, escape=sampling
+            )
 
-    with timed_progress("Write", "Writing compressed file...") as write_timer:
         writer = ZzWriter(output_path)
-        writer.write(encoded, encoder.code_lengths)
+        num_chars, num_bytes = encoder.decoded_lengths()
+        stored = not sampling and should_store(encoder)
+        if sampling:
+            # The lengths are only known once the whole input is encoded
+            encoded_chunks = (
+                encoder.encode_chunks(read_byte_chunks(input_path))
+                if isinstance(encoder, ByteHuffmanEncoder)
+                else encoder.encode_chunks(read_text_chunks(input_path))
+            )
+            writer.write_stream_unsized(
+                encoded_chunks,
+                encoder.code_lengths,
+                lambda: _encoded_lengths(encoder),
+                is_bytes=byte_mode,
+            )
+        elif stored:
+            # Coding would not shrink the input, so it is copied instead
+            logger.info("The input does not compress, so it is stored as is.")
+            chunks = (
+                read_byte_chunks(input_path)
+                if byte_mode
+                else (text.encode("utf-8") for text in read_text_chunks(input_path))
+            )
+            writer.write_stored(chunks, num_chars, num_bytes, is_bytes=byte_mode)
+        elif isinstance(encoder, ByteHuffmanEncoder):
+            writer.write_stream(
+                encoder.encode_chunks(read_byte_chunks(input_path)),
+                encoder.encoded_bit_len(),
+                encoder.code_lengths,
+                is_bytes=True,
+                num_chars=num_chars,
+                num_bytes=num_bytes,
+            )
+        elif block_size is None:
+            writer.write_stream(
+                encoder.encode_chunks(read_text_chunks(input_path)),
+                encoder.encoded_bit_len(),
+                encoder.code_lengths,
+                num_chars=num_chars,
+                num_bytes=num_bytes,
+            )
+        else:
+            # Every block but the last holds exactly block_size characters
+            num_blocks = -(-num_chars // block_size)
+            writer.write_blocks(
+                encode_blocks(
+                    encoder.code_lengths,
+                    read_text_chunks(input_path, block_size),
+                    jobs,
+                    index_interval,
+                ),
+                num_blocks,
+                encoder.code_lengths,
+                index_interval,
+            )
 
     show_success(console, output_path, "Zipped!")
     console.print(file_stats(input_path, output_path))
 
     if show_time:
-        console.print(time_stats(encode_timer, write_timer))
+        console.print(time_stats(count_timer, encode_timer))
     if show_contents:
-        console.print(file_content(text, "Original Text", input_path.name))
+        # Only the first few lines are shown, so only a preview is read and encoded
+        if isinstance(encoder, ByteHuffmanEncoder):
+            data = next(read_byte_chunks(input_path, CONTENTS_PREVIEW_SIZE), b"")
+            preview = data.decode("utf-8", errors="replace")
+            encoded = BitStream.from_buffer(data) if stored else encoder.encode(data)
+        else:
+            preview = next(read_text_chunks(input_path, CONTENTS_PREVIEW_SIZE), "")
+            encoded = (
+                BitStream.from_buffer(preview.encode("utf-8"))
+                if stored
+                else encoder.encode(preview)
+            )
+        console.print(file_content(preview, "Original Text", input_path.name))
         console.print(file_content(str(encoded), "Encoded Bits", output_path.name))
     if show_codebook:
         table = codebook_table(encoder.codebook, encoder.freq_table)
@@ -82,9 +232,8 @@ def zip(
         else:
             console.print(table)
     if show_tree:
-        tree_diagram = huffman_tree_diagram(
-            HuffmanTreeBuilder.from_freq_table(encoder.freq_table)
-        )
+        # The tree of the code written, not one rebuilt from the frequencies
+        tree_diagram = huffman_tree_diagram(encoder.tree)
         if pager:
             with console.pager(styles=True):
                 console.print(tree_diagram)
@@ -100,9 +249,15 @@ def zap(
     show_contents: bool = typer.Option(False, "--contents", help="Show file contents"),
     show_codebook: bool = typer.Option(False, "--codebook", help="Show codebook table"),
     pager: bool = typer.Option(True, " /--no-pager", help="Use a pager to view output"),
+    jobs: int = typer.Option(1, "--jobs", "-j", help="Decode blocks in N processes"),
+    char_range: str = typer.Option(
+        None, "--range", help="Only decode characters START:END (end exclusive)"
+    ),
 ):
     """Decompress a .zz file into a text file."""
 
+    CONTENTS_PREVIEW_SIZE = 1024
+
     if not input_file.endswith(".zz"):
         logger.warning("Decompressing a non-.zz file")
 
@@ -112,6 +267,13 @@ def zap(
         logger.error(f"The file {input_path} does not exist.")
         raise typer.Exit(code=1)
 
+    if char_range is not None:
+        try:
+            start, end = _parse_range(char_range)
+        except ValueError:
+            logger.error(f"Invalid range '{char_range}', expected START:END.")
+            raise typer.Exit(code=1)
+
     output_path = (
         input_path.with_name(input_path.stem + "_decoded.txt")
         if output_file is None
@@ -119,24 +281,79 @@ def zap(
     )
     confirm_overwrite(output_path)
 
-    with timed_progress("Read", "Reading compressed file...") as read_timer:
-        reader = ZzReader(input_path)
-        encoded, code_lengths = reader.read()
-
-    with timed_progress("Decode", "Decoding text...") as decode_timer:
-        decoder = HuffmanDecoder(code_lengths)
-        decoded = decoder.decode(encoded)
+    # Map the file, so only the parts decoded are read from disk
+    try:
+        reader = MappedZzReader(input_path)
+    except ValueError as e:
+        logger.error(str(e))
+        raise typer.Exit(code=1)
 
-    output_path.write_text(decoded, encoding="utf-8")
+    with reader:
+        with timed_progress("Read", "Reading compressed file...") as read_timer:
+            header = reader.read_header_info()
+            code_lengths, bit_len = header.code_lengths, header.bit_len
+            blocks = header.blocks
+            is_bytes = header.is_bytes
+
+        if jobs > 1 and not blocks and not header.is_stored:
+            logger.warning(
+                "Only files zipped in block mode can be decoded in parallel."
+            )
+
+        # Decode chunk by chunk (or block by block), writing text as it is decoded
+        with timed_progress("Decode", "Decoding text...") as decode_timer:
+            try:
+                decoder = HuffmanDecoder(code_lengths)
+                if char_range is not None:
+                    text = decode_range(reader, start, end)
+                    if is_bytes:
+                        output_path.write_bytes(text.encode("latin-1"))
+                    else:
+                        output_path.write_text(text, encoding="utf-8")
+                elif blocks:
+                    decode_blocks_to_file(
+                        reader, code_lengths, blocks, output_path, jobs
+                    )
+                else:
+                    if header.is_stored:
+                        chunks = reader.read_data()
+                    elif is_bytes:
+                        chunks = decoder.decode_byte_stream(reader.read_data(), bit_len)
+                    else:
+                        chunks = (
+                            text.encode("utf-8")
+                            for text in decoder.decode_stream(
+                                reader.read_data(), bit_len
+                            )
+                        )
+                    written = _write_decoded(output_path, chunks, header.num_bytes)
+                    if header.num_bytes is not None and written != header.num_bytes:
+                        logger.error(
+                            f"Decoded {written} bytes, expected {header.num_bytes}."
+                        )
+                        raise typer.Exit(code=1)
+            except ValueError as e:
+                logger.error(str(e))
+                raise typer.Exit(code=1)
+
+        show_success(console, output_path, "Zapped!")
+        console.print(file_stats(input_path, output_path))
+
+        if show_time:
+            console.print(time_stats(read_timer, decode_timer))
+        if show_contents:
+            # Only the first few lines are shown, so only a preview is read
+            first_block = blocks[0] if blocks else None
+            first_bits = first_block.bit_len if first_block else bit_len
+            # Copy the preview out of the map, so it can be closed
+            data = bytes(
+                next(reader.read_data(CONTENTS_PREVIEW_SIZE, first_block), b"")
+            )
+            encoded = BitStream.from_bytearray(data, min(first_bits, 8 * len(data)))
+            preview = next(read_text_chunks(output_path, CONTENTS_PREVIEW_SIZE), "")
+            console.print(file_content(str(encoded), "Encoded Bits", input_path.name))
+            console.print(file_content(preview, "Decoded Text", output_path.name))
 
-    show_success(console, output_path, "Zapped!")
-    console.print(file_stats(input_path, output_path))
-
-    if show_time:
-        console.print(time_stats(read_timer, decode_timer))
-    if show_contents:
-        console.print(file_content(str(encoded), "Encoded Bits", input_path.name))
-        console.print(file_content(decoded, "Decoded Text", output_path.name))
     if show_codebook:
         table = codebook_table(decoder.codebook)
         if pager:
@@ -146,6 +363,119 @@ def zap(
             console.print(table)
 
 
+@app.command()
+def estimate(
+    input_file: str,
+    show_time: bool = typer.Option(False, "--time", help="Show count timing"),
+    count_jobs: int = typer.Option(
+        1, "--count-jobs", help="Count in N processes (still sizes the plain layout)"
+    ),
+    sample_rate: float = typer.Option(
+        None, "--sample", help="Only count this fraction of the file, e.g. 0.1"
+    ),
+    sample_budget: int = typer.Option(
+        None, "--sample-bytes", help="Only count about this many bytes of the file"
+    ),
+    max_code_len: int = typer.Option(
+        None, "--max-code-length", help="Limit codes to this many bits"
+    ),
+    byte_mode: bool = typer.Option(
+        False, "--bytes", help="Estimate byte mode instead of text"
+    ),
+):
+    """Estimate the size zip would compress a file to without block options."""
+
+    input_path = Path(input_file)
+
+    if not input_path.exists():
+        logger.error(f"The file {input_path} does not exist.")
+        raise typer.Exit(code=1)
+
+    _check_sample_options(sample_rate, sample_budget)
+
+    with timed_progress("Count", "Counting characters...") as count_timer:
+        try:
+            size_estimate = estimate_file(
+                input_path,
+                byte_mode,
+                sample_rate,
+                count_jobs,
+                max_code_len,
+                sample_budget,
+            )
+        except ValueError as e:
+            logger.error(str(e))
+            raise typer.Exit(code=1)
+
+    console.print(estimate_stats(size_estimate))
+
+    if show_time:
+        console.print(time_stats(count_timer))
+
+
+def _check_sample_options(
+    sample_rate: Optional[float], sample_budget: Optional[int]
+) -> None:
+    """Exit with an error unless the sample options are valid."""
+    if sample_rate is not None and sample_budget is not None:
+        logger.error("Give either --sample or --sample-bytes, not both.")
+        raise typer.Exit(code=1)
+    if sample_rate is not None and not 0 < sample_rate <= 1:
+        logger.error(f"Invalid sample rate {sample_rate}, expected (0, 1].")
+        raise typer.Exit(code=1)
+    if sample_budget is not None and sample_budget <= 0:
+        logger.error(f"Invalid sample size {sample_budget}, expected a positive size.")
+        raise typer.Exit(code=1)
+
+
+def _check_block_options(
+    block_size: Optional[int], index_interval: Optional[int]
+) -> None:
+    """Exit with an error unless the block options are valid."""
+    if block_size is not None and block_size <= 0:
+        logger.error(f"Invalid block size {block_size}, expected a positive size.")
+        raise typer.Exit(code=1)
+    if index_interval is not None and index_interval < 0:
+        logger.error(
+            f"Invalid index interval {index_interval}, expected 0 (no index) or more."
+        )
+        raise typer.Exit(code=1)
+
+
+def _write_decoded(
+    output_path: Path, chunks: Iterable[bytes], num_bytes: Optional[int]
+) -> int:
+    """Write decoded chunks to output_path, preallocated to num_bytes if known.
+
+    Return the number of bytes written.
+    """
+    written = 0
+    with output_path.open("wb") as f:
+        if num_bytes is not None:
+            f.truncate(num_bytes)
+        for data in chunks:
+            f.write(data)
+            written += len(data)
+    return written
+
+
+def _encoded_lengths(encoder: BaseHuffmanEncoder) -> tuple[int, int, int]:
+    """Return the (bits, characters, bytes) encode_chunks of encoder encoded."""
+    if encoder.encoded_lengths is None:
+        raise ValueError("Encoded lengths are only known once encoding is done")
+    return encoder.encoded_lengths
+
+
+def _parse_range(value: str) -> tuple[int, Optional[int]]:
+    """Parse START:END, where either side may be left out."""
+    start_text, end_text = value.split(":")
+    start = int(start_text) if start_text else 0
+    end = int(end_text) if end_text else None
+    if start < 0 or (end is not None and end < start):
+        raise ValueError(f"Invalid range: {value}")
+    return start, end
+
+
 def main():
     app()
 
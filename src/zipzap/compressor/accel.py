@@ -0,0 +1,138 @@
+from typing import Any, Optional
+
+from zipzap.compressor.codebook import ESCAPE, ESCAPE_BITS
+from zipzap.ds.maps.map import Map
+
+try:
+    import numpy as np
+
+    HAVE_NUMPY = True
+except ImportError:  # NumPy is optional, everything falls back to pure Python
+    HAVE_NUMPY = False
+
+MIN_ACCEL_SIZE = 1 << 12  # symbols below which pure Python loops are faster
+MAX_ACCEL_CODE_LEN = 56  # longest code whose bits are extracted from an int64
+PACK_BATCH = 1 << 16  # codes expanded to bits at a time, bounding memory use
+
+_enabled = HAVE_NUMPY
+
+
+def is_enabled() -> bool:
+    """Return whether the NumPy backend is used."""
+    return _enabled
+
+
+def set_enabled(enabled: bool) -> None:
+    """Turn the NumPy backend on or off. It stays off if NumPy is not installed."""
+    global _enabled
+    _enabled = enabled and HAVE_NUMPY
+
+
+def _symbol_array(text: str | bytes | bytearray | memoryview) -> Any:
+    """Return the codepoints of text, or the values of bytes, as an array."""
+    if isinstance(text, str):
+        data = text.encode("utf-32-le", errors="surrogatepass")
+        return np.frombuffer(data, dtype=np.uint32)
+    return np.frombuffer(text, dtype=np.uint8)
+
+
+def count_symbols(text: str | bytes | bytearray | memoryview) -> list[tuple[Any, int]]:
+    """Return (symbol, count) pairs of text, or (byte value, count) pairs of bytes."""
+    symbols = _symbol_array(text)
+    counts = np.bincount(symbols)
+    values = np.flatnonzero(counts)
+    if isinstance(text, str):
+        return [(chr(v), int(counts[v])) for v in values]
+    return [(int(v), int(counts[v])) for v in values]
+
+
+class ArrayPacker:
+    """Packs Huffman codes MSB first with vectorized NumPy operations."""
+
+    def __init__(
+        self, code_pairs: Map[str, tuple[int, int]] | list[Optional[tuple[int, int]]]
+    ):
+        """Gather code pairs keyed by character, or a flat array indexed by byte."""
+        if isinstance(code_pairs, list):
+            items = [(v, pair) for v, pair in enumerate(code_pairs) if pair]
+            self.escape = None
+        else:
+            items = sorted((ord(c), pair) for c, pair in code_pairs.entries())
+            self.escape = code_pairs.get(ESCAPE)
+
+        # Symbols sorted for binary search, with their codes and lengths alongside
+        self.keys = np.array([v for v, _ in items], dtype=np.int64)
+        self.codes = np.array([code for _, (code, _) in items], dtype=np.int64)
+        self.lens = np.array([length for _, (_, length) in items], dtype=np.int64)
+
+    @staticmethod
+    def supports(code_pairs: Map[str, tuple[int, int]] | list) -> bool:
+        """Return whether NumPy is in use and every code fits the vectorized path."""
+        if not _enabled:
+            return False
+        if isinstance(code_pairs, list):
+            pairs = code_pairs
+        else:
+            pairs = list(code_pairs.values())
+            escape = code_pairs.get(ESCAPE)
+            if escape is not None:
+                pairs.append((0, escape[1] + ESCAPE_BITS))
+        return all(pair is None or pair[1] <= MAX_ACCEL_CODE_LEN for pair in pairs)
+
+    def pack(
+        self, text: str | bytes | bytearray | memoryview, acc: int, acc_len: int
+    ) -> tuple[bytearray, int, int]:
+        """Pack text after acc_len pending bits acc.
+
+        Return the whole bytes and the new pending bits, fewer than 8, exactly as
+        BitPacker would. Symbols without a code are skipped, or escaped.
+        """
+        symbols = _symbol_array(text)
+
+        # Look up each symbol, dropping (or escaping) those without a code
+        idx = np.searchsorted(self.keys, symbols)
+        idx[idx == len(self.keys)] = 0
+        known = self.keys[idx] == symbols if len(self.keys) else idx < 0
+        if known.all():
+            codes = self.codes[idx]
+            lens = self.lens[idx]
+        elif self.escape is None:
+            codes = self.codes[idx[known]]
+            lens = self.lens[idx[known]]
+        else:
+            codes = self.codes[idx]
+            lens = self.lens[idx]
+            unknown = ~known
+            escape_code, escape_len = self.escape
+            codes[unknown] = (escape_code << ESCAPE_BITS) | symbols[unknown].astype(
+                np.int64
+            )
+            lens[unknown] = escape_len + ESCAPE_BITS
+
+        # Bit offset of every code, after the pending bits
+        starts = np.cumsum(lens) - lens + acc_len
+        total = acc_len + int(lens.sum())
+
+        bits = np.empty(total, dtype=np.uint8)
+        for j in range(acc_len):
+            bits[j] = (acc >> (acc_len - 1 - j)) & 1
+
+        # Expand each code into one array element per bit, a batch at a time
+        for lo in range(0, len(lens), PACK_BATCH):
+            batch_lens = lens[lo : lo + PACK_BATCH]
+            first = int(starts[lo])
+            bit_lens = np.repeat(batch_lens, batch_lens)
+            offsets = np.arange(len(bit_lens)) - np.repeat(
+                starts[lo : lo + PACK_BATCH] - first, batch_lens
+            )
+            bit_codes = np.repeat(codes[lo : lo + PACK_BATCH], batch_lens)
+            bits[first : first + len(bit_lens)] = (
+                bit_codes >> (bit_lens - 1 - offsets)
+            ) & 1
+
+        whole = total & ~7
+        out = bytearray(np.packbits(bits[:whole]).tobytes())
+        rem = 0
+        for bit in bits[whole:]:
+            rem = (rem << 1) | int(bit)
+        return out, rem, total - whole
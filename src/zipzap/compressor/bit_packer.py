@@ -0,0 +1,83 @@
+from typing import Any, Callable, Optional
+
+from zipzap.compressor.accel import MIN_ACCEL_SIZE, ArrayPacker
+from zipzap.compressor.codebook import ESCAPE, ESCAPE_BITS
+from zipzap.ds.maps.map import Map
+
+FLUSH_BITS = 512  # accumulator size that triggers a flush of whole bytes
+
+
+class BitPacker:
+    """Packs Huffman codes MSB first into bytes using an integer accumulator."""
+
+    def __init__(
+        self,
+        code_pairs: Map[str, tuple[int, int]] | list[Optional[tuple[int, int]]],
+    ):
+        """Use code pairs keyed by character, or a flat array indexed by byte value.
+
+        Characters without a code are skipped, or escaped if there is an ESCAPE code.
+        """
+        self.code_pairs = code_pairs
+        # Indexing a flat array is much faster than a hashmap lookup. Bytes iterate
+        # as ints for the array and text as characters for the map
+        self._lookup: Callable[[Any], Optional[tuple[int, int]]] = (
+            code_pairs.__getitem__ if isinstance(code_pairs, list) else code_pairs.get
+        )
+        self._escape = None if isinstance(code_pairs, list) else code_pairs.get(ESCAPE)
+        # Long inputs are packed with NumPy when it is installed
+        self._arrays = (
+            ArrayPacker(code_pairs) if ArrayPacker.supports(code_pairs) else None
+        )
+        self._acc = 0  # pending bits, right-aligned
+        self._acc_len = 0
+        self.bit_len = 0  # total bits packed, excluding padding
+
+    def pack(self, text: str | bytes | bytearray | memoryview) -> bytearray:
+        """Pack the codes of text or bytes. Return the whole bytes completed so far."""
+        if self._arrays is not None and len(text) >= MIN_ACCEL_SIZE:
+            out, acc, acc_len = self._arrays.pack(text, self._acc, self._acc_len)
+            self.bit_len += 8 * len(out) + acc_len - self._acc_len
+            self._acc, self._acc_len = acc, acc_len
+            return out
+
+        out = bytearray()
+        get = self._lookup
+        escape = self._escape
+        acc, acc_len = self._acc, self._acc_len
+
+        for c in text:
+            pair = get(c)
+            if pair is None:
+                if escape is None:
+                    continue
+                # Only code pairs keyed by character have an ESCAPE code
+                assert isinstance(c, str)
+                # Write the escape code, then the codepoint
+                pair = ((escape[0] << ESCAPE_BITS) | ord(c), escape[1] + ESCAPE_BITS)
+            code, length = pair
+            acc = (acc << length) | code
+            acc_len += length
+
+            if acc_len >= FLUSH_BITS:
+                # Move whole bytes out, keep the partial byte in the accumulator
+                rem = acc_len & 7
+                out += (acc >> rem).to_bytes(acc_len >> 3, "big")
+                acc &= (1 << rem) - 1
+                acc_len = rem
+
+        rem = acc_len & 7
+        out += (acc >> rem).to_bytes(acc_len >> 3, "big")
+        self.bit_len += 8 * len(out) + rem - self._acc_len
+        self._acc = acc & ((1 << rem) - 1)
+        self._acc_len = rem
+        return out
+
+    def flush(self) -> bytearray:
+        """Return the final partial byte, zero-padded, if any bits are pending."""
+        out = bytearray()
+        if self._acc_len:
+            out.append((self._acc << (8 - self._acc_len)) & 0xFF)
+            self._acc = 0
+            self._acc_len = 0
+        return out
@@ -0,0 +1,90 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from zipzap.compressor.decode_table import DecodeTable
+from zipzap.ds.maps.dense_char_map import DenseCharMap
+from zipzap.ds.maps.map import Map
+from zipzap.io.block_table import BlockInfo
+from zipzap.io.mapped_reader import MappedZzReader
+from zipzap.io.reader import ZzReader
+
+_worker_reader: Optional[ZzReader] = None
+_worker_table: Optional[DecodeTable] = None
+_worker_output: Optional[Path] = None
+
+
+def decode_block(reader: ZzReader, table: DecodeTable, block: BlockInfo) -> bytes:
+    """Decode one block of a container to UTF-8 bytes."""
+    text = "".join(table.decode_chunks(reader.read_data(block=block), block.bit_len))
+    data = text.encode("utf-8")
+    if len(text) != block.num_chars or len(data) != block.num_bytes:
+        raise ValueError(f"Block at offset {block.offset} decoded to the wrong length")
+    return data
+
+
+def decode_blocks_to_file(
+    reader: ZzReader,
+    code_lengths: Map[str, int],
+    blocks: list[BlockInfo],
+    output_path: Path,
+    jobs: int = 1,
+) -> None:
+    """Decode every block of a container into output_path as UTF-8 text.
+
+    The output is preallocated from the block table and each block is written at its
+    own offset, so with more than one job blocks are decoded by worker processes that
+    write their results directly.
+    """
+    offsets = []
+    total = 0
+    for block in blocks:
+        offsets.append(total)
+        total += block.num_bytes
+
+    with output_path.open("wb") as f:
+        f.truncate(total)
+
+    if jobs <= 1:
+        table = DecodeTable(code_lengths)
+        with output_path.open("r+b") as f:
+            for block in blocks:
+                f.write(decode_block(reader, table, block))
+        return
+
+    # Workers rebuild the decode table once instead of receiving it per block
+    items = [(char, length) for char, length in code_lengths.entries()]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(reader.file_path, items, output_path),
+    ) as executor:
+        # Only small block descriptors cross process boundaries
+        for future in [
+            executor.submit(_decode_worker_block, block, offset)
+            for block, offset in zip(blocks, offsets)
+        ]:
+            future.result()
+
+
+def _init_worker(
+    input_path: Path, code_length_items: list[tuple[str, int]], output_path: Path
+) -> None:
+    """Open the input and build the decode table of a worker process."""
+    global _worker_reader, _worker_table, _worker_output
+    code_lengths = DenseCharMap[int].from_items(code_length_items, unique=True)
+    _worker_reader = MappedZzReader(input_path)
+    _worker_table = DecodeTable(code_lengths)
+    _worker_output = output_path
+
+
+def _decode_worker_block(block: BlockInfo, offset: int) -> None:
+    """Decode a block and write it at offset in the output file."""
+    assert _worker_reader is not None
+    assert _worker_table is not None
+    assert _worker_output is not None
+    data = decode_block(_worker_reader, _worker_table, block)
+    with _worker_output.open("r+b") as f:
+        f.seek(offset)
+        f.write(data)
@@ -0,0 +1,79 @@
+from functools import partial
+from typing import Iterable, Iterator
+
+from zipzap.compressor.bit_packer import BitPacker
+from zipzap.compressor.codebook import compute_code_pairs
+from zipzap.ds.maps.dense_char_map import DenseCharMap
+from zipzap.ds.maps.map import Map
+from zipzap.utils.pool import map_in_pool
+
+BLOCK_SIZE = 1 << 20  # characters per block
+INDEX_INTERVAL = 1 << 16  # characters between seek index checkpoints
+
+# (encoded data, bit length, decoded chars, decoded UTF-8 bytes, checkpoints)
+EncodedBlock = tuple[bytes, int, int, int, list[int]]
+
+_worker_code_pairs: Map[str, tuple[int, int]] = DenseCharMap()
+
+
+def encode_block(
+    code_pairs: Map[str, tuple[int, int]], text: str, index_interval: int = 0
+) -> EncodedBlock:
+    """Encode text as a standalone block.
+
+    Checkpoints are the bit offsets of every index_interval characters after the start.
+    """
+    packer = BitPacker(code_pairs)
+    checkpoints = []
+
+    if index_interval > 0:
+        data = bytearray()
+        for start in range(0, len(text), index_interval):
+            if start:
+                checkpoints.append(packer.bit_len)
+            data += packer.pack(text[start : start + index_interval])
+    else:
+        data = packer.pack(text)
+    data += packer.flush()
+
+    num_bytes = len(text.encode("utf-8"))
+    return bytes(data), packer.bit_len, len(text), num_bytes, checkpoints
+
+
+def encode_blocks(
+    code_lengths: Map[str, int],
+    blocks: Iterable[str],
+    jobs: int = 1,
+    index_interval: int = 0,
+) -> Iterator[EncodedBlock]:
+    """Encode each block of text independently, in order.
+
+    With more than one job, blocks are encoded in a pool of worker processes.
+    """
+    if jobs <= 1:
+        code_pairs = compute_code_pairs(code_lengths)
+        for text in blocks:
+            yield encode_block(code_pairs, text, index_interval)
+        return
+
+    # Workers rebuild the code table once instead of receiving it per block
+    items = [(char, length) for char, length in code_lengths.entries()]
+    yield from map_in_pool(
+        partial(_encode_worker_block, index_interval=index_interval),
+        blocks,
+        jobs,
+        initializer=_init_worker,
+        initargs=(items,),
+    )
+
+
+def _init_worker(code_length_items: list[tuple[str, int]]) -> None:
+    """Build the code table of a worker process."""
+    global _worker_code_pairs
+    code_lengths = DenseCharMap[int].from_items(code_length_items, unique=True)
+    _worker_code_pairs = compute_code_pairs(code_lengths)
+
+
+def _encode_worker_block(text: str, index_interval: int) -> EncodedBlock:
+    """Encode a block with the code table of the worker process."""
+    return encode_block(_worker_code_pairs, text, index_interval)
@@ -1,11 +1,22 @@
+from typing import NamedTuple, Optional
+
 from zipzap.compressor.huffman_tree import HuffmanTree
+from zipzap.ds.maps.dense_char_map import DenseCharMap
 from zipzap.ds.maps.map import Map
-from zipzap.ds.maps.probe_hashmap import ProbeHashmap
+
+
+class PackageItem(NamedTuple):
+    """An item of package-merge: a leaf, or a package of two cheaper items."""
+
+    weight: int
+    leaf: int  # index of the leaf, -1 for a package
+    first: Optional["PackageItem"] = None
+    second: Optional["PackageItem"] = None
 
 
 def compute_code_lengths(tree: HuffmanTree) -> Map[str, int]:
     """Return a map of character to code length."""
-    code_lengths = ProbeHashmap[str, int]()
+    code_lengths = DenseCharMap[int]()
 
     def dfs(node, depth):
         if node.element().char is not None:
@@ -18,3 +29,112 @@ def compute_code_lengths(tree: HuffmanTree) -> Map[str, int]:
         dfs(tree.root(), 0)
 
     return code_lengths
+
+
+def compute_code_lengths_from_freqs(freq_table: Map[str, int]) -> Map[str, int]:
+    """Return optimal code lengths without building a tree.
+
+    Sorts the frequencies once, then runs the in-place algorithm of Moffat and
+    Katajainen, which takes linear time on the sorted array.
+    """
+    # Sort symbols by (frequency, then character)
+    leaves = sorted((freq, char) for char, freq in freq_table.entries())
+    n = len(leaves)
+
+    if n <= 1:
+        # A lone symbol sits at the root, like in the Huffman tree
+        return DenseCharMap[int].from_items(((char, 0) for _, char in leaves))
+
+    a = [freq for freq, _ in leaves]
+
+    # Phase 1: merge the two cheapest items, replacing the weights of merged
+    # internal nodes with the index of their parent
+    a[0] += a[1]
+    root = 0  # next internal node to merge
+    leaf = 2  # next leaf to merge
+    for node in range(1, n - 1):
+        if leaf >= n or a[root] < a[leaf]:
+            a[node] = a[root]
+            a[root] = node
+            root += 1
+        else:
+            a[node] = a[leaf]
+            leaf += 1
+        if leaf >= n or (root < node and a[root] < a[leaf]):
+            a[node] += a[root]
+            a[root] = node
+            root += 1
+        else:
+            a[node] += a[leaf]
+            leaf += 1
+
+    # Phase 2: turn parent indices into internal node depths
+    a[n - 2] = 0
+    for node in range(n - 3, -1, -1):
+        a[node] = a[a[node]] + 1
+
+    # Phase 3: turn internal node depths into leaf depths, most frequent first
+    avail = 1
+    depth = 0
+    root = n - 2
+    node = n - 1
+    while avail > 0:
+        used = 0
+        while root >= 0 and a[root] == depth:
+            used += 1
+            root -= 1
+        while avail > used:
+            a[node] = depth
+            node -= 1
+            avail -= 1
+        avail = 2 * used
+        depth += 1
+
+    return DenseCharMap[int].from_items(
+        ((char, length) for (_, char), length in zip(leaves, a)), unique=True
+    )
+
+
+def compute_limited_code_lengths(
+    freq_table: Map[str, int], max_len: int
+) -> Map[str, int]:
+    """Return optimal code lengths of at most max_len bits using package-merge."""
+    # Sort symbols by (frequency, then character)
+    leaves = sorted((freq, char) for char, freq in freq_table.entries())
+    n = len(leaves)
+
+    if n <= 1:
+        # A lone symbol sits at the root, like in the Huffman tree
+        return DenseCharMap[int].from_items(((char, 0) for _, char in leaves))
+    if max_len < 1 or (1 << max_len) < n:
+        raise ValueError(f"{n} characters do not fit in codes of {max_len} bits")
+
+    leaf_items = [PackageItem(freq, i) for i, (freq, _) in enumerate(leaves)]
+    items = leaf_items
+
+    # Package adjacent pairs of items and merge them back with the leaves,
+    # once per bit of code length allowed beyond the first
+    for _ in range(max_len - 1):
+        packages = [
+            PackageItem(
+                items[k].weight + items[k + 1].weight, -1, items[k], items[k + 1]
+            )
+            for k in range(0, len(items) - 1, 2)
+        ]
+        # Stable sort keeps leaves before packages of equal weight
+        items = sorted(leaf_items + packages, key=lambda item: item.weight)
+
+    # The code length of a symbol is how often its leaf is among the cheapest 2n - 2
+    counts = [0] * n
+    stack = items[: 2 * n - 2]
+    while stack:
+        item = stack.pop()
+        if item.first is None or item.second is None:
+            counts[item.leaf] += 1
+        else:
+            stack.append(item.first)
+            stack.append(item.second)
+
+    return DenseCharMap[int].from_items(
+        ((char, length) for (_, char), length in zip(leaves, counts)), unique=True
+    )
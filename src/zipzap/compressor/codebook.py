@@ -1,26 +1,70 @@
+from typing import Optional
+
 from zipzap.ds.bits.bit_stream import BitStream
+from zipzap.ds.maps.dense_char_map import DenseCharMap
 from zipzap.ds.maps.map import Map
-from zipzap.ds.maps.probe_hashmap import ProbeHashmap
 
+# Codes built from a sample may meet characters the sample did not have. These are
+# written as the escape code followed by their codepoint in ESCAPE_BITS bits. The
+# escape is a lone surrogate, which decoded text never contains.
+ESCAPE = "\udfff"  # symbol marking an escaped character
+ESCAPE_BITS = 21  # bits of an escaped codepoint
 
-def compute_codebook(code_lengths: Map[str, int]) -> Map[str, BitStream]:
-    """Return canonical Huffman codes as BitStream given code lengths."""
+
+def compute_canonical_codes(code_lengths: Map[str, int]) -> list[tuple[str, int, int]]:
+    """Return canonical Huffman codes as (char, code, bit length) in canonical order."""
     # Sort symbols by (length, then character)
     sorted_symbols = sorted(code_lengths.entries(), key=lambda x: (x.value, x.key))
 
-    codes = ProbeHashmap[str, BitStream]()
+    codes = []
     code = 0
     prev_len = 0
 
     for char, length in sorted_symbols:
         # Shift left if length increased
         code <<= length - prev_len
-        # Convert code integer to binary string, pad with zeros to match length
-        code_bits = format(code, f"0{length}b")
-        # Store as BitStream
-        codes.put(char, BitStream(code_bits))
+        # A lone symbol has length 0 but is still written as a single bit
+        codes.append((char, code, max(length, 1)))
         # Increment code for next symbol
         code += 1
         prev_len = length
 
     return codes
+
+
+def compute_codebook(code_lengths: Map[str, int]) -> Map[str, BitStream]:
+    """Return canonical Huffman codes as BitStream given code lengths."""
+    # Store each code integer as a BitStream of exactly length bits
+    return DenseCharMap[BitStream].from_items(
+        (
+            (char, BitStream().append_bits(code, length))
+            for char, code, length in compute_canonical_codes(code_lengths)
+        ),
+        unique=True,
+    )
+
+
+def compute_code_pairs(code_lengths: Map[str, int]) -> Map[str, tuple[int, int]]:
+    """Return canonical Huffman codes as (code, bit length) pairs given code lengths."""
+    return DenseCharMap[tuple[int, int]].from_items(
+        (
+            (char, (code, length))
+            for char, code, length in compute_canonical_codes(code_lengths)
+        ),
+        unique=True,
+    )
+
+
+def compute_byte_code_pairs(
+    code_lengths: Map[str, int],
+) -> list[Optional[tuple[int, int]]]:
+    """Return (code, bit length) pairs in a flat array indexed by byte value.
+
+    Symbols are bytes as Latin-1 characters; bytes without a code map to None.
+    """
+    pairs: list[Optional[tuple[int, int]]] = [None] * 256
+
+    for char, code, length in compute_canonical_codes(code_lengths):
+        pairs[ord(char)] = (code, length)
+
+    return pairs
@@ -0,0 +1,162 @@
+from typing import Any, Iterable, Iterator, Optional
+
+from zipzap.compressor.codebook import ESCAPE, ESCAPE_BITS, compute_canonical_codes
+from zipzap.ds.maps.map import Map
+
+PRIMARY_BITS = 9  # bits resolved by the first table lookup
+SINGLE_LEVEL_BITS = 12  # longest codes resolved by one table without subtables
+REFILL_BYTES = 8  # bytes pulled into the bit buffer at a time
+
+# A table slot is (char, length) for a code that ends within the table,
+# (None, 0) for a bit pattern no code starts with,
+# or (subtable, -bits) for longer codes continuing in a subtable indexed by the next bits.
+Slot = tuple[Any, int]
+
+
+class DecodeTable:
+    """Multi-level lookup table resolving one canonical Huffman code per lookup."""
+
+    def __init__(self, code_lengths: Map[str, int], primary_bits: Optional[int] = None):
+        """Build the table, with primary_bits chosen from the code lengths by default.
+
+        Codes of up to SINGLE_LEVEL_BITS bits, e.g. from a length-limited code, get a
+        single table; longer codes get a PRIMARY_BITS table with subtables.
+        """
+        codes = compute_canonical_codes(code_lengths)
+        self.max_len = max((length for _, _, length in codes), default=0)
+        # Bits an escaped character takes, 0 if there is no escape code
+        self.escape_len = next(
+            (length + ESCAPE_BITS for char, _, length in codes if char == ESCAPE), 0
+        )
+
+        if primary_bits is None:
+            single_level = self.max_len <= SINGLE_LEVEL_BITS
+            primary_bits = self.max_len if single_level else PRIMARY_BITS
+        elif primary_bits <= 0:
+            raise ValueError("Primary bits must be positive")
+
+        self.bits = min(primary_bits, self.max_len)
+        self.table = self._build(codes, 0, self.bits, primary_bits)
+
+    @staticmethod
+    def _build(
+        codes: list[tuple[str, int, int]], depth: int, bits: int, max_bits: int
+    ) -> list[Slot]:
+        """Build the table for codes sharing their first depth bits."""
+        table: list[Slot] = [(None, 0)] * (1 << bits)
+        end = depth + bits
+        groups: list[tuple[int, list[tuple[str, int, int]]]] = []
+
+        for char, code, length in codes:
+            if length <= end:
+                # Fill every slot whose leading bits are this code
+                rel = code & ((1 << (length - depth)) - 1)
+                span = 1 << (end - length)
+                start = rel << (end - length)
+                table[start : start + span] = [(char, length)] * span
+            else:
+                # Canonical codes are sorted, so codes sharing a prefix are adjacent
+                prefix = (code >> (length - end)) & ((1 << bits) - 1)
+                if not groups or groups[-1][0] != prefix:
+                    groups.append((prefix, []))
+                groups[-1][1].append((char, code, length))
+
+        for prefix, group in groups:
+            sub_bits = min(max(length for _, _, length in group) - end, max_bits)
+            table[prefix] = (
+                DecodeTable._build(group, end, sub_bits, max_bits),
+                -sub_bits,
+            )
+
+        return table
+
+    def decode(self, data: bytes | bytearray | memoryview, bit_len: int) -> str:
+        """Decode the first bit_len bits of data (MSB first) to text."""
+        return "".join(self.decode_chunks([data], bit_len))
+
+    def decode_chunks(
+        self,
+        chunks: Iterable[bytes | bytearray | memoryview],
+        bit_len: int,
+        skip_bits: int = 0,
+    ) -> Iterator[str]:
+        """Decode bit_len bits split across chunks, yielding the text of each chunk.
+
+        Codes may straddle chunk boundaries; their leading bits are carried over.
+        The first skip_bits bits (less than a byte) of the first chunk are ignored.
+        """
+        if not 0 <= skip_bits < 8:
+            raise ValueError("Skipped bits must be within the first byte")
+
+        table, bits = self.table, self.bits
+        has_escape = self.escape_len > 0
+        refill = max(self.max_len, self.escape_len, 1)
+
+        buf = 0  # unconsumed bits, right-aligned
+        buf_len = 0
+        bytes_left = (skip_bits + bit_len + 7) // 8  # bytes still to pull into buf
+        remaining = bit_len  # bits still to decode
+
+        for data in chunks:
+            chars: list[str] = []
+            append = chars.append
+            end = min(len(data), bytes_left)
+            bytes_left -= end
+            pos = 0  # next byte of the chunk to pull into buf
+
+            while remaining > 0:
+                # Keep enough bits buffered to resolve the longest code
+                while buf_len < refill and pos < end:
+                    chunk = data[pos : min(pos + REFILL_BYTES, end)]
+                    buf = (buf << (8 * len(chunk))) | int.from_bytes(chunk, "big")
+                    buf_len += 8 * len(chunk)
+                    pos += len(chunk)
+                    if skip_bits:
+                        buf_len -= skip_bits
+                        buf &= (1 << buf_len) - 1
+                        skip_bits = 0
+
+                # Wait for the next chunk unless every remaining bit is buffered
+                if buf_len < refill and buf_len < remaining:
+                    break
+
+                # Peek the next bits, zero-padding past the end of the data
+                if buf_len >= bits:
+                    idx = (buf >> (buf_len - bits)) & ((1 << bits) - 1)
+                else:
+                    idx = (buf << (bits - buf_len)) & ((1 << bits) - 1)
+                entry, length = table[idx]
+
+                # Follow subtables for codes longer than the primary table
+                depth = bits
+                while length < 0:
+                    sub_bits = -length
+                    depth += sub_bits
+                    if buf_len >= depth:
+                        idx = (buf >> (buf_len - depth)) & ((1 << sub_bits) - 1)
+                    else:
+                        idx = (buf << (depth - buf_len)) & ((1 << sub_bits) - 1)
+                    entry, length = entry[idx]
+
+                if has_escape and entry == ESCAPE:
+                    # The codepoint of a character without a code follows
+                    length += ESCAPE_BITS
+                    if length <= remaining:
+                        entry = chr(
+                            (buf >> (buf_len - length)) & ((1 << ESCAPE_BITS) - 1)
+                        )
+
+                if length == 0 or length > remaining:
+                    raise ValueError(
+                        "Encoded bitstream has leftover bits that do not match any code"
+                    )
+
+                append(entry)
+                buf_len -= length
+                buf &= (1 << buf_len) - 1
+                remaining -= length
+
+            yield "".join(chars)
+
+        if remaining > 0:
+            raise ValueError("Encoded data ended before its declared bit length")
@@ -0,0 +1,166 @@
+import math
+from pathlib import Path
+from typing import Optional
+
+from zipzap.compressor.freq_counter import ByteFreqCounter, FreqCounter
+from zipzap.compressor.huffman_coder import (
+    BaseHuffmanEncoder,
+    ByteHuffmanEncoder,
+    HuffmanEncoder,
+)
+from zipzap.ds.maps.dense_char_map import DenseCharMap
+from zipzap.ds.maps.map import Map
+from zipzap.io.chunks import read_byte_chunks, read_text_chunks, sample_rate
+from zipzap.io.writer import ZzWriter
+
+
+class SizeEstimate:
+    """Sizes of the .zz file zip would write, computed without encoding."""
+
+    __slots__ = (
+        "input_size",
+        "num_chars",
+        "num_bytes",
+        "header_size",
+        "payload_size",
+        "entropy_bits",
+        "stored",
+        "sample_rate",
+    )
+
+    def __init__(
+        self,
+        input_size: int,
+        num_chars: int,
+        num_bytes: int,
+        header_size: int,
+        payload_size: int,
+        entropy_bits: float,
+        stored: bool = False,
+        sample_rate: Optional[float] = None,
+    ):
+        self.input_size = input_size  # bytes of the input file
+        self.num_chars = num_chars  # symbols coded, characters or bytes
+        self.num_bytes = num_bytes  # UTF-8 bytes (or raw bytes) coded
+        self.header_size = header_size  # bytes ahead of the data
+        self.payload_size = payload_size  # bytes of encoded (or stored) data
+        self.entropy_bits = entropy_bits  # Shannon lower bound of the payload
+        self.stored = stored  # whether the input would be stored as is
+        self.sample_rate = sample_rate  # fraction of the input counted, None if all
+
+    @property
+    def total_size(self) -> int:
+        """Return the bytes of the whole .zz file."""
+        return self.header_size + self.payload_size
+
+    @property
+    def ratio(self) -> float:
+        """Return the compressed size over the input size."""
+        return self.total_size / self.input_size if self.input_size else 1.0
+
+    @property
+    def entropy_per_char(self) -> float:
+        """Return the entropy in bits per symbol."""
+        return self.entropy_bits / self.num_chars if self.num_chars else 0.0
+
+
+def entropy_bits(freq_table: Map[str, int]) -> float:
+    """Return the Shannon entropy of the counted text in bits, over all symbols."""
+    total = sum(freq_table.values())
+    return sum(
+        freq * math.log2(total / freq) for freq in freq_table.values() if freq > 0
+    )
+
+
+def estimate_encoder(
+    encoder: BaseHuffmanEncoder,
+    input_size: Optional[int] = None,
+    sample_rate: Optional[float] = None,
+) -> SizeEstimate:
+    """Return the sizes of the plain .zz file encoder would write for its counts.
+
+    Exact, since the code lengths and frequencies fix the payload, and the input
+    is stored as is when coding would not shrink it. The input size defaults to
+    the UTF-8 bytes counted.
+    """
+    num_chars, num_bytes = encoder.decoded_lengths()
+    bit_len = encoder.encoded_bit_len()
+
+    coded_header = ZzWriter.header_size(
+        encoder.code_lengths, bit_len, num_chars, num_bytes
+    )
+    coded_payload = (bit_len + 7) // 8
+    stored_header = ZzWriter.header_size(
+        DenseCharMap[int](), 8 * num_bytes, num_chars, num_bytes
+    )
+    stored = coded_header + coded_payload >= stored_header + num_bytes
+
+    return SizeEstimate(
+        num_bytes if input_size is None else input_size,
+        num_chars,
+        num_bytes,
+        stored_header if stored else coded_header,
+        num_bytes if stored else coded_payload,
+        entropy_bits(encoder.freq_table),
+        stored,
+        sample_rate,
+    )
+
+
+def should_store(encoder: BaseHuffmanEncoder) -> bool:
+    """Return whether storing the input verbatim takes no more space than coding it."""
+    return estimate_encoder(encoder).stored
+
+
+def estimate_file(
+    file_path: str | Path,
+    is_bytes: bool = False,
+    rate: Optional[float] = None,
+    jobs: int = 1,
+    max_code_len: Optional[int] = None,
+    budget: Optional[int] = None,
+) -> SizeEstimate:
+    """Return the sizes zip would compress a file to, counting it in a single pass.
+
+    The sizes are those of the plain layout, written without block options; jobs
+    only counts the file in that many processes.
+
+    With a sample rate (or byte budget), only chunks spread evenly over that part
+    of the file are counted and scaled up, so the sizes are estimates.
+    """
+    path = Path(file_path)
+    input_size = path.stat().st_size
+    encoder: BaseHuffmanEncoder
+
+    if rate is None and budget is None:
+        if is_bytes:
+            counter = ByteFreqCounter.from_chunks(read_byte_chunks(path), jobs)
+            encoder = ByteHuffmanEncoder(counter=counter, max_code_len=max_code_len)
+        else:
+            freq_table = FreqCounter.from_chunks(read_text_chunks(path), jobs)
+            encoder = HuffmanEncoder(freq_table=freq_table, max_code_len=max_code_len)
+        return estimate_encoder(encoder, input_size)
+
+    rate = sample_rate(path, rate, budget)
+    if is_bytes:
+        counter = ByteFreqCounter.from_sample(path, rate, jobs=jobs)
+        scale = input_size / max(counter.total(), 1)
+        counter.counts = [_scale_count(count, scale) for count in counter.counts]
+        encoder = ByteHuffmanEncoder(counter=counter, max_code_len=max_code_len)
+    else:
+        sampled = FreqCounter.from_sample(path, rate, jobs=jobs)
+        sampled_bytes = sum(
+            freq * len(char.encode("utf-8")) for char, freq in sampled.entries()
+        )
+        scale = input_size / max(sampled_bytes, 1)
+        scaled = DenseCharMap[int].from_items(
+            ((char, _scale_count(count, scale)) for char, count in sampled.entries()),
+            unique=True,
+        )
+        encoder = HuffmanEncoder(freq_table=scaled, max_code_len=max_code_len)
+    return estimate_encoder(encoder, input_size, rate)
+
+
+def _scale_count(count: int, scale: float) -> int:
+    """Scale a sampled count up to the whole input, keeping seen symbols."""
+    return max(round(count * scale), 1) if count else 0
@@ -1,11 +1,136 @@
-from zipzap.ds.maps.probe_hashmap import ProbeHashmap
+from collections import Counter
+from pathlib import Path
+from typing import Iterable, Optional
 
+from zipzap.compressor import accel
+from zipzap.ds.maps.dense_char_map import DenseCharMap
+from zipzap.ds.maps.map import Map
+from zipzap.io.chunks import read_sampled_chunks, read_sampled_text_chunks, sample_rate
+from zipzap.utils.pool import map_in_pool
 
-class FreqCounter(ProbeHashmap[str, int]):
+NUM_BYTE_VALUES = 256
+
+
+class FreqCounter(DenseCharMap[int]):
     """Counts the frequency of each character in a string. Maps characters to their frequency."""
 
-    def __init__(self, text: str):
-        super().__init__(256)
-        for c in text:
-            current = self.get(c) or 0
-            self.put(c, current + 1)
+    def __init__(self, text: str = ""):
+        super().__init__()
+        self.update(text)
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[str], jobs: int = 1) -> "FreqCounter":
+        """Count the characters of a stream of chunks.
+
+        With more than one job, chunks are counted in a pool of worker processes and
+        their partial counts are merged as they arrive.
+        """
+        counter = cls()
+        for counts in _count_chunks(chunks, jobs):
+            counter._add_counts(counts)
+        return counter
+
+    @classmethod
+    def from_sample(
+        cls,
+        file_path: str | Path,
+        rate: Optional[float] = None,
+        budget: Optional[int] = None,
+        jobs: int = 1,
+    ) -> "FreqCounter":
+        """Count the characters of a sample of a UTF-8 file.
+
+        The sample is rate of the file, or about budget bytes, read in chunks spread
+        evenly over it. Counts are those of the sample, not scaled to the file.
+        """
+        rate = sample_rate(file_path, rate, budget)
+        return cls.from_chunks(read_sampled_text_chunks(file_path, rate), jobs)
+
+    def update(self, text: str) -> None:
+        """Add the character counts of text, e.g. the next chunk of a stream."""
+        # Characters are tallied in C, leaving one put per distinct character
+        self._add_counts(_tally(text))
+
+    def merge(self, other: Map[str, int]) -> None:
+        """Add the counts of another frequency table."""
+        self._add_counts((entry.key, entry.value) for entry in other.entries())
+
+    def _add_counts(self, counts: Iterable[tuple[str, int]]) -> None:
+        """Add (character, count) pairs."""
+        for c, count in counts:
+            self.put(c, (self.get(c) or 0) + count)
+
+
+class ByteFreqCounter:
+    """Counts the frequency of each byte value in a flat array indexed by byte."""
+
+    __slots__ = ("counts",)
+
+    def __init__(self, data: bytes | bytearray | memoryview = b""):
+        self.counts = [0] * NUM_BYTE_VALUES
+        self.update(data)
+
+    @classmethod
+    def from_chunks(
+        cls, chunks: Iterable[bytes | bytearray | memoryview], jobs: int = 1
+    ) -> "ByteFreqCounter":
+        """Count the bytes of a stream of chunks, in worker processes if jobs > 1."""
+        counter = cls()
+        for counts in _count_chunks(chunks, jobs):
+            counter._add_counts(counts)
+        return counter
+
+    @classmethod
+    def from_sample(
+        cls,
+        file_path: str | Path,
+        rate: Optional[float] = None,
+        budget: Optional[int] = None,
+        jobs: int = 1,
+    ) -> "ByteFreqCounter":
+        """Count the bytes of a sample of a file, like FreqCounter.from_sample."""
+        rate = sample_rate(file_path, rate, budget)
+        return cls.from_chunks(read_sampled_chunks(file_path, rate), jobs)
+
+    def update(self, data: bytes | bytearray | memoryview) -> None:
+        """Add the byte counts of data, e.g. the next chunk of a stream."""
+        # Bytes are tallied in C, leaving at most 256 additions here
+        self._add_counts(_tally(data))
+
+    def merge(self, other: "ByteFreqCounter") -> None:
+        """Add the counts of another byte counter."""
+        self._add_counts(enumerate(other.counts))
+
+    def _add_counts(self, counts: Iterable[tuple[int, int]]) -> None:
+        """Add (byte value, count) pairs."""
+        totals = self.counts
+        for value, count in counts:
+            totals[value] += count
+
+    def total(self) -> int:
+        """Return the number of bytes counted."""
+        return sum(self.counts)
+
+    def to_freq_table(self) -> Map[str, int]:
+        """Return the counts of bytes seen, keyed by their Latin-1 character."""
+        return DenseCharMap[int].from_items(
+            ((chr(value), count) for value, count in enumerate(self.counts) if count),
+            unique=True,
+        )
+
+
+def _count_chunks(chunks: Iterable, jobs: int) -> Iterable[list[tuple]]:
+    """Yield the (symbol, count) pairs of each chunk, in order."""
+    if jobs <= 1:
+        for chunk in chunks:
+            yield _tally(chunk)
+        return
+
+    yield from map_in_pool(_tally, chunks, jobs)
+
+
+def _tally(chunk: str | bytes | bytearray | memoryview) -> list[tuple]:
+    """Return the (symbol, count) pairs of a chunk, with NumPy for long chunks."""
+    if accel.is_enabled() and len(chunk) >= accel.MIN_ACCEL_SIZE:
+        return accel.count_symbols(chunk)
+    return list(Counter(chunk).items())
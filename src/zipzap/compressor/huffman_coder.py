@@ -1,28 +1,178 @@
-from zipzap.compressor.code_lengths import compute_code_lengths
-from zipzap.compressor.codebook import compute_codebook
-from zipzap.compressor.freq_counter import FreqCounter
-from zipzap.compressor.huffman_tree import HuffmanTreeBuilder
+from typing import Iterable, Iterator, Optional
+
+from zipzap.compressor.bit_packer import BitPacker
+from zipzap.compressor.code_lengths import (
+    compute_code_lengths_from_freqs,
+    compute_limited_code_lengths,
+)
+from zipzap.compressor.codebook import (
+    ESCAPE,
+    compute_byte_code_pairs,
+    compute_code_pairs,
+    compute_codebook,
+)
+from zipzap.compressor.decode_table import DecodeTable
+from zipzap.compressor.freq_counter import ByteFreqCounter, FreqCounter
+from zipzap.compressor.huffman_tree import HuffmanTree, HuffmanTreeBuilder
 from zipzap.ds.bits.bit_stream import BitStream
+from zipzap.ds.maps.dense_char_map import DenseCharMap
 from zipzap.ds.maps.map import Map
-from zipzap.ds.maps.probe_hashmap import ProbeHashmap
 
 
-class HuffmanEncoder:
+class BaseHuffmanEncoder:
+    """Builds the Huffman code of a frequency table, shared by the encoders.
+
+    Subclasses add encode and encode_chunks for their type of input.
+    """
+
+    def __init__(self, freq_table: Map[str, int], max_code_len: Optional[int] = None):
+        """Build the code of freq_table.
+
+        If max_code_len is given, no code is longer than max_code_len bits.
+        """
+        self.freq_table = freq_table
+        self._tree: Optional[HuffmanTree] = None
+        self.code_lengths = compute_code_lengths_from_freqs(self.freq_table)
+        if max_code_len is not None and (
+            max(self.code_lengths.values(), default=0) > max_code_len
+        ):
+            self.code_lengths = compute_limited_code_lengths(
+                self.freq_table, max_code_len
+            )
+        self.codebook = compute_codebook(self.code_lengths)
+        self.code_pairs = compute_code_pairs(self.code_lengths)
+        # (bits, characters, bytes) of the last encode_chunks, once it is done
+        self.encoded_lengths: Optional[tuple[int, int, int]] = None
+
+    @property
+    def tree(self) -> HuffmanTree:
+        """Return the tree of the code, built on first use since coding does not need it.
+
+        Its leaves sit at the depths of code_lengths, even when these are limited.
+        """
+        if self._tree is None:
+            self._tree = HuffmanTreeBuilder.from_code_lengths(
+                self.code_lengths, self.freq_table
+            )
+        return self._tree
+
+    def encoded_bit_len(self) -> int:
+        """Return the number of bits encoding the counted input takes."""
+        total = 0
+        for char, freq in self.freq_table.entries():
+            pair = self.code_pairs.get(char)
+            if pair is not None:
+                total += freq * pair[1]
+        return total
+
+    def decoded_lengths(self) -> tuple[int, int]:
+        """Return the length of the counted text in characters and in UTF-8 bytes."""
+        num_chars = num_bytes = 0
+        for char, freq in self.freq_table.entries():
+            if char == ESCAPE:
+                continue
+            num_chars += freq
+            num_bytes += freq * len(char.encode("utf-8"))
+        return num_chars, num_bytes
+
+
+class HuffmanEncoder(BaseHuffmanEncoder):
     """Encodes text to Huffman-encoded data."""
 
-    def __init__(self, text: str):
+    def __init__(
+        self,
+        text: str = "",
+        freq_table: Optional[Map[str, int]] = None,
+        max_code_len: Optional[int] = None,
+        escape: bool = False,
+    ):
+        """Build the code from text, or from a precomputed freq_table if given.
+
+        If max_code_len is given, no code is longer than max_code_len bits. If escape,
+        e.g. for a freq_table counted on a sample, an ESCAPE code is added for any
+        character the table lacks.
+        """
         self.text = text
-        self.freq_table = FreqCounter(text)
-        self.tree = HuffmanTreeBuilder.from_freq_table(self.freq_table)
-        self.code_lengths = compute_code_lengths(self.tree)
-        self.codebook = compute_codebook(self.code_lengths)
+        if freq_table is None:
+            freq_table = FreqCounter(text)
+        if escape:
+            freq_table = _with_escape(freq_table)
+        super().__init__(freq_table, max_code_len)
 
     def encode(self, text: str) -> BitStream:
-        bits = BitStream()
-        for c in text:
-            if code := self.codebook.get(c):
-                bits.extend(code)
-        return bits
+        packer = BitPacker(self.code_pairs)
+        data = packer.pack(text)
+        data += packer.flush()
+        return BitStream.from_bytearray(data, packer.bit_len)
+
+    def encode_chunks(self, chunks: Iterable[str]) -> Iterator[bytearray]:
+        """Encode text chunk by chunk, yielding packed bytes as they complete.
+
+        Once all is encoded, encoded_lengths holds the bits, characters and UTF-8
+        bytes encoded.
+        """
+        packer = BitPacker(self.code_pairs)
+        num_chars = num_bytes = 0
+        for chunk in chunks:
+            num_chars += len(chunk)
+            num_bytes += len(chunk.encode("utf-8"))
+            yield packer.pack(chunk)
+        yield packer.flush()
+        self.encoded_lengths = (packer.bit_len, num_chars, num_bytes)
+
+
+class ByteHuffmanEncoder(BaseHuffmanEncoder):
+    """Encodes arbitrary bytes to Huffman-encoded data, one symbol per byte value.
+
+    Symbols are keyed by their Latin-1 character in code_lengths and codebook, while
+    encoding looks codes up in a flat array indexed by byte.
+    """
+
+    def __init__(
+        self,
+        data: bytes | bytearray | memoryview = b"",
+        counter: Optional[ByteFreqCounter] = None,
+        max_code_len: Optional[int] = None,
+        escape: bool = False,
+    ):
+        """Build the code from data, or from a precomputed counter if given.
+
+        If escape, byte values the counter has not seen get codes too, as there are
+        few enough of them not to need an ESCAPE code.
+        """
+        self.counter = ByteFreqCounter(data) if counter is None else counter
+        if escape:
+            smoothed = ByteFreqCounter()
+            smoothed.counts = [count or 1 for count in self.counter.counts]
+            self.counter = smoothed
+        super().__init__(self.counter.to_freq_table(), max_code_len)
+        self.byte_pairs = compute_byte_code_pairs(self.code_lengths)
+
+    def decoded_lengths(self) -> tuple[int, int]:
+        """Return the number of bytes counted, as both characters and bytes."""
+        total = self.counter.total()
+        return total, total
+
+    def encode(self, data: bytes | bytearray | memoryview) -> BitStream:
+        packer = BitPacker(self.byte_pairs)
+        out = packer.pack(data)
+        out += packer.flush()
+        return BitStream.from_bytearray(out, packer.bit_len)
+
+    def encode_chunks(
+        self, chunks: Iterable[bytes | bytearray | memoryview]
+    ) -> Iterator[bytearray]:
+        """Encode data chunk by chunk, yielding packed bytes as they complete.
+
+        Once all is encoded, encoded_lengths holds the bits and bytes encoded.
+        """
+        packer = BitPacker(self.byte_pairs)
+        num_bytes = 0
+        for chunk in chunks:
+            num_bytes += len(chunk)
+            yield packer.pack(chunk)
+        yield packer.flush()
+        self.encoded_lengths = (packer.bit_len, num_bytes, num_bytes)
 
 
 class HuffmanDecoder:
@@ -31,23 +181,38 @@ class HuffmanDecoder:
     def __init__(self, code_lengths: Map[str, int]):
         self.code_lengths = code_lengths
         self.codebook = compute_codebook(code_lengths)
-        self.inverse_codebook = ProbeHashmap[BitStream, str]()
-        for char, code in self.codebook.entries():
-            self.inverse_codebook.put(code, char)
+        self.table = DecodeTable(code_lengths)
 
     def decode(self, encoded: BitStream) -> str:
-        result = []
-        acc = BitStream()  # accumulate bits
-
-        for bit in encoded:
-            acc.append(bit)
-            if char := self.inverse_codebook.get(acc):
-                result.append(char)
-                acc = BitStream()  # reset accumulator
-
-        if len(acc) > 0:
-            raise ValueError(
-                "Encoded bitstream has leftover bits that do not match any code"
-            )
+        return self.table.decode(encoded.to_memoryview(), len(encoded))
+
+    def decode_stream(
+        self,
+        chunks: Iterable[bytes | bytearray | memoryview],
+        bit_len: int,
+        skip_bits: int = 0,
+    ) -> Iterator[str]:
+        """Decode bit_len bits read chunk by chunk, yielding text as it is decoded."""
+        return self.table.decode_chunks(chunks, bit_len, skip_bits)
+
+    def decode_byte_stream(
+        self, chunks: Iterable[bytes | bytearray | memoryview], bit_len: int
+    ) -> Iterator[bytes]:
+        """Decode bit_len bits of a byte mode file, yielding bytes as they are decoded."""
+        for text in self.table.decode_chunks(chunks, bit_len):
+            yield text.encode("latin-1")
+
+
+def _with_escape(freq_table: Map[str, int]) -> Map[str, int]:
+    """Return a copy of freq_table with ESCAPE added.
 
-        return "".join(result)
+    Its frequency is the number of characters seen once, the Good-Turing estimate
+    of how often characters not seen at all occur.
+    """
+    escaped = DenseCharMap[int]()
+    singletons = 0
+    for char, freq in freq_table.entries():
+        escaped.put(char, freq)
+        singletons += freq == 1
+    escaped.put(ESCAPE, max(singletons, 1))
+    return escaped
@@ -1,5 +1,6 @@
 from typing import Optional
 
+from zipzap.compressor.codebook import compute_canonical_codes
 from zipzap.compressor.freq_counter import FreqCounter
 from zipzap.ds.maps.map import Map
 from zipzap.ds.priority_queues.heap_priority_queue import HeapPriorityQueue
@@ -42,6 +43,42 @@ class HuffmanTreeBuilder:
 
         return HuffmanTreeBuilder.from_nodes(nodes)
 
+    @staticmethod
+    def from_code_lengths(
+        code_lengths: Map[str, int], freq_table: Map[str, int]
+    ) -> HuffmanTree:
+        """Build the HuffmanTree of the canonical code given by code_lengths.
+
+        Unlike from_freq_table, which may break ties differently, every leaf sits at
+        the depth of its code as written (a lone symbol takes one bit), with 0 bits
+        on the left. Leaves hold their frequency in freq_table and internal nodes
+        the sum of their leaves.
+        """
+        tree = HuffmanTree()
+        codes = list(compute_canonical_codes(code_lengths))
+        if not codes:
+            return tree
+
+        root = tree.add_root(HuffmanNode(0))
+        for char, code, length in codes:
+            freq = freq_table.get(char) or 0
+            root.element().freq += freq
+
+            # Follow the code from the root, adding the nodes it is missing
+            pos = root
+            for shift in range(length - 1, -1, -1):
+                bit = (code >> shift) & 1
+                child = tree.right(pos) if bit else tree.left(pos)
+                if child is None:
+                    node = HuffmanNode(0, None if shift else char)
+                    child = (
+                        tree.add_right(pos, node) if bit else tree.add_left(pos, node)
+                    )
+                child.element().freq += freq
+                pos = child
+
+        return tree
+
     @staticmethod
     def from_nodes(nodes: list[HuffmanNode]) -> HuffmanTree:
         """Build HuffmanTree from list of nodes."""
@@ -0,0 +1,84 @@
+from typing import Iterable, Optional
+
+from zipzap.compressor.decode_table import DecodeTable
+from zipzap.io.reader import ZzReader
+
+RANGE_CHUNK_SIZE = 1 << 12  # bytes read at a time, as ranges are usually short
+
+
+def decode_range(reader: ZzReader, start: int, end: Optional[int] = None) -> str:
+    """Return characters start to end (exclusive) of a .zz file.
+
+    Decoding starts at the nearest seek index checkpoint before start and stops once
+    end is reached. Without a seek index, blocks (or plain files) are decoded from
+    their beginning. Stored files are simply sliced.
+    """
+    if start < 0 or (end is not None and end < start):
+        raise ValueError(f"Invalid range: {start}:{end}")
+
+    header = reader.read_header_info()
+    if header.is_stored:
+        data = b"".join(reader.read_data())
+        return data.decode("latin-1" if header.is_bytes else "utf-8")[start:end]
+
+    code_lengths, bit_len = header.code_lengths, header.bit_len
+    table = DecodeTable(code_lengths)
+    index_interval, blocks = reader.read_index()
+
+    if not blocks:
+        chunks = reader.read_data(RANGE_CHUNK_SIZE)
+        return _decode_span(table, chunks, bit_len, 0, start, end)
+
+    pieces = []
+    block_start = 0  # character position of the block
+
+    for block in blocks:
+        block_end = block_start + block.num_chars
+        if end is not None and block_start >= end:
+            break
+
+        if block_end > start:
+            # Find the nearest checkpoint at or before start
+            k = 0
+            if index_interval:
+                k = max(start - block_start, 0) // index_interval
+                k = min(k, len(block.checkpoints))
+            char_pos = block_start + k * index_interval
+            bit_pos = block.checkpoints[k - 1] if k else 0
+
+            chunks = reader.read_data(RANGE_CHUNK_SIZE, block, bit_pos // 8)
+            pieces.append(
+                _decode_span(
+                    table,
+                    chunks,
+                    block.bit_len - bit_pos,
+                    bit_pos % 8,
+                    start - char_pos,
+                    None if end is None else end - char_pos,
+                )
+            )
+
+        block_start = block_end
+
+    return "".join(pieces)
+
+
+def _decode_span(
+    table: DecodeTable,
+    chunks: Iterable[bytes | memoryview],
+    bit_len: int,
+    skip_bits: int,
+    start: int,
+    end: Optional[int],
+) -> str:
+    """Decode characters start to end, counted from the first decoded character."""
+    decoded = []
+    count = 0
+
+    for text in table.decode_chunks(chunks, bit_len, skip_bits):
+        decoded.append(text)
+        count += len(text)
+        if end is not None and count >= end:
+            break
+
+    return "".join(decoded)[max(start, 0) : end]
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
-from typing import Generator
+from mmap import mmap
+from typing import Generator, Iterator, overload
+
+Buffer = bytes | bytearray | memoryview | mmap
 
 
 class BitStream:
-    """Stores bits in a bytearray with most significant bit (MSB) first per byte."""
+    """Stores bits in a bytearray with most significant bit (MSB) first per byte.
+
+    A BitStream can also be a read-only view of bits in a shared buffer, see
+    from_buffer and view.
+    """
 
     def __init__(self, bits: str | list[int] | "BitStream" | None = None) -> None:
         """Initialize the BitStream optionally from bits."""
-        self._bytes: bytearray = bytearray()  # Stores the bytes containing bits
+        # Stores the bytes containing bits, or a read-only memoryview for views
+        self._bytes: bytearray | memoryview = bytearray()
+        self._offset: int = 0  # Bit position of the first bit in the first byte
         self._bit_len: int = 0  # Total number of bits in the BitStream
 
         # Initialize from bits if provided
@@ -17,6 +26,8 @@ class BitStream:
 
     def append(self, bit: int | str) -> "BitStream":
         """Append a single bit (0 or 1) to the BitStream."""
+        data = self._writable_bytes()
+
         # Convert string to int if necessary
         if isinstance(bit, str):
             bit = int(bit)
@@ -31,13 +42,13 @@ class BitStream:
 
         # Start a new byte if at the beginning of a byte
         if bit_idx == 0:
-            self._bytes.append(0)
+            data.append(0)
 
         # Store bit into the target byte.
         #   Bits are written in big-endian order; 1st bit goes into the most significant position (7).
         #   Shift (<<) the bit to MSB so it lands at the correct position.
         #   Set (|) the bit into the byte.
-        self._bytes[byte_idx] |= bit << (7 - bit_idx)
+        data[byte_idx] |= bit << (7 - bit_idx)
 
         # Increment total bit count
         self._bit_len += 1
@@ -45,8 +56,57 @@ class BitStream:
         # Return self for chaining
         return self
 
+    def append_bits(self, value: int, nbits: int) -> "BitStream":
+        """Append the nbits-bit integer value, most significant bit first."""
+        data = self._writable_bytes()
+
+        # Validate width and value
+        if nbits < 0:
+            raise ValueError("Number of bits must not be negative")
+        if not 0 <= value < (1 << nbits):
+            raise ValueError(f"Value does not fit in {nbits} bits")
+
+        # Fill the free bits of the last byte first
+        free = -self._bit_len % 8
+        if free and nbits:
+            take = min(free, nbits)
+            nbits -= take
+            data[-1] |= (value >> nbits) << (free - take)
+            value &= (1 << nbits) - 1
+            self._bit_len += take
+
+        # The rest starts on a byte boundary, so it is appended as whole bytes
+        #   Shift (<<) the value left so its last bits are padded to a full byte.
+        if nbits:
+            pad = -nbits % 8
+            data += (value << pad).to_bytes((nbits + pad) // 8, "big")
+            self._bit_len += nbits
+
+        # Return self for chaining
+        return self
+
     def extend(self, bits: str | list[int] | "BitStream") -> "BitStream":
         """Append multiple bits to the BitStream."""
+        data = self._writable_bytes()
+
+        # Another BitStream is appended byte by byte when this one is byte-aligned,
+        # and as a single integer otherwise
+        if isinstance(bits, BitStream):
+            if self._bit_len % 8 == 0:
+                data += bits._data_bytes()
+                self._bit_len += bits._bit_len
+            else:
+                self.append_bits(bits.read_bits(0, len(bits)), len(bits))
+            return self
+
+        # A string of 0s and 1s is converted to an integer in one step
+        if isinstance(bits, str):
+            if bits.strip("01"):
+                raise ValueError("Bit must be 0 or 1")
+            if bits:
+                self.append_bits(int(bits, 2), len(bits))
+            return self
+
         # Append each bit individually
         for b in bits:
             self.append(b)
@@ -54,24 +114,132 @@ class BitStream:
         # Return self for chaining
         return self
 
+    def read_bits(self, pos: int, nbits: int) -> int:
+        """Return the nbits bits starting at bit pos as an integer, MSB first."""
+        if pos < 0 or nbits < 0 or pos + nbits > self._bit_len:
+            raise IndexError("BitStream read out of range")
+        return self.peek_bits(pos, nbits)
+
+    def peek_bits(self, pos: int, nbits: int) -> int:
+        """Return the nbits bits starting at bit pos, zero-padded past the end."""
+        if pos < 0 or nbits < 0:
+            raise IndexError("BitStream read out of range")
+        end = min(pos + nbits, self._bit_len)
+        if end <= pos:
+            return 0
+
+        # Read the bytes spanning the bits as one integer
+        #   Shift (>>) out the bits after the end, then mask (&) out those before pos.
+        start, stop = self._offset + pos, self._offset + end
+        first, last = start // 8, (stop + 7) // 8
+        value = int.from_bytes(self._bytes[first:last], "big")
+        value = (value >> (8 * last - stop)) & ((1 << (end - pos)) - 1)
+
+        # Pad with zeros past the end
+        return value << (pos + nbits - end)
+
+    def iter_bytes(self) -> Iterator[int]:
+        """Iterate over the BitStream byte by byte, the last byte zero-padded."""
+        return iter(self._data_bytes())
+
+    def iter_words(self, nbits: int) -> Iterator[int]:
+        """Iterate over the BitStream nbits bits at a time, the last word zero-padded."""
+        if nbits <= 0:
+            raise ValueError("Word size must be positive")
+        for pos in range(0, self._bit_len, nbits):
+            yield self.peek_bits(pos, nbits)
+
     def to_bytearray(self) -> bytearray:
         """Return the BitStream as a bytearray (last byte may be partially filled)."""
-        return self._bytes.copy()
+        return self._data_bytes()
+
+    def to_memoryview(self) -> memoryview:
+        """Return the bytes of the BitStream as a read-only memoryview.
+
+        The bytes are shared without copying unless the bits do not start on a byte
+        boundary or bits past the end are set. Like any exported buffer, a shared
+        bytearray cannot grow while the memoryview is alive. Use it wherever bytes
+        are expected, as BitStream does not implement the buffer protocol itself.
+        """
+        num_bytes = (self._bit_len + 7) // 8
+        rem = self._bit_len % 8
+        if self._offset or (rem and self._bytes[num_bytes - 1] & (0xFF >> rem)):
+            return memoryview(self._data_bytes()).toreadonly()
+        return memoryview(self._bytes)[:num_bytes].toreadonly()
 
     @classmethod
     def from_bytearray(
-        cls, data: bytearray, bit_length: int | None = None
+        cls, data: bytes | bytearray, bit_length: int | None = None
     ) -> "BitStream":
-        """Create a BitStream from a bytearray and optional bit length."""
+        """Create a BitStream from bytes or a bytearray and optional bit length."""
         bs = cls()
-        bs._bytes = data.copy()
         bs._bit_len = len(data) * 8 if bit_length is None else bit_length
+        # Copy only the bytes holding bits, and clear the bits past bit_length,
+        # so later appends start clean
+        bs._bytes = bytearray(memoryview(data)[: (bs._bit_len + 7) // 8])
+        if bs._bit_len % 8:
+            bs._bytes[-1] &= (0xFF << (8 - bs._bit_len % 8)) & 0xFF
+        return bs
+
+    @classmethod
+    def from_buffer(
+        cls, data: Buffer, bit_length: int | None = None, bit_offset: int = 0
+    ) -> "BitStream":
+        """Create a read-only view of bit_length bits of data, starting at bit_offset.
+
+        The bits are not copied, so data (e.g. an mmap) must stay open while the view
+        is in use. The bit length defaults to the rest of the buffer.
+        """
+        mv = memoryview(data).cast("B")
+        if bit_length is None:
+            bit_length = 8 * len(mv) - bit_offset
+        if bit_offset < 0 or bit_length < 0 or bit_offset + bit_length > 8 * len(mv):
+            raise ValueError("Bit range is outside the buffer")
+
+        bs = cls()
+        first, last = bit_offset // 8, (bit_offset + bit_length + 7) // 8
+        bs._bytes = mv[first:last].toreadonly()
+        bs._offset = bit_offset % 8
+        bs._bit_len = bit_length
         return bs
 
+    def view(self, pos: int, nbits: int) -> "BitStream":
+        """Return a read-only view of nbits bits starting at bit pos, sharing bytes.
+
+        The BitStream cannot grow while views of it are alive.
+        """
+        if pos < 0 or nbits < 0 or pos + nbits > self._bit_len:
+            raise IndexError("BitStream view out of range")
+        return BitStream.from_buffer(self._bytes, nbits, self._offset + pos)
+
+    @property
+    def readonly(self) -> bool:
+        """Return whether the BitStream is a view that cannot be appended to."""
+        return isinstance(self._bytes, memoryview)
+
+    def _writable_bytes(self) -> bytearray:
+        """Return the bytes to append to, or raise TypeError for a read-only view."""
+        if isinstance(self._bytes, memoryview):
+            raise TypeError("Cannot append to a read-only BitStream view")
+        return self._bytes
+
+    def _data_bytes(self) -> bytearray:
+        """Return a copy of the bytes holding the bits, with padding bits cleared."""
+        if self._offset:
+            # Shift the bits back to a byte boundary
+            pad = -self._bit_len % 8
+            value = self.read_bits(0, self._bit_len) << pad
+            return bytearray(value.to_bytes((self._bit_len + pad) // 8, "big"))
+
+        data = bytearray(self._bytes[: (self._bit_len + 7) // 8])
+        if self._bit_len % 8:
+            data[-1] &= (0xFF << (8 - self._bit_len % 8)) & 0xFF
+        return data
+
     def copy(self) -> "BitStream":
-        """Return a new BitStream with the same bits."""
+        """Return a new, writable BitStream with the same bits."""
         new_bs = BitStream()
-        new_bs._bytes = self._bytes.copy()
+        new_bs._bytes = self._data_bytes()
         new_bs._bit_len = self._bit_len
         return new_bs
 
@@ -81,17 +249,31 @@ class BitStream:
 
     def __iter__(self) -> Generator[int, None, None]:
         """Iterate over each bit in the BitStream (0 or 1)."""
-        for i in range(self._bit_len):
-            yield self[i]
+        # Walk the bytes rather than indexing every bit
+        for i, byte in enumerate(self._data_bytes()):
+            for bit_idx in range(min(8, self._bit_len - 8 * i)):
+                yield (byte >> (7 - bit_idx)) & 1
+
+    @overload
+    def __getitem__(self, idx: int) -> int: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> "BitStream": ...
+
+    def __getitem__(self, idx: int | slice) -> int | "BitStream":
+        """Return the bit at the given index (0-based), or a view of a slice."""
+        if isinstance(idx, slice):
+            start, stop, step = idx.indices(self._bit_len)
+            if step != 1:
+                raise ValueError("BitStream slices must be contiguous")
+            return self.view(start, max(stop - start, 0))
 
-    def __getitem__(self, idx: int) -> int:
-        """Return the bit at the given index (0-based)."""
         if not (0 <= idx < self._bit_len):
             raise IndexError("BitStream index out of range")
 
         # Determine byte and bit index
-        byte_idx = idx // 8
-        bit_idx = idx % 8
+        byte_idx = (self._offset + idx) // 8
+        bit_idx = (self._offset + idx) % 8
 
         # Extract the bit at the given index
         #   Bits are read in big-endian order; 1st bit is at the most significant position (7).
@@ -105,17 +287,17 @@ class BitStream:
             return False
         if self._bit_len != other._bit_len:
             return False
-        return all(a == b for a, b in zip(self, other))
+        return self._data_bytes() == other._data_bytes()
 
     def __hash__(self) -> int:
         """Compute a hash based on the bits in the BitStream."""
-        return hash((bytes(self._bytes), self._bit_len))
+        return hash((bytes(self._data_bytes()), self._bit_len))
 
     def __str__(self) -> str:
-        full_bytes = [format(b, "08b") for b in self._bytes]
+        full_bytes = [format(b, "08b") for b in self._data_bytes()]
         s = "".join(full_bytes)
         return s[: self._bit_len]  # trim extra bits
 
     def __repr__(self) -> str:
         """Return a detailed string representation for debugging."""
-        return f"{self.__class__.__name__}(bytes={self._bytes!r}, bit_len={self._bit_len!r})"
+        return f"{self.__class__.__name__}(bytes={self._data_bytes()!r}, bit_len={self._bit_len!r})"
@@ -28,3 +28,13 @@ class Entry(Generic[K, V]):
 
     def __ne__(self, other: object) -> bool:
         return not self == other
+
+
+class HashedEntry(Entry[K, V]):
+    """A key-value pair caching the hash code of its key."""
+
+    __slots__ = ("hash",)
+
+    def __init__(self, key: K, value: V, hash_code: int):
+        super().__init__(key, value)
+        self.hash = hash_code
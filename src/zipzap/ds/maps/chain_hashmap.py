@@ -0,0 +1,105 @@
+from typing import Iterator, Optional, TypeVar
+
+from zipzap.ds.entry import Entry, HashedEntry
+from zipzap.ds.maps.hashmap import Hashmap, next_prime
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class ChainHashmap(Hashmap[K, V]):
+    """Hashmap implementation using separate chaining.
+
+    Each slot holds a list of the entries hashing to it, so the load factor may
+    pass 1. Entries cache the hash code of their key, compared before the key
+    itself and reused when the table grows.
+    """
+
+    def __init__(
+        self,
+        slots: int = 211,
+        max_load: float = 1.0,
+        hash_strategy: str = "polynomial",
+    ) -> None:
+        super().__init__(next_prime(slots), max_load, hash_strategy)
+        self._table: list[Optional[list[HashedEntry[K, V]]]] = [None] * self._slots
+
+    def get(self, key: K) -> Optional[V]:
+        hash_code = self._hash_code(key)
+        bucket = self._table[hash_code % self._slots]
+        if bucket is not None:
+            for entry in bucket:
+                if entry.hash == hash_code and entry.key == key:
+                    return entry.value
+        return None
+
+    def put(self, key: K, value: V) -> Optional[V]:
+        hash_code = self._hash_code(key)
+        bucket = self._table[hash_code % self._slots]
+
+        if bucket is not None:
+            for entry in bucket:
+                if entry.hash == hash_code and entry.key == key:
+                    old_value = entry.value
+                    entry.value = value
+                    return old_value
+
+        self._insert_new(key, value, hash_code)
+        return None
+
+    def remove(self, key: K) -> Optional[V]:
+        hash_code = self._hash_code(key)
+        index = hash_code % self._slots
+        bucket = self._table[index]
+        if bucket is None:
+            return None
+
+        for i, entry in enumerate(bucket):
+            if entry.hash == hash_code and entry.key == key:
+                # Order within a chain does not matter, so fill the gap with the last
+                bucket[i] = bucket[-1]
+                bucket.pop()
+                if not bucket:
+                    self._table[index] = None
+                self._size -= 1
+                return entry.value
+        return None
+
+    def entries(self) -> Iterator[Entry[K, V]]:
+        for bucket in self._table:
+            if bucket is not None:
+                yield from bucket
+
+    def probe_lengths(self) -> Iterator[int]:
+        for bucket in self._table:
+            if bucket is not None:
+                yield from range(1, len(bucket) + 1)
+
+    def _insert_new(self, key: K, value: V, hash_code: int) -> None:
+        index = hash_code % self._slots
+        bucket = self._table[index]
+        entry = HashedEntry(key, value, hash_code)
+        if bucket is None:
+            self._table[index] = [entry]
+        else:
+            bucket.append(entry)
+
+        self._size += 1
+        if self._size > self._max_load * self._slots:
+            self._resize(next_prime(2 * self._slots + 1))
+
+    def _resize(self, slots: int) -> None:
+        old_table = self._table
+        self._slots = slots
+        self._table = [None] * slots
+
+        for bucket in old_table:
+            if bucket is None:
+                continue
+            for entry in bucket:
+                index = entry.hash % slots
+                new_bucket = self._table[index]
+                if new_bucket is None:
+                    self._table[index] = [entry]
+                else:
+                    new_bucket.append(entry)
@@ -0,0 +1,197 @@
+from array import array
+from typing import Any, Iterator, Optional, TypeVar
+
+from zipzap.ds.entry import Entry
+from zipzap.ds.maps.probe_hashmap import (
+    TOMBSTONE,
+    DoubleHashingHashmap,
+    probe_length,
+)
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+HASH_MASK = (1 << 63) - 1  # hash codes are cut to 63 bits to fit a signed array
+FREE = -1  # hash of a slot not in use
+
+
+class Empty:
+    """Represents a bucket never used."""
+
+    ...
+
+
+EMPTY = Empty()
+
+
+class CompactProbeHashmap(DoubleHashingHashmap[K, V]):
+    """Open addressing hashmap storing keys, values and hashes in parallel tables.
+
+    Probes like ProbeHashmap, but without an Entry object per key or bounds checks
+    per slot: empty and deleted slots hold the EMPTY and TOMBSTONE sentinels as
+    their key, and hash codes are packed in an array. With a value_typecode (see
+    the array module), values are packed in an array of that type instead of a
+    list, e.g. "q" for counts.
+    """
+
+    def __init__(
+        self,
+        slots: int = 211,
+        max_load: float = 0.5,
+        hash_strategy: str = "polynomial",
+        value_typecode: Optional[str] = None,
+    ) -> None:
+        super().__init__(slots, max_load, hash_strategy)
+        self._value_typecode = value_typecode
+        self._allocate(self._slots)
+
+    def _allocate(self, slots: int) -> None:
+        """Replace the table with an empty one of slots."""
+        self._slots = slots
+        self._keys: list[Any] = [EMPTY] * slots
+        self._hashes = array("q", [FREE]) * slots
+        self._values: Any = (
+            [None] * slots
+            if self._value_typecode is None
+            else array(self._value_typecode, [0]) * slots
+        )
+
+    def _find(self, key: K) -> int:
+        """Return the slot holding key, or -1 if absent."""
+        hash_code = self._hash_code(key) & HASH_MASK
+        keys, hashes, slots = self._keys, self._hashes, self._slots
+        index = hash_code % slots
+        step = self._hash2(hash_code)
+
+        for _ in range(slots):
+            slot_key = keys[index]
+            if slot_key is EMPTY:
+                return -1
+            # Empty and deleted slots have no hash, so never match
+            if hashes[index] == hash_code and slot_key == key:
+                return index
+            index = (index + step) % slots
+
+        return -1  # Full cycle, key not found
+
+    def get(self, key: K) -> Optional[V]:
+        index = self._find(key)
+        return None if index < 0 else self._values[index]
+
+    def put(self, key: K, value: V) -> Optional[V]:
+        if self._used + 1 > self._max_load * self._slots:
+            self._expand()
+
+        hash_code = self._hash_code(key) & HASH_MASK
+        keys, hashes, slots = self._keys, self._hashes, self._slots
+        index = hash_code % slots
+        step = self._hash2(hash_code)
+        first_tombstone = -1
+
+        for _ in range(slots):
+            slot_key = keys[index]
+
+            # Key not found
+            if slot_key is EMPTY:
+                break
+
+            # Remember first tombstone for possible reuse
+            elif slot_key is TOMBSTONE:
+                if first_tombstone < 0:
+                    first_tombstone = index
+
+            # Key found
+            elif hashes[index] == hash_code and slot_key == key:
+                old_value = self._values[index]
+                self._values[index] = value
+                return old_value
+
+            index = (index + step) % slots
+
+        else:
+            # Full cycle without an empty slot, only possible through tombstones
+            if first_tombstone < 0:
+                self._expand()
+                return self.put(key, value)
+
+        # Insert at first tombstone if available, else in the empty slot
+        if first_tombstone < 0:
+            self._used += 1
+        else:
+            index = first_tombstone
+        keys[index] = key
+        hashes[index] = hash_code
+        self._values[index] = value
+        self._size += 1
+        return None
+
+    def remove(self, key: K) -> Optional[V]:
+        index = self._find(key)
+        if index < 0:
+            return None
+
+        old_value = self._values[index]
+        self._keys[index] = TOMBSTONE
+        self._hashes[index] = FREE
+        self._values[index] = None if self._value_typecode is None else 0
+        self._size -= 1
+        return old_value
+
+    def entries(self) -> Iterator[Entry[K, V]]:
+        for key, value in self._items():
+            yield Entry(key, value)
+
+    def keys(self) -> Iterator[K]:
+        for key, _ in self._items():
+            yield key
+
+    def values(self) -> Iterator[V]:
+        for _, value in self._items():
+            yield value
+
+    def probe_lengths(self) -> Iterator[int]:
+        for i, hash_code in enumerate(self._hashes):
+            if hash_code != FREE:
+                yield probe_length(hash_code, i, self._slots, self._hash2(hash_code))
+
+    def _items(self) -> Iterator[tuple[K, V]]:
+        """Return an iterator over the (key, value) pairs in use."""
+        for key, hash_code, value in zip(self._keys, self._hashes, self._values):
+            if hash_code != FREE:
+                yield key, value
+
+    def _resize(self, slots: int) -> None:
+        old = [
+            (key, hash_code, value)
+            for key, hash_code, value in zip(self._keys, self._hashes, self._values)
+            if hash_code != FREE
+        ]
+        self._allocate(slots)
+        self._used = self._size
+
+        # Keys are distinct, so each goes in the first empty slot it probes
+        keys, hashes, values = self._keys, self._hashes, self._values
+        for key, hash_code, value in old:
+            index = hash_code % slots
+            step = self._hash2(hash_code)
+            while keys[index] is not EMPTY:
+                index = (index + step) % slots
+            keys[index] = key
+            hashes[index] = hash_code
+            values[index] = value
+
+    def _insert_new(self, key: K, value: V, hash_code: int) -> None:
+        if self._used + 1 > self._max_load * self._slots:
+            self._expand()
+
+        hash_code &= HASH_MASK
+        index = hash_code % self._slots
+        step = self._hash2(hash_code)
+        while self._keys[index] is not EMPTY:
+            index = (index + step) % self._slots
+        self._keys[index] = key
+        self._hashes[index] = hash_code
+        self._values[index] = value
+        self._size += 1
+        self._used += 1
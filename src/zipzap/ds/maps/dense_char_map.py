@@ -0,0 +1,78 @@
+from typing import Iterator, Optional, TypeVar
+
+from zipzap.ds.entry import Entry
+from zipzap.ds.maps.chain_hashmap import ChainHashmap
+from zipzap.ds.maps.map import Map
+
+V = TypeVar("V")
+
+DENSE_SIZE = 0x800  # codepoints indexed directly, all characters of 1-2 UTF-8 bytes
+SPARSE_SLOTS = 11  # initial slots of the fallback hashmap
+
+
+class DenseCharMap(Map[str, V]):
+    """Map keyed by single characters, indexed by codepoint.
+
+    Characters below dense_size are looked up in a flat list, without hashing;
+    rarer higher codepoints (and any other keys) fall back to a hashmap. Entries
+    come in codepoint order for the dense range. None marks a missing character,
+    so it cannot be a value.
+    """
+
+    def __init__(self, dense_size: int = DENSE_SIZE) -> None:
+        if dense_size <= 0:
+            raise ValueError("Dense size must be positive")
+        self._dense: list[Optional[V]] = [None] * dense_size
+        self._dense_size = dense_size
+        self._dense_len = 0
+        self._sparse = ChainHashmap[str, V](SPARSE_SLOTS)
+
+    def get(self, key: str) -> Optional[V]:
+        # Inlined rather than _code, as this is the innermost lookup of the codec
+        try:
+            code = ord(key)
+        except TypeError:
+            return self._sparse.get(key)
+        if code < self._dense_size:
+            return self._dense[code]
+        return self._sparse.get(key)
+
+    def put(self, key: str, value: V) -> Optional[V]:
+        if value is None:
+            raise ValueError("DenseCharMap cannot store None")
+        code = self._code(key)
+        if code >= self._dense_size:
+            return self._sparse.put(key, value)
+
+        old_value = self._dense[code]
+        self._dense[code] = value
+        if old_value is None:
+            self._dense_len += 1
+        return old_value
+
+    def remove(self, key: str) -> Optional[V]:
+        code = self._code(key)
+        if code >= self._dense_size:
+            return self._sparse.remove(key)
+
+        old_value = self._dense[code]
+        if old_value is not None:
+            self._dense[code] = None
+            self._dense_len -= 1
+        return old_value
+
+    def _code(self, key: str) -> int:
+        """Return the index of key in the dense list, dense_size if it has none."""
+        try:
+            return ord(key)
+        except TypeError:
+            return self._dense_size
+
+    def entries(self) -> Iterator[Entry[str, V]]:
+        for code, value in enumerate(self._dense):
+            if value is not None:
+                yield Entry(chr(code), value)
+        yield from self._sparse.entries()
+
+    def __len__(self) -> int:
+        return self._dense_len + len(self._sparse)
@@ -1,35 +1,115 @@
-from typing import TypeVar
+from abc import abstractmethod
+from typing import Any, Callable, Hashable, Iterable, Iterator, Self, Sized, TypeVar
 
-from zipzap.ds.array import Array
 from zipzap.ds.maps.map import Map
 
 K = TypeVar("K")
 V = TypeVar("V")
 
 
+def polynomial_hash(key: Hashable) -> int:
+    """Compute an integer hash code, the same in every process."""
+    if isinstance(key, str):
+        # Single characters, the common key, hash to their codepoint
+        if len(key) == 1:
+            return ord(key)
+        # For strings, use polynomial rolling hash
+        hash_val = 0
+        p = 31
+        for c in key:
+            hash_val = hash_val * p + ord(c)
+        return hash_val
+    elif isinstance(key, int):
+        # For integers, use the integer itself
+        return key
+    else:
+        # Fallback: use Python's built-in hash
+        return hash(key)
+
+
+# Hash functions by strategy name. Python's built-in hash runs in C, but salts
+# strings per process, so entry order (and ties broken by it) varies between runs
+HASH_STRATEGIES: dict[str, Callable[[Hashable], int]] = {
+    "polynomial": polynomial_hash,
+    "builtin": hash,
+}
+
+
+def next_prime(n: int) -> int:
+    """Return the smallest prime of at least n."""
+    n = max(n, 2)
+    while any(n % d == 0 for d in range(2, int(n**0.5) + 1)):
+        n += 1
+    return n
+
+
 class Hashmap(Map[K, V]):
-    """An abstract hashmap storing key-value pairs."""
+    """An abstract hashmap storing key-value pairs.
+
+    The table grows once its load (entries over slots) would pass max_load. Keys are
+    hashed by one of HASH_STRATEGIES.
+    """
 
-    def __init__(self, slots: int = 101) -> None:
-        self._table: Array = Array(slots)
+    def __init__(
+        self,
+        slots: int = 101,
+        max_load: float = 0.75,
+        hash_strategy: str = "polynomial",
+    ) -> None:
+        if max_load <= 0:
+            raise ValueError("Max load factor must be positive")
+        if hash_strategy not in HASH_STRATEGIES:
+            raise ValueError(f"Unknown hash strategy: {hash_strategy}")
         self._slots: int = slots
         self._size: int = 0
+        self._max_load = max_load
+        self._hash_strategy = hash_strategy
+        self._hash_code: Callable[[Hashable], int] = HASH_STRATEGIES[hash_strategy]
+
+    @classmethod
+    def from_items(
+        cls, items: Iterable[tuple[K, V]], unique: bool = False, **options: Any
+    ) -> Self:
+        # Size the table once, and insert distinct keys without comparing any
+        pairs = list(items)
+        m = cls(**options)
+        m.reserve(len(pairs))
+        if not unique:
+            m.put_many(pairs)
+            return m
+        for key, value in pairs:
+            m._insert_new(key, value, m._hash_code(key))
+        return m
+
+    def put_many(self, items: Iterable[tuple[K, V]]) -> None:
+        if isinstance(items, Sized):
+            self.reserve(self._size + len(items))
+        super().put_many(items)
+
+    def reserve(self, expected: int) -> None:
+        """Grow the table so that expected entries fit without growing again."""
+        if expected > self._max_load * self._slots:
+            self._resize(next_prime(int(expected / self._max_load) + 1))
+
+    @property
+    def load_factor(self) -> float:
+        """Return the number of entries per slot."""
+        return self._size / self._slots
+
+    @abstractmethod
+    def probe_lengths(self) -> Iterator[int]:
+        """Return an iterator over the slots a get probes to find each entry."""
+        ...
+
+    @abstractmethod
+    def _resize(self, slots: int) -> None:
+        """Move every entry into a new table of slots, reusing their hash codes."""
+        ...
 
-    def _hash_code(self, key: K) -> int:
-        """Compute an integer hash code for a string key."""
-        if isinstance(key, str):
-            # For strings, use polynomial rolling hash
-            hash_val = 0
-            p = 31
-            for c in key:
-                hash_val = hash_val * p + ord(c)
-            return hash_val
-        elif isinstance(key, int):
-            # For integers, use the integer itself
-            return key
-        else:
-            # Fallback: use Python's built-in hash
-            return hash(key)
+    @abstractmethod
+    def _insert_new(self, key: K, value: V, hash_code: int) -> None:
+        """Insert a key known to be absent with its hash code, without comparing keys."""
+        ...
 
     def _compress(self, hash_code: int) -> int:
         """Compress a hash code to a valid index in the table."""
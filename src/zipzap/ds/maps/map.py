@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, Iterator, Optional, TypeVar
+from typing import Any, Generic, Iterable, Iterator, Optional, Self, TypeVar
 
 from zipzap.ds.entry import Entry
 
@@ -25,6 +25,29 @@ class Map(ABC, Generic[K, V]):
         """Remove the item associated with key. Return its value if present, else None."""
         ...
 
+    @classmethod
+    def from_items(
+        cls, items: Iterable[tuple[K, V]], unique: bool = False, **options: Any
+    ) -> Self:
+        """Return a new map of (key, value) pairs, created with options.
+
+        With unique, the keys are known to be distinct, which maps may use to skip
+        looking for existing keys. Otherwise later pairs overwrite earlier ones.
+        """
+        m = cls(**options)
+        m.put_many(items)
+        return m
+
+    def put_many(self, items: Iterable[tuple[K, V]]) -> None:
+        """Associate each value with its key, in order."""
+        for key, value in items:
+            self.put(key, value)
+
+    def get_many(self, keys: Iterable[K]) -> list[Optional[V]]:
+        """Return the value of each key, None for those absent."""
+        get = self.get
+        return [get(key) for key in keys]
+
     @abstractmethod
     def entries(self) -> Iterator[Entry[K, V]]:
         """Return an iterator over all entries."""
@@ -1,8 +1,8 @@
 from typing import Iterator, Optional, TypeVar
 
 from zipzap.ds.array import Array
-from zipzap.ds.entry import Entry
-from zipzap.ds.maps.hashmap import Hashmap
+from zipzap.ds.entry import Entry, HashedEntry
+from zipzap.ds.maps.hashmap import Hashmap, next_prime
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -17,29 +17,61 @@ class Tombstone:
 TOMBSTONE = Tombstone()
 
 
-class ProbeHashmap(Hashmap[K, V]):
-    """Hashmap implementation using open addressing."""
+class DoubleHashingHashmap(Hashmap[K, V]):
+    """Base for open addressing hashmaps probing by double hashing.
 
-    def __init__(self, slots: int = 211) -> None:
-        super().__init__(slots)
-        # Specify array contents type (for type checking)
-        self._table: Array[Entry[K, V] | Tombstone | None] = Array(slots)
+    Subclasses implement the table, and count the slots holding an entry or a
+    tombstone in _used.
+    """
 
-    def _probe(self, key: K, i: int) -> int:
-        """Probe function using double hashing."""
-        return i * self._hash2(key)
+    def __init__(self, slots: int, max_load: float, hash_strategy: str) -> None:
+        if not 0 < max_load < 1:
+            raise ValueError("Max load factor must be between 0 and 1")
+        super().__init__(next_prime(max(slots, 3)), max_load, hash_strategy)
+        self._used = 0  # slots holding an entry or a tombstone
 
-    def _hash2(self, key: K) -> int:
-        """Secondary hash function for probing."""
+    def _hash2(self, hash_code: int) -> int:
+        """Secondary hash function for probing, the step between probes."""
         q = self._slots - 2  # q < N
-        return q - (self._hash_index(key) % q)
+        return q - (hash_code % q)
+
+    def _expand(self) -> None:
+        """Helper method to rehash the table once past its max load factor.
+
+        The table doubles in size (to the next prime), unless tombstones make up
+        most of the load, in which case rehashing at the same size clears them.
+        """
+        slots = self._slots
+        if self._size + 1 > self._max_load * slots / 2:
+            slots = next_prime(2 * slots + 1)
+        self._resize(slots)
+
+
+class ProbeHashmap(DoubleHashingHashmap[K, V]):
+    """Hashmap implementation using open addressing.
+
+    Collisions are resolved by double hashing over a prime number of slots, so that
+    every probe sequence visits every slot. Entries cache the hash code of their key,
+    which is compared before the key itself and reused when the table grows.
+    Tombstones count towards the load, keeping an empty slot on every sequence.
+    """
+
+    def __init__(
+        self,
+        slots: int = 211,
+        max_load: float = 0.5,
+        hash_strategy: str = "polynomial",
+    ) -> None:
+        super().__init__(slots, max_load, hash_strategy)
+        # Specify array contents type (for type checking)
+        self._table: Array[HashedEntry[K, V] | Tombstone | None] = Array(self._slots)
 
     def get(self, key: K) -> Optional[V]:
-        start_index = self._hash_index(key)
-        index = start_index
-        i = 0  # Number of probes
+        hash_code = self._hash_code(key)
+        index = self._compress(hash_code)
+        step = self._hash2(hash_code)
 
-        while True:
+        for _ in range(self._slots):
             entry = self._table[index]
 
             # Key not found
@@ -48,60 +80,71 @@ class ProbeHashmap(Hashmap[K, V]):
 
             # Key found
             elif (
-                entry is not TOMBSTONE and isinstance(entry, Entry) and entry.key == key
+                isinstance(entry, HashedEntry)
+                and entry.hash == hash_code
+                and entry.key == key
             ):
                 return entry.value
 
-            i += 1
-            index = self._compress(start_index + self._probe(key, i))
+            index = self._compress(index + step)
 
-            if index == start_index:
-                return None  # Full cycle, key not found
+        return None  # Full cycle, key not found
 
     def put(self, key: K, value: V) -> Optional[V]:
-        if self._size == self._slots:
+        if self._used + 1 > self._max_load * self._slots:
             self._expand()
 
-        start_index = self._hash_index(key)
-        index = start_index
+        hash_code = self._hash_code(key)
+        index = self._compress(hash_code)
+        step = self._hash2(hash_code)
         first_tombstone = None
-        i = 0
 
-        while True:
+        for _ in range(self._slots):
             entry = self._table[index]
 
             # Key not found
             if entry is None:
-                # Insert at first tombstone if available, else here
-                target_index = first_tombstone if first_tombstone is not None else index
-                self._table[target_index] = Entry(key, value)
-                self._size += 1
-                return None
+                break
 
             # First tombstone found
-            elif entry is TOMBSTONE and first_tombstone is None:
+            elif entry is TOMBSTONE:
                 # Remember first tombstone for possible reuse
-                first_tombstone = index
+                if first_tombstone is None:
+                    first_tombstone = index
 
             # Key found
-            elif isinstance(entry, Entry) and entry.key == key:
+            elif (
+                isinstance(entry, HashedEntry)
+                and entry.hash == hash_code
+                and entry.key == key
+            ):
                 # Update value
                 old_value = entry.value
                 entry.value = value
                 return old_value
 
-            i += 1
-            index = self._compress(start_index + self._probe(key, i))
+            index = self._compress(index + step)
+
+        else:
+            # Full cycle without an empty slot, only possible through tombstones
+            if first_tombstone is None:
+                self._expand()
+                return self.put(key, value)
 
-            if index == start_index:
-                return None  # Full cycle, key not found (table full)
+        # Insert at first tombstone if available, else in the empty slot
+        if first_tombstone is None:
+            self._used += 1
+        target_index = first_tombstone if first_tombstone is not None else index
+        self._table[target_index] = HashedEntry(key, value, hash_code)
+        self._size += 1
+        return None
 
     def remove(self, key: K) -> Optional[V]:
-        start_index = self._hash_index(key)
-        index = start_index
-        i = 0
+        hash_code = self._hash_code(key)
+        index = self._compress(hash_code)
+        step = self._hash2(hash_code)
 
-        while True:
+        for _ in range(self._slots):
             entry = self._table[index]
 
             # Key not found
@@ -110,7 +153,9 @@ class ProbeHashmap(Hashmap[K, V]):
 
             # Key found
             elif (
-                entry is not TOMBSTONE and isinstance(entry, Entry) and entry.key == key
+                isinstance(entry, HashedEntry)
+                and entry.hash == hash_code
+                and entry.key == key
             ):
                 # Mark entry as tombstone
                 old_value = entry.value
@@ -118,31 +163,57 @@ class ProbeHashmap(Hashmap[K, V]):
                 self._size -= 1
                 return old_value
 
-            i += 1
-            index = self._compress(start_index + self._probe(key, i))
+            index = self._compress(index + step)
 
-            if index == start_index:
-                return None  # Full cycle, key not found
+        return None  # Full cycle, key not found
 
     def entries(self) -> Iterator[Entry[K, V]]:
         # Traverse each bucket
         for i in range(self._table.capacity):
             entry = self._table[i]
-            if entry is not TOMBSTONE and isinstance(entry, Entry):
+            if isinstance(entry, HashedEntry):
                 yield entry
 
-    def _expand(self):
-        """Helper method to expand table when full."""
+    def probe_lengths(self) -> Iterator[int]:
+        for i in range(self._table.capacity):
+            entry = self._table[i]
+            if isinstance(entry, HashedEntry):
+                yield probe_length(entry.hash, i, self._slots, self._hash2(entry.hash))
+
+    def _resize(self, slots: int) -> None:
         old_table = self._table
         old_slots = self._slots
 
-        # Double size of table
-        self._slots = 2 * old_slots + 1
-        self._table = Array(self._slots)
-        self._size = 0
+        self._slots = slots
+        self._table = Array(slots)
+        self._size = self._used = 0
 
-        # Copy old table entries to new table
         for i in range(old_slots):
             entry = old_table[i]
-            if entry is not TOMBSTONE and isinstance(entry, Entry):
-                self.put(entry.key, entry.value)
+            if isinstance(entry, HashedEntry):
+                self._place(entry)
+
+    def _insert_new(self, key: K, value: V, hash_code: int) -> None:
+        if self._used + 1 > self._max_load * self._slots:
+            self._expand()
+        self._place(HashedEntry(key, value, hash_code))
+
+    def _place(self, entry: HashedEntry[K, V]) -> None:
+        """Put an entry of a distinct key in the first empty slot it probes."""
+        index = self._compress(entry.hash)
+        step = self._hash2(entry.hash)
+        while self._table[index] is not None:
+            index = self._compress(index + step)
+        self._table[index] = entry
+        self._size += 1
+        self._used += 1
+
+
+def probe_length(hash_code: int, index: int, slots: int, step: int) -> int:
+    """Return the probes of the double hashing sequence of hash_code up to index."""
+    probe = hash_code % slots
+    length = 1
+    while probe != index:
+        probe = (probe + step) % slots
+        length += 1
+    return length
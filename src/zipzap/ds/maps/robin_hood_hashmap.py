@@ -0,0 +1,161 @@
+from typing import Any, Iterator, Optional, TypeVar
+
+from zipzap.ds.entry import Entry
+from zipzap.ds.maps.hashmap import Hashmap
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class RobinHoodHashmap(Hashmap[K, V]):
+    """Hashmap implementation using linear probing with Robin Hood hashing.
+
+    An entry inserted further from its home slot than the one it meets takes that
+    slot, and the displaced entry moves on. This keeps probe lengths even, and lets
+    a lookup stop at the first entry closer to home than the key would be. Removal
+    shifts the entries that follow back one slot instead of leaving tombstones.
+    Keys, values and hash codes are kept in parallel lists.
+    """
+
+    def __init__(
+        self,
+        slots: int = 211,
+        max_load: float = 0.8,
+        hash_strategy: str = "polynomial",
+    ) -> None:
+        if not 0 < max_load < 1:
+            raise ValueError("Max load factor must be between 0 and 1")
+        super().__init__(max(slots, 1), max_load, hash_strategy)
+        self._allocate(self._slots)
+
+    def _allocate(self, slots: int) -> None:
+        """Replace the table with an empty one of slots."""
+        self._slots = slots
+        self._keys: list[Any] = [None] * slots
+        self._values: list[Any] = [None] * slots
+        self._hashes: list[Optional[int]] = [None] * slots  # None if empty
+
+    def _find(self, key: K) -> int:
+        """Return the slot holding key, or -1 if absent."""
+        hash_code = self._hash_code(key)
+        hashes, slots = self._hashes, self._slots
+        index = hash_code % slots
+        dist = 0  # distance from the home slot of key
+
+        while True:
+            slot_hash = hashes[index]
+            # Key would have displaced an entry closer to its home
+            if slot_hash is None or (index - slot_hash) % slots < dist:
+                return -1
+            if slot_hash == hash_code and self._keys[index] == key:
+                return index
+            index = (index + 1) % slots
+            dist += 1
+
+    def get(self, key: K) -> Optional[V]:
+        index = self._find(key)
+        return None if index < 0 else self._values[index]
+
+    def put(self, key: K, value: V) -> Optional[V]:
+        if self._size + 1 > self._max_load * self._slots:
+            self._resize(2 * self._slots + 1)
+
+        hash_code = self._hash_code(key)
+        keys, values, hashes = self._keys, self._values, self._hashes
+        slots = self._slots
+        index = hash_code % slots
+        dist = 0
+
+        while True:
+            slot_hash = hashes[index]
+
+            # Empty slot, insert here
+            if slot_hash is None:
+                keys[index], values[index], hashes[index] = key, value, hash_code
+                self._size += 1
+                return None
+
+            # Key found, update value
+            if slot_hash == hash_code and keys[index] == key:
+                old_value = values[index]
+                values[index] = value
+                return old_value
+
+            # Key is absent: swap with the richer entry and carry it on instead
+            slot_dist = (index - slot_hash) % slots
+            if slot_dist < dist:
+                key, keys[index] = keys[index], key
+                value, values[index] = values[index], value
+                hash_code, hashes[index] = slot_hash, hash_code
+                dist = slot_dist
+
+            index = (index + 1) % slots
+            dist += 1
+
+    def remove(self, key: K) -> Optional[V]:
+        index = self._find(key)
+        if index < 0:
+            return None
+
+        keys, values, hashes = self._keys, self._values, self._hashes
+        slots = self._slots
+        old_value = values[index]
+
+        # Shift following entries back until one is empty or already home
+        next_index = (index + 1) % slots
+        while True:
+            next_hash = hashes[next_index]
+            if next_hash is None or (next_index - next_hash) % slots == 0:
+                break
+            keys[index] = keys[next_index]
+            values[index] = values[next_index]
+            hashes[index] = next_hash
+            index = next_index
+            next_index = (index + 1) % slots
+
+        keys[index] = values[index] = hashes[index] = None
+        self._size -= 1
+        return old_value
+
+    def entries(self) -> Iterator[Entry[K, V]]:
+        for key, value, hash_code in zip(self._keys, self._values, self._hashes):
+            if hash_code is not None:
+                yield Entry(key, value)
+
+    def probe_lengths(self) -> Iterator[int]:
+        for index, hash_code in enumerate(self._hashes):
+            if hash_code is not None:
+                yield (index - hash_code) % self._slots + 1
+
+    def _resize(self, slots: int) -> None:
+        old = [
+            (key, value, hash_code)
+            for key, value, hash_code in zip(self._keys, self._values, self._hashes)
+            if hash_code is not None
+        ]
+        self._allocate(slots)
+        self._size = 0
+        for key, value, hash_code in old:
+            self._insert_new(key, value, hash_code)
+
+    def _insert_new(self, key: K, value: V, hash_code: int) -> None:
+        if self._size + 1 > self._max_load * self._slots:
+            self._resize(2 * self._slots + 1)
+
+        keys, values, hashes = self._keys, self._values, self._hashes
+        slots = self._slots
+        index = hash_code % slots
+        dist = 0
+
+        while (slot_hash := hashes[index]) is not None:
+            slot_dist = (index - slot_hash) % slots
+            if slot_dist < dist:
+                key, keys[index] = keys[index], key
+                value, values[index] = values[index], value
+                hash_code, hashes[index] = slot_hash, hash_code
+                dist = slot_dist
+            index = (index + 1) % slots
+            dist += 1
+
+        keys[index], values[index], hashes[index] = key, value, hash_code
+        self._size += 1
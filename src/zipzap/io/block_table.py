@@ -0,0 +1,103 @@
+from typing import BinaryIO, Optional
+
+from zipzap.io.byte_source import ByteSource
+from zipzap.io.config import ZzConfig
+
+
+class BlockInfo:
+    """Location and sizes of one encoded block in a block container."""
+
+    __slots__ = ("offset", "bit_len", "num_chars", "num_bytes", "checkpoints")
+
+    # Fields stored in the block table, in order
+    FIELDS = ("offset", "bit_len", "num_chars", "num_bytes")
+
+    def __init__(
+        self,
+        offset: int,
+        bit_len: int,
+        num_chars: int,
+        num_bytes: int,
+        checkpoints: Optional[list[int]] = None,
+    ):
+        self.offset = offset  # byte offset of the block from the start of the data
+        self.bit_len = bit_len  # bits of encoded data in the block
+        self.num_chars = num_chars  # characters the block decodes to
+        self.num_bytes = num_bytes  # UTF-8 bytes the block decodes to
+        # Bit offsets in the block of every index interval of characters
+        self.checkpoints = [] if checkpoints is None else checkpoints
+
+    @property
+    def data_len(self) -> int:
+        """Return the number of bytes the encoded block takes."""
+        return (self.bit_len + 7) // 8
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, BlockInfo) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{self.__class__.__name__}({fields})"
+
+
+def num_checkpoints(num_chars: int, index_interval: int) -> int:
+    """Return the number of checkpoints of a block, one per interval after its start."""
+    if index_interval <= 0 or num_chars <= 0:
+        return 0
+    return (num_chars - 1) // index_interval
+
+
+def write_block_table(f: BinaryIO, blocks: list[BlockInfo]) -> None:
+    """Write one fixed-size row of fields per block."""
+    for block in blocks:
+        for name in BlockInfo.FIELDS:
+            f.write(getattr(block, name).to_bytes(ZzConfig.BLOCK_FIELD_SIZE, "big"))
+
+
+def read_block_table(f: ByteSource, num_blocks: int) -> list[BlockInfo]:
+    """Read num_blocks rows written by write_block_table."""
+    row_size = len(BlockInfo.FIELDS) * ZzConfig.BLOCK_FIELD_SIZE
+    data = f.read(num_blocks * row_size)
+    if len(data) != num_blocks * row_size:
+        raise ValueError("Block table is truncated")
+
+    blocks = []
+    for start in range(0, len(data), row_size):
+        offset, bit_len, num_chars, num_bytes = (
+            int.from_bytes(data[i : i + ZzConfig.BLOCK_FIELD_SIZE], "big")
+            for i in range(start, start + row_size, ZzConfig.BLOCK_FIELD_SIZE)
+        )
+        blocks.append(
+            BlockInfo(
+                offset=offset, bit_len=bit_len, num_chars=num_chars, num_bytes=num_bytes
+            )
+        )
+    return blocks
+
+
+def write_seek_index(f: BinaryIO, blocks: list[BlockInfo]) -> None:
+    """Write the checkpoints of every block."""
+    for block in blocks:
+        for bit_pos in block.checkpoints:
+            f.write(bit_pos.to_bytes(ZzConfig.CHECKPOINT_SIZE, "big"))
+
+
+def read_seek_index(
+    f: ByteSource, blocks: list[BlockInfo], index_interval: int
+) -> None:
+    """Read the checkpoints written by write_seek_index into blocks."""
+    counts = [num_checkpoints(block.num_chars, index_interval) for block in blocks]
+    data = f.read(sum(counts) * ZzConfig.CHECKPOINT_SIZE)
+    if len(data) != sum(counts) * ZzConfig.CHECKPOINT_SIZE:
+        raise ValueError("Seek index is truncated")
+
+    pos = 0
+    for block, count in zip(blocks, counts):
+        end = pos + count * ZzConfig.CHECKPOINT_SIZE
+        block.checkpoints = [
+            int.from_bytes(data[i : i + ZzConfig.CHECKPOINT_SIZE], "big")
+            for i in range(pos, end, ZzConfig.CHECKPOINT_SIZE)
+        ]
+        pos = end
@@ -0,0 +1,9 @@
+from typing import Protocol
+
+
+class ByteSource(Protocol):
+    """Anything headers can be read from: a binary file, or an mmap of one."""
+
+    def read(self, size: int = ..., /) -> bytes: ...
+
+    def seek(self, pos: int, /) -> object: ...
@@ -0,0 +1,86 @@
+import codecs
+from pathlib import Path
+from typing import Iterator, Optional
+
+CHUNK_SIZE = 1 << 20  # characters read per chunk
+SAMPLE_CHUNK_SIZE = 1 << 16  # bytes read at each sampled position
+
+
+def read_text_chunks(
+    file_path: str | Path, chunk_size: int = CHUNK_SIZE
+) -> Iterator[str]:
+    """Yield the text of a file in chunks of at most chunk_size characters."""
+    with Path(file_path).open("r", encoding="utf-8-sig", errors="replace") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def read_byte_chunks(
+    file_path: str | Path, chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yield the raw bytes of a file in chunks of at most chunk_size bytes."""
+    with Path(file_path).open("rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def read_sampled_chunks(
+    file_path: str | Path, rate: float, chunk_size: int = SAMPLE_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """Yield chunks of up to chunk_size bytes spread evenly over a file.
+
+    About rate of the file is read, seeking past the bytes in between.
+    """
+    if not 0 < rate <= 1:
+        raise ValueError("Sample rate must be in (0, 1]")
+    path = Path(file_path)
+    size = path.stat().st_size
+    # Small samples of small files take a single shorter chunk
+    chunk_size = min(chunk_size, max(round(size * rate), 1))
+    stride = max(chunk_size, round(chunk_size / rate))
+
+    with path.open("rb") as f:
+        for pos in range(0, size, stride):
+            f.seek(pos)
+            yield f.read(chunk_size)
+
+
+def decode_sample(chunk: bytes, at_start: bool = False) -> str:
+    """Decode a chunk cut from a UTF-8 file, like read_text_chunks would.
+
+    Characters cut off at either end are dropped. at_start marks the first chunk
+    of the file, whose byte order mark is dropped.
+    """
+    # Skip the continuation bytes of a character cut off at the start
+    start = 0
+    while start < min(len(chunk), 3) and chunk[start] & 0xC0 == 0x80:
+        start += 1
+
+    # A non-final decode holds back a character cut off at the end
+    decoder = codecs.getincrementaldecoder("utf-8-sig" if at_start else "utf-8")(
+        errors="replace"
+    )
+    text = decoder.decode(chunk[start:])
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def read_sampled_text_chunks(
+    file_path: str | Path, rate: float, chunk_size: int = SAMPLE_CHUNK_SIZE
+) -> Iterator[str]:
+    """Yield the text of chunks spread evenly over a UTF-8 file."""
+    for i, chunk in enumerate(read_sampled_chunks(file_path, rate, chunk_size)):
+        yield decode_sample(chunk, at_start=i == 0)
+
+
+def sample_rate(
+    file_path: str | Path, rate: Optional[float] = None, budget: Optional[int] = None
+) -> float:
+    """Return the given sample rate, or the one reading about budget bytes of a file."""
+    if rate is not None and budget is None:
+        return rate
+    if rate is not None or budget is None:
+        raise ValueError("Give either a sample rate or a byte budget")
+    if budget <= 0:
+        raise ValueError("Sample budget must be positive")
+    size = Path(file_path).stat().st_size
+    return min(budget / size, 1.0) if size else 1.0
@@ -0,0 +1,206 @@
+from zipzap.compressor.code_lengths import compute_limited_code_lengths
+from zipzap.compressor.codebook import compute_code_pairs
+from zipzap.compressor.decode_table import DecodeTable
+from zipzap.ds.bits.bit_stream import BitStream
+from zipzap.ds.maps.dense_char_map import DenseCharMap
+from zipzap.ds.maps.map import Map
+from zipzap.io.header import pack_varint, unpack_varint
+
+# Code length alphabet, after DEFLATE's: symbols up to MAX_LITERAL_LEN are code
+# lengths themselves, the others are followed by extra bits holding a value
+MAX_LITERAL_LEN = 15  # longest code length written as a literal symbol
+REPEAT_SHORT = 16  # repeat the previous code length 3-6 times
+REPEAT_LONG = 17  # repeat the previous code length 7-134 times
+LONG_LEN = 18  # a code length of 16-271
+NUM_TABLE_SYMBOLS = 19  # size of the code length alphabet
+EXTRA = {REPEAT_SHORT: (2, 3), REPEAT_LONG: (7, 7), LONG_LEN: (8, 16)}  # bits, base
+
+# Alphabet code lengths are written in this order, rarely used ones last, so that
+# trailing unused symbols can be left out
+TABLE_ORDER = (16, 17, 18, 0, 8, 7, 9, 6, 10, 5, 11, 4, 12, 3, 13, 2, 14, 1, 15)
+MIN_TABLE_LENS = 4  # alphabet code lengths always written
+COUNT_BITS = 4  # bits to store the number of alphabet code lengths written
+TABLE_LEN_BITS = 3  # bits per alphabet code length
+MAX_TABLE_LEN = 7  # longest code of the code length alphabet
+MAX_CODEPOINT = 0x10FFFF  # largest Unicode codepoint
+
+
+def encode_code_table(code_lengths: Map[str, int]) -> bytes:
+    """Return the code length table in its compact form.
+
+    Symbols are sorted by codepoint and written as runs of consecutive codepoints,
+    each a varint gap from the previous run and a varint length. Their code lengths
+    follow in the same order as a bitstream, run-length coded in the code length
+    alphabet, whose symbols are Huffman coded in turn.
+    """
+    symbols = sorted((ord(char), length) for char, length in code_lengths.entries())
+
+    # Group consecutive codepoints into runs of [first, last]
+    runs: list[list[int]] = []
+    for codepoint, _ in symbols:
+        if runs and codepoint == runs[-1][1] + 1:
+            runs[-1][1] = codepoint
+        else:
+            runs.append([codepoint, codepoint])
+
+    out = bytearray(pack_varint(len(runs)))
+    prev = -2  # last codepoint of the previous run
+    for first, last in runs:
+        # Runs are at least one codepoint apart
+        out += pack_varint(first - prev - 2)
+        out += pack_varint(last - first)
+        prev = last
+
+    if not symbols:
+        return bytes(out)
+
+    tokens = _tokenize([length for _, length in symbols])
+
+    # Huffman code the alphabet, giving a lone symbol a 1 bit code
+    counts = [0] * NUM_TABLE_SYMBOLS
+    for symbol, _ in tokens:
+        counts[symbol] += 1
+    freq_table = DenseCharMap[int].from_items(
+        ((chr(symbol), count) for symbol, count in enumerate(counts) if count),
+        unique=True,
+    )
+    table_lens = [0] * NUM_TABLE_SYMBOLS
+    for char, length in compute_limited_code_lengths(
+        freq_table, MAX_TABLE_LEN
+    ).entries():
+        table_lens[ord(char)] = max(length, 1)
+
+    # Write the alphabet code lengths, leaving out trailing unused ones
+    count = NUM_TABLE_SYMBOLS
+    while count > MIN_TABLE_LENS and table_lens[TABLE_ORDER[count - 1]] == 0:
+        count -= 1
+    bits = BitStream().append_bits(count - MIN_TABLE_LENS, COUNT_BITS)
+    for symbol in TABLE_ORDER[:count]:
+        bits.append_bits(table_lens[symbol], TABLE_LEN_BITS)
+
+    # Write the coded lengths
+    pairs = compute_code_pairs(_table_code_lengths(table_lens))
+    for symbol, value in tokens:
+        pair = pairs.get(chr(symbol))
+        assert pair is not None  # every symbol used has a nonzero length
+        code, length = pair
+        bits.append_bits(code, length)
+        if symbol in EXTRA:
+            nbits, base = EXTRA[symbol]
+            bits.append_bits(value - base, nbits)
+
+    out += bits.to_memoryview()
+    return bytes(out)
+
+
+def decode_code_table(data: bytes | bytearray | memoryview) -> Map[str, int]:
+    """Return the code lengths of a table written by encode_code_table."""
+    num_runs, pos = unpack_varint(data, 0)
+    codepoints: list[int] = []
+    prev = -2
+    for _ in range(num_runs):
+        gap, pos = unpack_varint(data, pos)
+        span, pos = unpack_varint(data, pos)
+        first = prev + 2 + gap
+        prev = first + span
+        if prev > MAX_CODEPOINT:
+            raise ValueError("Code length table is corrupt")
+        codepoints.extend(range(first, prev + 1))
+
+    if not codepoints:
+        return DenseCharMap[int]()
+
+    bits = BitStream.from_buffer(data, bit_offset=8 * pos)
+    try:
+        lengths = _read_lengths(bits, len(codepoints))
+    except IndexError as e:
+        raise ValueError("Code length table is truncated") from e
+
+    return DenseCharMap[int].from_items(
+        ((chr(codepoint), length) for codepoint, length in zip(codepoints, lengths)),
+        unique=True,
+    )
+
+
+def _tokenize(lengths: list[int]) -> list[tuple[int, int]]:
+    """Return the code lengths as (alphabet symbol, value) pairs.
+
+    The value is the code length for literals and LONG_LEN, and the repeat count for
+    REPEAT_SHORT and REPEAT_LONG.
+    """
+    tokens: list[tuple[int, int]] = []
+    i = 0
+    while i < len(lengths):
+        length = lengths[i]
+        if length <= MAX_LITERAL_LEN:
+            tokens.append((length, length))
+        elif length < EXTRA[LONG_LEN][1] + (1 << EXTRA[LONG_LEN][0]):
+            tokens.append((LONG_LEN, length))
+        else:
+            raise ValueError(f"Code length {length} is too long to store")
+        i += 1
+
+        # Repeat it as long as the following code lengths match
+        run = 0
+        while i + run < len(lengths) and lengths[i + run] == length:
+            run += 1
+        while run >= EXTRA[REPEAT_SHORT][1]:
+            symbol = REPEAT_LONG if run >= EXTRA[REPEAT_LONG][1] else REPEAT_SHORT
+            nbits, base = EXTRA[symbol]
+            repeat = min(run, base + (1 << nbits) - 1)
+            tokens.append((symbol, repeat))
+            run -= repeat
+            i += repeat
+
+    return tokens
+
+
+def _table_code_lengths(table_lens: list[int]) -> Map[str, int]:
+    """Return the code lengths of the used alphabet symbols, keyed by chr(symbol)."""
+    return DenseCharMap[int].from_items(
+        ((chr(symbol), length) for symbol, length in enumerate(table_lens) if length),
+        unique=True,
+    )
+
+
+def _read_lengths(bits: BitStream, num_symbols: int) -> list[int]:
+    """Read the coded code lengths of num_symbols symbols from bits."""
+    count = bits.read_bits(0, COUNT_BITS) + MIN_TABLE_LENS
+    pos = COUNT_BITS
+    table_lens = [0] * NUM_TABLE_SYMBOLS
+    for symbol in TABLE_ORDER[:count]:
+        table_lens[symbol] = bits.read_bits(pos, TABLE_LEN_BITS)
+        pos += TABLE_LEN_BITS
+
+    # The alphabet code must be a valid prefix code
+    kraft = sum(1 << (MAX_TABLE_LEN - length) for length in table_lens if length)
+    if kraft == 0 or kraft > 1 << MAX_TABLE_LEN:
+        raise ValueError("Code length table is corrupt")
+
+    decode_table = DecodeTable(_table_code_lengths(table_lens))
+    table, table_bits = decode_table.table, decode_table.bits
+
+    lengths: list[int] = []
+    while len(lengths) < num_symbols:
+        char, length = table[bits.peek_bits(pos, table_bits)]
+        if char is None:
+            raise ValueError("Code length table is corrupt")
+        pos += length
+        symbol = ord(char)
+
+        value = symbol
+        if symbol in EXTRA:
+            nbits, base = EXTRA[symbol]
+            value = bits.read_bits(pos, nbits) + base
+            pos += nbits
+
+        if symbol in (REPEAT_SHORT, REPEAT_LONG):
+            if not lengths:
+                raise ValueError("Code length table is corrupt")
+            lengths.extend([lengths[-1]] * value)
+        else:
+            lengths.append(value)
+
+    if len(lengths) != num_symbols or pos > len(bits):
+        raise ValueError("Code length table is corrupt")
+    return lengths
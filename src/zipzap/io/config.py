@@ -1,7 +1,28 @@
 class ZzConfig:
     """Shared configuration for .zz file format."""
 
+    # Versioned header: every file written starts with the magic and version
+    MAGIC = b"\x89ZZ"  # marks a versioned file (legacy plain files have none)
+    VERSION = 1  # layout version written
+    MIN_VERSION = 1  # oldest layout version still readable
+    VERSION_SIZE = 1  # bytes to store the layout version
+    FLAGS_SIZE = 1  # bytes to store the layout flags
+    FLAG_BLOCKS = 1  # data is split into blocks with a block table
+    FLAG_BYTES = 2  # symbols are byte values stored as Latin-1 characters
+    FLAG_SIZES = 4  # decoded lengths in characters and bytes follow the bit length
+    FLAG_STORED = 8  # data is the input stored verbatim, the code length table empty
+    # Lengths and sizes are stored as varints (LEB128), and the code lengths in a
+    # compact table (see code_table)
+
+    PADDED_VARINT_SIZE = 10  # bytes reserved for a varint filled in after the data
+    BLOCK_FIELD_SIZE = 8  # bytes per block table field (offset, bits, chars, bytes)
+    CHECKPOINT_SIZE = 8  # bytes to store the bit offset of a checkpoint in its block
+
+    # Legacy headerless plain files, still readable
     NUM_CHARS_SIZE = 2  # bytes to store number of unique characters
     CHAR_LEN_SIZE = 2  # bytes to store UTF-8 length of a character
     CODE_LEN_SIZE = 2  # bytes to store bit length of the character's canonical code
     BIT_LEN_SIZE = 4  # bytes to store total bits of encoded data
+
+    WRITE_BUFFER_SIZE = 1 << 16  # bytes buffered before encoded data hits the disk
+    READ_CHUNK_SIZE = 1 << 16  # bytes of encoded data read at a time when streaming
@@ -0,0 +1,102 @@
+from typing import BinaryIO, Optional
+
+from zipzap.ds.maps.map import Map
+from zipzap.io.block_table import BlockInfo
+from zipzap.io.byte_source import ByteSource
+
+
+class ZzHeader:
+    """Everything a .zz file stores ahead of its encoded data."""
+
+    __slots__ = (
+        "version",
+        "code_lengths",
+        "bit_len",
+        "blocks",
+        "index_interval",
+        "is_container",
+        "is_bytes",
+        "is_stored",
+        "num_chars",
+        "num_bytes",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        code_lengths: Map[str, int],
+        bit_len: int,
+        blocks: Optional[list[BlockInfo]] = None,
+        index_interval: int = 0,
+        is_container: bool = False,
+        is_bytes: bool = False,
+        is_stored: bool = False,
+        num_chars: Optional[int] = None,
+        num_bytes: Optional[int] = None,
+    ):
+        self.version = version  # layout version, 0 for plain files without a magic
+        self.code_lengths = code_lengths
+        self.bit_len = bit_len  # bits of encoded data, over all blocks
+        self.blocks = [] if blocks is None else blocks
+        self.index_interval = index_interval  # 0 if there is no seek index
+        self.is_container = is_container  # whether the data is split into blocks
+        self.is_bytes = is_bytes  # whether the data decodes to raw bytes
+        self.is_stored = is_stored  # whether the data is the input stored verbatim
+        # Decoded length in characters and in bytes, None if not stored
+        if is_container and num_chars is None:
+            num_chars = sum(block.num_chars for block in self.blocks)
+            num_bytes = sum(block.num_bytes for block in self.blocks)
+        self.num_chars = num_chars
+        self.num_bytes = num_bytes
+
+
+def pack_varint(value: int, width: Optional[int] = None) -> bytes:
+    """Return a non-negative integer 7 bits per byte, low bits first (LEB128).
+
+    If width is given, the varint is padded to exactly width bytes with redundant
+    continuation bytes, so that it can be overwritten in place later.
+    """
+    if value < 0:
+        raise ValueError("Varints must not be negative")
+    out = bytearray()
+    while value > 0x7F or (width is not None and len(out) < width - 1):
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    if width is not None and len(out) > width:
+        raise ValueError(f"Value does not fit in a varint of {width} bytes")
+    return bytes(out)
+
+
+def unpack_varint(data: bytes | bytearray | memoryview, pos: int) -> tuple[int, int]:
+    """Return the varint at byte pos of data and the position after it."""
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError("Header is truncated")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def write_varint(f: BinaryIO, value: int) -> None:
+    """Write a varint to f."""
+    f.write(pack_varint(value))
+
+
+def read_varint(f: ByteSource) -> int:
+    """Read a varint from f."""
+    value = 0
+    shift = 0
+    while True:
+        byte = f.read(1)
+        if not byte:
+            raise ValueError("Header is truncated")
+        value |= (byte[0] & 0x7F) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
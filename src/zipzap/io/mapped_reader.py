@@ -0,0 +1,118 @@
+import io
+import mmap
+from pathlib import Path
+from typing import Iterator, Optional
+
+from zipzap.ds.bits.bit_stream import BitStream
+from zipzap.ds.maps.map import Map
+from zipzap.io.block_table import BlockInfo, read_seek_index
+from zipzap.io.config import ZzConfig
+from zipzap.io.header import ZzHeader
+from zipzap.io.reader import ZzReader
+
+
+class MappedZzReader(ZzReader):
+    """Reads a .zz file through a read-only memory map.
+
+    The header is parsed once, straight from the map, when the reader is created.
+    Encoded data is handed out as memoryviews of the map rather than copies, so the
+    OS pages it in only as decoders touch it. Views must be released before close.
+    """
+
+    def __init__(self, file_path: str | Path):
+        super().__init__(file_path)
+        self._file = self.file_path.open("rb")
+        # Empty files cannot be mapped, and hold no data anyway
+        empty = self.file_path.stat().st_size == 0
+        self._map = (
+            None
+            if empty
+            else mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        )
+
+        source = io.BytesIO() if self._map is None else self._map
+        self._header = self._read_header(source)
+        self._data_start = source.tell()
+        self._index_read = False
+
+    @property
+    def buffer(self) -> memoryview:
+        """Return a read-only view of the whole mapped file."""
+        return memoryview(b"" if self._map is None else self._map).toreadonly()
+
+    def close(self) -> None:
+        """Unmap and close the file, raising BufferError while views are in use."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self) -> "MappedZzReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self.close()
+        except BufferError:
+            # The traceback of the error raised still holds views of the map, so
+            # leave it to be unmapped once they go rather than hide that error
+            if exc_type is None:
+                raise
+            self._map = None
+            self._file.close()
+
+    def read(self) -> tuple[BitStream, Map[str, int]]:
+        self._check_encoded(self._header)
+        if not self._header.is_container:
+            return self.bits(), self._header.code_lengths
+
+        # Blocks are byte-aligned, so join them bit by bit without the padding
+        encoded = BitStream()
+        for block in self._header.blocks:
+            encoded.extend(self.bits(block))
+        return encoded, self._header.code_lengths
+
+    def read_header_info(self) -> ZzHeader:
+        return self._header
+
+    def read_index(self) -> tuple[int, list[BlockInfo]]:
+        header = self._header
+        if header.index_interval and not self._index_read and self._map is not None:
+            # The seek index follows the encoded data
+            self._map.seek(self._data_start + self._data_len())
+            read_seek_index(self._map, header.blocks, header.index_interval)
+            self._index_read = True
+        return header.index_interval, header.blocks
+
+    def read_data(
+        self,
+        chunk_size: int = ZzConfig.READ_CHUNK_SIZE,
+        block: Optional[BlockInfo] = None,
+        start: int = 0,
+    ) -> Iterator[memoryview]:
+        """Yield views of the encoded data, or only that of block, chunk by chunk."""
+        data = self._data_view(block)
+        for pos in range(start, len(data), chunk_size):
+            yield data[pos : pos + chunk_size]
+
+    def bits(self, block: Optional[BlockInfo] = None) -> BitStream:
+        """Return a zero-copy view of the encoded bits, or only those of block."""
+        data = self._data_view(block)
+        bit_len = self._header.bit_len if block is None else block.bit_len
+        return BitStream.from_buffer(data, bit_len)
+
+    def _data_view(self, block: Optional[BlockInfo]) -> memoryview:
+        """Return a view of the encoded data, or only that of block."""
+        start = self._data_start
+        if block is None:
+            end = start + self._data_len()
+        else:
+            start += block.offset
+            end = start + block.data_len
+        return self.buffer[start:end]
+
+    def _data_len(self) -> int:
+        """Return the number of bytes of encoded data."""
+        if not self._header.is_container:
+            return (self._header.bit_len + 7) // 8
+        return sum(block.data_len for block in self._header.blocks)
@@ -1,9 +1,14 @@
 from pathlib import Path
+from typing import Iterator, Optional
 
 from zipzap.ds.bits.bit_stream import BitStream
+from zipzap.ds.maps.dense_char_map import DenseCharMap
 from zipzap.ds.maps.map import Map
-from zipzap.ds.maps.probe_hashmap import ProbeHashmap
+from zipzap.io.block_table import BlockInfo, read_block_table, read_seek_index
+from zipzap.io.byte_source import ByteSource
+from zipzap.io.code_table import decode_code_table
 from zipzap.io.config import ZzConfig
+from zipzap.io.header import ZzHeader, read_varint
 
 
 class ZzReader:
@@ -16,22 +21,162 @@ class ZzReader:
             raise FileNotFoundError(f"File not found: {file_path}")
 
     def read(self) -> tuple[BitStream, Map[str, int]]:
+        """Return the encoded bits and code lengths.
+
+        Stored files hold the input itself rather than encoded bits, so reading
+        one raises ValueError. Their data is read with read_data instead.
+        """
+        with self.file_path.open("rb") as f:
+            header = self._read_header(f)
+            self._check_encoded(header)
+
+            if not header.is_container:
+                # Wrap the data read without copying it again
+                data = f.read((header.bit_len + 7) // 8)
+                return BitStream.from_buffer(data, header.bit_len), header.code_lengths
+
+            # Blocks are byte-aligned, so join them bit by bit without the padding
+            encoded = BitStream()
+            for block in header.blocks:
+                block_data = f.read(block.data_len)
+                encoded.extend(BitStream.from_bytearray(block_data, block.bit_len))
+            return encoded, header.code_lengths
+
+    def read_header(self) -> tuple[Map[str, int], int]:
+        """Return the code lengths and bit length without reading the encoded data."""
+        header = self.read_header_info()
+        return header.code_lengths, header.bit_len
+
+    def read_header_info(self) -> ZzHeader:
+        """Return everything stored in the header, e.g. the decoded length."""
+        with self.file_path.open("rb") as f:
+            return self._read_header(f)
+
+    def is_bytes(self) -> bool:
+        """Return whether the file was written in byte mode and decodes to raw bytes."""
+        return self.read_header_info().is_bytes
+
+    def read_block_table(self) -> list[BlockInfo]:
+        """Return the blocks of a block container, or an empty list for a plain file."""
+        return self.read_header_info().blocks
+
+    def read_index(self) -> tuple[int, list[BlockInfo]]:
+        """Return the seek index interval and the blocks with their checkpoints.
+
+        An interval of 0 means the file has no seek index.
+        """
+        with self.file_path.open("rb") as f:
+            header = self._read_header(f)
+            if header.index_interval:
+                # The seek index follows the encoded data
+                f.seek(sum(block.data_len for block in header.blocks), 1)
+                read_seek_index(f, header.blocks, header.index_interval)
+            return header.index_interval, header.blocks
+
+    def read_data(
+        self,
+        chunk_size: int = ZzConfig.READ_CHUNK_SIZE,
+        block: Optional[BlockInfo] = None,
+        start: int = 0,
+    ) -> Iterator[bytes | memoryview]:
+        """Yield the encoded data, or only that of block, in chunks of chunk_size bytes.
+
+        Reading begins start bytes into the data or block.
+        """
         with self.file_path.open("rb") as f:
-            code_lengths = ProbeHashmap[str, int]()
+            header = self._read_header(f)
+
+            if block is None:
+                f.seek(start, 1)
+                if header.is_container:
+                    left = sum(b.data_len for b in header.blocks) - start
+                else:
+                    left = (header.bit_len + 7) // 8 - start
+            else:
+                f.seek(block.offset + start, 1)
+                left = block.data_len - start
+
+            while left > 0 and (chunk := f.read(min(chunk_size, left))):
+                left -= len(chunk)
+                yield chunk
+
+    @staticmethod
+    def _check_encoded(header: ZzHeader) -> None:
+        """Raise ValueError if the file is stored as is instead of encoded."""
+        if header.is_stored:
+            raise ValueError("File is stored as is, read its data with read_data")
+
+    def _read_header(self, f: ByteSource) -> ZzHeader:
+        """Read the header of any supported layout. Leaves f at the encoded data."""
+        magic = f.read(len(ZzConfig.MAGIC))
+
+        if magic != ZzConfig.MAGIC:
+            # Legacy plain files have no magic number
+            f.seek(0)
+            return self._read_legacy_plain(f)
+
+        version = int.from_bytes(f.read(ZzConfig.VERSION_SIZE), "big")
+        if not ZzConfig.MIN_VERSION <= version <= ZzConfig.VERSION:
+            raise ValueError(f"Unsupported .zz version: {version}")
+
+        flags = int.from_bytes(f.read(ZzConfig.FLAGS_SIZE), "big")
+        code_lengths = self._read_code_table(f)
+        is_bytes = bool(flags & ZzConfig.FLAG_BYTES)
+
+        if flags & ZzConfig.FLAG_BLOCKS:
+            num_blocks = read_varint(f)
+            index_interval = read_varint(f)
+            blocks = read_block_table(f, num_blocks)
+            return ZzHeader(
+                version,
+                code_lengths,
+                sum(block.bit_len for block in blocks),
+                blocks,
+                index_interval,
+                is_container=True,
+                is_bytes=is_bytes,
+            )
+
+        bit_len = read_varint(f)
+        num_chars = num_bytes = None
+        if flags & ZzConfig.FLAG_SIZES:
+            num_chars = read_varint(f)
+            num_bytes = read_varint(f)
+        return ZzHeader(
+            version,
+            code_lengths,
+            bit_len,
+            is_bytes=is_bytes,
+            is_stored=bool(flags & ZzConfig.FLAG_STORED),
+            num_chars=num_chars,
+            num_bytes=num_bytes,
+        )
+
+    def _read_legacy_plain(self, f: ByteSource) -> ZzHeader:
+        """Read a headerless plain file, with fixed-size fields and no magic."""
+        code_lengths = self._read_legacy_code_lengths(f)
+        bit_len = int.from_bytes(f.read(ZzConfig.BIT_LEN_SIZE), "big")
+        return ZzHeader(0, code_lengths, bit_len)
 
-            # Read number of unique characters
-            num_chars = int.from_bytes(f.read(ZzConfig.NUM_CHARS_SIZE), "big")
+    def _read_code_table(self, f: ByteSource) -> Map[str, int]:
+        """Read the compact code length table in a single read."""
+        size = read_varint(f)
+        data = f.read(size)
+        if len(data) != size:
+            raise ValueError("Header is truncated")
+        return decode_code_table(data)
 
-            # Read code lengths
-            for _ in range(num_chars):
-                char_len = int.from_bytes(f.read(ZzConfig.CHAR_LEN_SIZE), "big")
-                char = f.read(char_len).decode("utf-8")
-                code_len = int.from_bytes(f.read(ZzConfig.CODE_LEN_SIZE), "big")
-                code_lengths.put(char, code_len)
+    def _read_legacy_code_lengths(self, f: ByteSource) -> Map[str, int]:
+        """Read the code length table of headerless files, with fixed-size fields."""
+        # Read number of unique characters
+        num_chars = int.from_bytes(f.read(ZzConfig.NUM_CHARS_SIZE), "big")
 
-            # Read bit length and encoded data
-            bit_len = int.from_bytes(f.read(ZzConfig.BIT_LEN_SIZE), "big")
-            data = bytearray(f.read())
-            encoded = BitStream.from_bytearray(data, bit_len)
+        # Read code lengths
+        items = []
+        for _ in range(num_chars):
+            char_len = int.from_bytes(f.read(ZzConfig.CHAR_LEN_SIZE), "big")
+            char = f.read(char_len).decode("utf-8")
+            code_len = int.from_bytes(f.read(ZzConfig.CODE_LEN_SIZE), "big")
+            items.append((char, code_len))
 
-            return encoded, code_lengths
+        return DenseCharMap[int].from_items(items)
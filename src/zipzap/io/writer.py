@@ -1,8 +1,18 @@
 from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Optional
 
 from zipzap.ds.bits.bit_stream import BitStream
+from zipzap.ds.maps.dense_char_map import DenseCharMap
 from zipzap.ds.maps.map import Map
+from zipzap.io.block_table import (
+    BlockInfo,
+    num_checkpoints,
+    write_block_table,
+    write_seek_index,
+)
+from zipzap.io.code_table import encode_code_table
 from zipzap.io.config import ZzConfig
+from zipzap.io.header import pack_varint, write_varint
 
 
 class ZzWriter:
@@ -14,20 +24,196 @@ class ZzWriter:
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
 
     def write(self, encoded: BitStream, code_lengths: Map[str, int]) -> None:
-        data = encoded.to_bytearray()
-        bit_len = len(encoded)
-
-        with self.file_path.open("wb") as f:
-            # Write number of unique characters
-            f.write(len(code_lengths).to_bytes(ZzConfig.NUM_CHARS_SIZE, "big"))
-
-            # Write code lengths
-            for char, code_len in code_lengths.entries():
-                char_bytes = char.encode("utf-8")
-                f.write(len(char_bytes).to_bytes(ZzConfig.CHAR_LEN_SIZE, "big"))
-                f.write(char_bytes)
-                f.write(code_len.to_bytes(ZzConfig.CODE_LEN_SIZE, "big"))
-
-            # Write bit length and encoded data
-            f.write(bit_len.to_bytes(ZzConfig.BIT_LEN_SIZE, "big"))
-            f.write(data)
+        self.write_stream([encoded.to_memoryview()], len(encoded), code_lengths)
+
+    def write_stream(
+        self,
+        data: Iterable[bytes | bytearray | memoryview],
+        bit_len: int,
+        code_lengths: Map[str, int],
+        is_bytes: bool = False,
+        num_chars: Optional[int] = None,
+        num_bytes: Optional[int] = None,
+    ) -> None:
+        """Write encoded data chunk by chunk as it is produced.
+
+        If is_bytes, the file is marked as byte mode, decoding to raw bytes.
+        If given, the decoded length in characters and bytes is stored too.
+        """
+        flags = ZzConfig.FLAG_BYTES if is_bytes else 0
+        self._write_plain(data, bit_len, code_lengths, flags, num_chars, num_bytes)
+
+    def write_stream_unsized(
+        self,
+        data: Iterable[bytes | bytearray | memoryview],
+        code_lengths: Map[str, int],
+        sizes: Callable[[], tuple[int, int, int]],
+        is_bytes: bool = False,
+    ) -> None:
+        """Write encoded data whose lengths are only known once it is all encoded.
+
+        Padded varints are reserved for the bit length and decoded lengths, then
+        filled in with the (bit length, characters, bytes) that sizes returns after
+        data is exhausted. Used when the code comes from a sample of the input.
+        """
+        written = 0
+
+        with self.file_path.open("wb", buffering=ZzConfig.WRITE_BUFFER_SIZE) as f:
+            flags = ZzConfig.FLAG_SIZES | (ZzConfig.FLAG_BYTES if is_bytes else 0)
+            self._write_preamble(f, flags, code_lengths)
+
+            # Reserve the lengths, then write encoded data
+            sizes_pos = f.tell()
+            f.write(bytes(3 * ZzConfig.PADDED_VARINT_SIZE))
+            for chunk in data:
+                f.write(chunk)
+                written += len(chunk)
+
+            bit_len, num_chars, num_bytes = sizes()
+            if written != (bit_len + 7) // 8:
+                raise ValueError(
+                    f"Expected {(bit_len + 7) // 8} bytes of encoded data, got {written}"
+                )
+
+            f.seek(sizes_pos)
+            for value in (bit_len, num_chars, num_bytes):
+                f.write(pack_varint(value, ZzConfig.PADDED_VARINT_SIZE))
+
+    def write_stored(
+        self,
+        data: Iterable[bytes | bytearray | memoryview],
+        num_chars: int,
+        num_bytes: int,
+        is_bytes: bool = False,
+    ) -> None:
+        """Write the input bytes verbatim, for input Huffman coding would not shrink.
+
+        The file has an empty code length table and its data decodes to itself, so
+        it is at most a few header bytes larger than the input.
+        """
+        flags = ZzConfig.FLAG_STORED | (ZzConfig.FLAG_BYTES if is_bytes else 0)
+        self._write_plain(
+            data, 8 * num_bytes, DenseCharMap[int](), flags, num_chars, num_bytes
+        )
+
+    @staticmethod
+    def header_size(
+        code_lengths: Map[str, int],
+        bit_len: int,
+        num_chars: Optional[int] = None,
+        num_bytes: Optional[int] = None,
+    ) -> int:
+        """Return the bytes write_stream (or write_stored) writes ahead of the data."""
+        table_size = len(encode_code_table(code_lengths))
+        lengths = [table_size, bit_len]
+        if num_chars is not None and num_bytes is not None:
+            lengths += [num_chars, num_bytes]
+        return (
+            len(ZzConfig.MAGIC)
+            + ZzConfig.VERSION_SIZE
+            + ZzConfig.FLAGS_SIZE
+            + table_size
+            + sum(len(pack_varint(value)) for value in lengths)
+        )
+
+    def _write_plain(
+        self,
+        data: Iterable[bytes | bytearray | memoryview],
+        bit_len: int,
+        code_lengths: Map[str, int],
+        flags: int,
+        num_chars: Optional[int],
+        num_bytes: Optional[int],
+    ) -> None:
+        """Write a file without blocks, with the given layout flags."""
+        expected_bytes = (bit_len + 7) // 8
+        written = 0
+        sizes = (
+            (num_chars, num_bytes)
+            if num_chars is not None and num_bytes is not None
+            else None
+        )
+
+        with self.file_path.open("wb", buffering=ZzConfig.WRITE_BUFFER_SIZE) as f:
+            if sizes is not None:
+                flags |= ZzConfig.FLAG_SIZES
+            self._write_preamble(f, flags, code_lengths)
+
+            # Write bit length, decoded lengths and encoded data
+            write_varint(f, bit_len)
+            if sizes is not None:
+                write_varint(f, sizes[0])
+                write_varint(f, sizes[1])
+            for chunk in data:
+                f.write(chunk)
+                written += len(chunk)
+
+            if written != expected_bytes:
+                raise ValueError(
+                    f"Expected {expected_bytes} bytes of encoded data, got {written}"
+                )
+
+    def write_blocks(
+        self,
+        blocks: Iterable[tuple[bytes | bytearray, int, int, int, list[int]]],
+        num_blocks: int,
+        code_lengths: Map[str, int],
+        index_interval: int = 0,
+    ) -> None:
+        """Write a block container as blocks are produced.
+
+        Each block is (encoded data, bit length, decoded chars, decoded UTF-8 bytes,
+        checkpoints), where checkpoints are the bit offsets of every index_interval
+        characters in the block. An index_interval of 0 writes no seek index.
+        """
+        if index_interval < 0:
+            raise ValueError("Index interval must not be negative")
+        table: list[BlockInfo] = []
+        offset = 0
+
+        with self.file_path.open("wb", buffering=ZzConfig.WRITE_BUFFER_SIZE) as f:
+            self._write_preamble(f, ZzConfig.FLAG_BLOCKS, code_lengths)
+
+            # Reserve the block table, filled in once every block is written
+            write_varint(f, num_blocks)
+            write_varint(f, index_interval)
+            table_pos = f.tell()
+            write_block_table(f, [BlockInfo(0, 0, 0, 0)] * num_blocks)
+
+            for data, bit_len, num_chars, num_bytes, checkpoints in blocks:
+                block = BlockInfo(offset, bit_len, num_chars, num_bytes, checkpoints)
+                if len(data) != block.data_len:
+                    raise ValueError(
+                        f"Expected {block.data_len} bytes of encoded data, got {len(data)}"
+                    )
+                if len(checkpoints) != num_checkpoints(num_chars, index_interval):
+                    raise ValueError(
+                        "Block checkpoints do not match the index interval"
+                    )
+                table.append(block)
+                f.write(data)
+                offset += len(data)
+
+            if len(table) != num_blocks:
+                raise ValueError(f"Expected {num_blocks} blocks, got {len(table)}")
+
+            # The seek index follows the encoded data
+            write_seek_index(f, table)
+
+            f.seek(table_pos)
+            write_block_table(f, table)
+
+    def _write_preamble(
+        self, f: BinaryIO, flags: int, code_lengths: Map[str, int]
+    ) -> None:
+        """Write the magic, version, flags and code length table."""
+        f.write(ZzConfig.MAGIC)
+        f.write(ZzConfig.VERSION.to_bytes(ZzConfig.VERSION_SIZE, "big"))
+        f.write(flags.to_bytes(ZzConfig.FLAGS_SIZE, "big"))
+        self._write_code_lengths(f, code_lengths)
+
+    def _write_code_lengths(self, f: BinaryIO, code_lengths: Map[str, int]) -> None:
+        """Write the compact code length table, preceded by its size in bytes."""
+        table = encode_code_table(code_lengths)
+        write_varint(f, len(table))
+        f.write(table)
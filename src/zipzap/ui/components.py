@@ -8,6 +8,7 @@ from rich.table import Table
 from rich.text import Text
 from rich.tree import Tree
 
+from zipzap.compressor.estimate import SizeEstimate
 from zipzap.compressor.huffman_tree import HuffmanTree
 from zipzap.ds.bits.bit_stream import BitStream
 from zipzap.ds.maps.map import Map
@@ -35,6 +36,34 @@ def file_stats(input_file: Path, output_file: Path) -> Panel:
     return Panel(table, expand=False)
 
 
+def estimate_stats(estimate: SizeEstimate) -> Panel:
+    """Create a Rich Panel showing the estimated size of a .zz file."""
+
+    table = Table.grid(padding=(0, 2))
+    table.add_column(justify="left")
+    table.add_column(justify="right")
+
+    approx = "" if estimate.sample_rate is None else "~"
+    table.add_row(
+        "[cyan]Size reduction:[/cyan]", f"{approx}{100 * (1 - estimate.ratio):.2f}%"
+    )
+    table.add_row("[cyan]Original size:[/cyan]", f"{estimate.input_size} bytes")
+    table.add_row(
+        "[cyan]Compressed size:[/cyan]", f"{approx}{estimate.total_size} bytes"
+    )
+    table.add_row("[cyan]  Header:[/cyan]", f"{approx}{estimate.header_size} bytes")
+    table.add_row("[cyan]  Data:[/cyan]", f"{approx}{estimate.payload_size} bytes")
+    table.add_row(
+        "[cyan]Entropy:[/cyan]", f"{estimate.entropy_per_char:.3f} bits/symbol"
+    )
+    if estimate.stored:
+        table.add_row("[cyan]Stored as is:[/cyan]", "yes")
+    if estimate.sample_rate is not None:
+        table.add_row("[cyan]Sampled:[/cyan]", f"{100 * estimate.sample_rate:g}%")
+
+    return Panel(table, expand=False)
+
+
 def time_stats(*timers: Timer) -> Panel:
     """Create a Rich Panel showing timing stats as a single line."""
 
@@ -0,0 +1,35 @@
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+from zipzap.ds.deques.linked_deque import LinkedDeque
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+PENDING_PER_JOB = 2  # tasks queued per worker, bounding memory use
+
+
+def map_in_pool(
+    fn: Callable[[T], R],
+    items: Iterable[T],
+    jobs: int,
+    initializer: Optional[Callable[..., None]] = None,
+    initargs: tuple[Any, ...] = (),
+) -> Iterator[R]:
+    """Yield fn of each item, in order, computed in a pool of worker processes.
+
+    Items are submitted only a few per worker ahead of the results yielded, so a
+    long stream of items is never held in memory at once.
+    """
+    pending: LinkedDeque[Future[R]] = LinkedDeque()
+
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=initializer, initargs=initargs
+    ) as executor:
+        for item in items:
+            pending.add_last(executor.submit(fn, item))
+            if len(pending) >= jobs * PENDING_PER_JOB:
+                yield pending.delete_first().result()
+
+        while not pending.is_empty():
+            yield pending.delete_first().result()
@@ -0,0 +1,90 @@
+from collections import Counter
+
+import pytest
+
+from zipzap.compressor import accel
+from zipzap.compressor.bit_packer import BitPacker
+from zipzap.compressor.freq_counter import FreqCounter
+from zipzap.compressor.huffman_coder import ByteHuffmanEncoder, HuffmanEncoder
+
+pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def python_only():
+    accel.set_enabled(False)
+    yield
+    accel.set_enabled(True)
+
+
+def _pack_chunks(code_pairs, chunks) -> tuple[bytearray, int]:
+    packer = BitPacker(code_pairs)
+    data = bytearray()
+    for chunk in chunks:
+        data += packer.pack(chunk)
+    data += packer.flush()
+    return data, packer.bit_len
+
+
+def test_count_symbols():
+    text = "héllo wörld ✓ " * 1000
+    assert sorted(accel.count_symbols(text)) == sorted(Counter(text).items())
+
+    data = bytes(range(256)) * 3 + b"\x00"
+    assert sorted(accel.count_symbols(data)) == sorted(Counter(data).items())
+
+
+def test_set_enabled():
+    accel.set_enabled(False)
+    assert not accel.is_enabled()
+    assert BitPacker(HuffmanEncoder("abc").code_pairs)._arrays is None
+    accel.set_enabled(True)
+    assert accel.is_enabled()
+
+
+def test_pack_matches_python():
+    with open("test_data/alice_wonderland.txt", "r") as f:
+        text = f.read()[:50_000]
+    encoder = HuffmanEncoder(text)
+    # Odd chunk sizes leave pending bits between chunks
+    chunks = [text[i : i + 9_999] for i in range(0, len(text), 9_999)]
+
+    fast = _pack_chunks(encoder.code_pairs, chunks)
+    accel.set_enabled(False)
+    try:
+        slow = _pack_chunks(encoder.code_pairs, chunks)
+    finally:
+        accel.set_enabled(True)
+
+    assert fast == slow
+
+
+def test_pack_skips_unknown_characters():
+    encoder = HuffmanEncoder("ab" * 5000)
+    text = "axb" * 5000
+
+    data, bit_len = _pack_chunks(encoder.code_pairs, [text])
+    assert (data, bit_len) == _pack_chunks(encoder.code_pairs, [text.replace("x", "")])
+
+
+def test_pack_bytes_matches_python(python_only):
+    data = bytes(range(256)) * 40 + b"\x00\x01" * 3000
+    encoder = ByteHuffmanEncoder(data)
+    expected = _pack_chunks(encoder.byte_pairs, [data])
+
+    accel.set_enabled(True)
+    assert _pack_chunks(encoder.byte_pairs, [data[:7_777], data[7_777:]]) == expected
+
+
+def test_pack_escapes_match_python():
+    encoder = HuffmanEncoder(freq_table=FreqCounter("ab" * 100), escape=True)
+    text = "abxé😀b" * 2000
+
+    fast = _pack_chunks(encoder.code_pairs, [text[:5_001], text[5_001:]])
+    accel.set_enabled(False)
+    try:
+        slow = _pack_chunks(encoder.code_pairs, [text])
+    finally:
+        accel.set_enabled(True)
+
+    assert fast == slow
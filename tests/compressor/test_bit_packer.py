@@ -0,0 +1,71 @@
+from zipzap.compressor.bit_packer import BitPacker
+from zipzap.compressor.codebook import compute_byte_code_pairs, compute_code_pairs
+from zipzap.compressor.huffman_coder import HuffmanEncoder
+from zipzap.ds.bits.bit_stream import BitStream
+
+
+def _reference_encode(encoder: HuffmanEncoder, text: str) -> BitStream:
+    """Encode bit by bit through the BitStream codebook."""
+    bits = BitStream()
+    for c in text:
+        if code := encoder.codebook.get(c):
+            bits.extend(code)
+    return bits
+
+
+def test_code_pairs_match_codebook():
+    encoder = HuffmanEncoder("this is a huffman test")
+    pairs = compute_code_pairs(encoder.code_lengths)
+
+    assert len(pairs) == len(encoder.codebook)
+    for char, code in encoder.codebook.entries():
+        assert pairs.get(char) == (int(str(code), 2), len(code))
+
+
+def test_empty_pack():
+    packer = BitPacker(HuffmanEncoder("").code_pairs)
+    assert packer.pack("") == bytearray()
+    assert packer.flush() == bytearray()
+    assert packer.bit_len == 0
+
+
+def test_pack_matches_bitstream():
+    with open("test_data/alice_wonderland.txt", "r") as f:
+        text = f.read()[:20_000]
+
+    encoder = HuffmanEncoder(text)
+    expected = _reference_encode(encoder, text)
+    encoded = encoder.encode(text)
+
+    assert len(encoded) == len(expected)
+    assert encoded.to_bytearray() == expected.to_bytearray()
+
+
+def test_pack_in_pieces():
+    text = "abracadabra, said the huffman coder " * 50
+    encoder = HuffmanEncoder(text)
+
+    packer = BitPacker(encoder.code_pairs)
+    data = bytearray()
+    for i in range(0, len(text), 7):
+        data += packer.pack(text[i : i + 7])
+    data += packer.flush()
+
+    expected = encoder.encode(text)
+    assert packer.bit_len == len(expected)
+    assert data == expected.to_bytearray()
+
+
+def test_unknown_characters_skipped():
+    encoder = HuffmanEncoder("aab")
+    assert encoder.encode("axb") == encoder.encode("ab")
+
+
+def test_pack_byte_array_matches_map():
+    text = "abracadabra, said the huffman coder"
+    encoder = HuffmanEncoder(text)
+
+    packer = BitPacker(compute_byte_code_pairs(encoder.code_lengths))
+    data = packer.pack(text.encode("latin-1")) + packer.flush()
+
+    assert data == encoder.encode(text).to_bytearray()
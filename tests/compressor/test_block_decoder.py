@@ -0,0 +1,46 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from zipzap.compressor.block_decoder import decode_blocks_to_file
+from zipzap.compressor.block_encoder import encode_blocks
+from zipzap.compressor.huffman_coder import HuffmanEncoder
+from zipzap.io.reader import ZzReader
+from zipzap.io.writer import ZzWriter
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_decode_blocks_to_file(jobs):
+    text = "naïve café déjà vu, 😀 " * 300
+    encoder = HuffmanEncoder(text)
+    parts = [text[i : i + 700] for i in range(0, len(text), 700)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "blocks.zz")
+        output_path = Path(tmp_dir) / "decoded.txt"
+        ZzWriter(path).write_blocks(
+            encode_blocks(encoder.code_lengths, parts), len(parts), encoder.code_lengths
+        )
+
+        reader = ZzReader(path)
+        code_lengths, _ = reader.read_header()
+        blocks = reader.read_block_table()
+        decode_blocks_to_file(reader, code_lengths, blocks, output_path, jobs)
+
+        assert output_path.read_bytes() == text.encode("utf-8")
+
+
+def test_decode_blocks_to_file_empty():
+    encoder = HuffmanEncoder("")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "empty.zz")
+        output_path = Path(tmp_dir) / "decoded.txt"
+        ZzWriter(path).write_blocks([], 0, encoder.code_lengths)
+
+        reader = ZzReader(path)
+        decode_blocks_to_file(reader, encoder.code_lengths, [], output_path, 2)
+
+        assert output_path.read_bytes() == b""
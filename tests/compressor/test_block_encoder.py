@@ -0,0 +1,57 @@
+from zipzap.compressor.block_encoder import encode_block, encode_blocks
+from zipzap.compressor.huffman_coder import HuffmanDecoder, HuffmanEncoder
+
+
+def _split(text: str, size: int) -> list[str]:
+    return [text[i : i + size] for i in range(0, len(text), size)]
+
+
+def test_encode_block():
+    text = "this is a huffman test"
+    encoder = HuffmanEncoder(text)
+    data, bit_len, num_chars, num_bytes, checkpoints = encode_block(
+        encoder.code_pairs, text
+    )
+
+    encoded = encoder.encode(text)
+    assert data == encoded.to_bytearray()
+    assert bit_len == len(encoded)
+    assert num_chars == len(text)
+    assert num_bytes == len(text)
+    assert checkpoints == []
+
+
+def test_encode_block_checkpoints():
+    text = "this is a huffman test"
+    encoder = HuffmanEncoder(text)
+    *_, checkpoints = encode_block(encoder.code_pairs, text, 5)
+
+    assert checkpoints == [len(encoder.encode(text[:i])) for i in (5, 10, 15, 20)]
+
+
+def test_blocks_decode_independently():
+    text = "naïve café déjà vu " * 200
+    encoder = HuffmanEncoder(text)
+    decoder = HuffmanDecoder(encoder.code_lengths)
+    parts = _split(text, 333)
+
+    blocks = list(encode_blocks(encoder.code_lengths, parts))
+
+    assert len(blocks) == len(parts)
+    for part, (data, bit_len, num_chars, num_bytes, _) in zip(parts, blocks):
+        assert decoder.table.decode(data, bit_len) == part
+        assert num_chars == len(part)
+        assert num_bytes == len(part.encode("utf-8"))
+
+
+def test_parallel_matches_serial():
+    with open("test_data/example.txt", "r") as f:
+        text = f.read()
+
+    encoder = HuffmanEncoder(text)
+    parts = _split(text, 500)
+
+    serial = list(encode_blocks(encoder.code_lengths, parts))
+    parallel = list(encode_blocks(encoder.code_lengths, parts, jobs=2))
+
+    assert parallel == serial
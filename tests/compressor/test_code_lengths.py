@@ -0,0 +1,111 @@
+import pytest
+
+from zipzap.compressor.code_lengths import (
+    compute_code_lengths,
+    compute_code_lengths_from_freqs,
+    compute_limited_code_lengths,
+)
+from zipzap.compressor.freq_counter import FreqCounter
+from zipzap.compressor.huffman_coder import HuffmanDecoder, HuffmanEncoder
+from zipzap.compressor.huffman_tree import HuffmanTreeBuilder
+from zipzap.ds.maps.probe_hashmap import ProbeHashmap
+
+
+def _fibonacci_freq_table(n: int) -> ProbeHashmap[str, int]:
+    """Frequencies that make the Huffman tree as deep as possible."""
+    freq_table = ProbeHashmap[str, int]()
+    a, b = 1, 1
+    for i in range(n):
+        freq_table.put(chr(ord("a") + i), a)
+        a, b = b, a + b
+    return freq_table
+
+
+def _cost(freq_table, code_lengths) -> int:
+    return sum(freq * (code_lengths.get(c) or 0) for c, freq in freq_table.entries())
+
+
+def _kraft_sum(code_lengths) -> float:
+    return sum(2.0**-length for length in code_lengths.values())
+
+
+def test_tree_code_lengths():
+    tree = HuffmanTreeBuilder.from_text("aaaabbc")
+    code_lengths = compute_code_lengths(tree)
+    assert code_lengths.get("a") == 1
+    assert code_lengths.get("b") == 2
+    assert code_lengths.get("c") == 2
+
+
+def test_from_freqs_empty_and_single():
+    assert compute_code_lengths_from_freqs(FreqCounter("")).is_empty()
+    assert compute_code_lengths_from_freqs(FreqCounter("aaa")).get("a") == 0
+
+
+@pytest.mark.parametrize(
+    "text", ["ab", "aaaabbc", "abcdefgh", "this is a huffman test", "aabbccddeeffg"]
+)
+def test_from_freqs_matches_tree_cost(text):
+    freq_table = FreqCounter(text)
+    tree_lengths = compute_code_lengths(HuffmanTreeBuilder.from_freq_table(freq_table))
+    lengths = compute_code_lengths_from_freqs(freq_table)
+
+    assert len(lengths) == len(freq_table)
+    assert _kraft_sum(lengths) == 1.0
+    assert _cost(freq_table, lengths) == _cost(freq_table, tree_lengths)
+
+
+def test_from_freqs_deep_tree():
+    freq_table = _fibonacci_freq_table(20)
+    tree_lengths = compute_code_lengths(HuffmanTreeBuilder.from_freq_table(freq_table))
+    lengths = compute_code_lengths_from_freqs(freq_table)
+
+    assert max(lengths.values()) == 19
+    assert _cost(freq_table, lengths) == _cost(freq_table, tree_lengths)
+
+
+def test_limited_empty_and_single():
+    assert compute_limited_code_lengths(FreqCounter(""), 4).is_empty()
+    assert compute_limited_code_lengths(FreqCounter("aaa"), 4).get("a") == 0
+
+
+@pytest.mark.parametrize("max_len", [4, 5, 8, 15])
+def test_limited_code_lengths(max_len):
+    freq_table = _fibonacci_freq_table(16)
+    code_lengths = compute_limited_code_lengths(freq_table, max_len)
+
+    assert len(code_lengths) == 16
+    assert max(code_lengths.values()) <= max_len
+    assert _kraft_sum(code_lengths) == 1.0
+
+
+def test_unconstrained_limit_is_optimal():
+    freq_table = _fibonacci_freq_table(10)
+    tree_lengths = compute_code_lengths(HuffmanTreeBuilder.from_freq_table(freq_table))
+    limited = compute_limited_code_lengths(freq_table, 9)
+
+    assert _cost(freq_table, limited) == _cost(freq_table, tree_lengths)
+
+
+def test_limited_too_short():
+    with pytest.raises(ValueError):
+        compute_limited_code_lengths(FreqCounter("abcde"), 2)
+
+
+def test_encoder_max_code_len():
+    freq_table = _fibonacci_freq_table(20)
+    text = "".join(c * freq for c, freq in freq_table.entries())
+
+    encoder = HuffmanEncoder(text, max_code_len=6)
+    assert max(encoder.code_lengths.values()) <= 6
+
+    decoder = HuffmanDecoder(encoder.code_lengths)
+    assert decoder.table.bits == 6  # fits a single table
+    assert decoder.decode(encoder.encode(text)) == text
+
+
+def test_encoder_max_code_len_not_binding():
+    text = "this is a huffman test"
+    assert HuffmanEncoder(text, max_code_len=15).encode(text) == (
+        HuffmanEncoder(text).encode(text)
+    )
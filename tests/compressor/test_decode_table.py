@@ -0,0 +1,96 @@
+import pytest
+
+from zipzap.compressor.codebook import compute_codebook
+from zipzap.compressor.decode_table import DecodeTable
+from zipzap.compressor.huffman_coder import HuffmanEncoder
+from zipzap.ds.bits.bit_stream import BitStream
+from zipzap.ds.maps.probe_hashmap import ProbeHashmap
+
+
+def _skewed_code_lengths(n: int) -> ProbeHashmap[str, int]:
+    """Code lengths of a maximally skewed tree: 1, 2, ..., n-1, n-1."""
+    code_lengths = ProbeHashmap[str, int]()
+    for i in range(n):
+        code_lengths.put(chr(ord("a") + i), min(i + 1, n - 1))
+    return code_lengths
+
+
+def _encode(code_lengths, text: str) -> BitStream:
+    codebook = compute_codebook(code_lengths)
+    bits = BitStream()
+    for c in text:
+        code = codebook.get(c)
+        assert code is not None
+        bits.extend(code)
+    return bits
+
+
+def test_empty_table():
+    table = DecodeTable(ProbeHashmap[str, int]())
+    assert table.decode(b"", 0) == ""
+    with pytest.raises(ValueError):
+        table.decode(b"\x00", 1)
+
+
+def test_single_symbol():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("a", 0)
+    table = DecodeTable(code_lengths)
+
+    assert table.decode(bytes([0b00000000]), 3) == "aaa"
+    with pytest.raises(ValueError):
+        table.decode(bytes([0b10000000]), 1)
+
+
+@pytest.mark.parametrize("primary_bits", [1, 2, 3, 9])
+def test_long_codes_use_subtables(primary_bits):
+    code_lengths = _skewed_code_lengths(12)
+    text = "abcdefghijkl" * 3 + "lkjihgfedcba"
+    bits = _encode(code_lengths, text)
+
+    table = DecodeTable(code_lengths, primary_bits)
+    assert table.bits == min(primary_bits, 11)
+    assert table.decode(bits.to_bytearray(), len(bits)) == text
+
+
+def test_truncated_code_raises():
+    code_lengths = _skewed_code_lengths(5)
+    bits = _encode(code_lengths, "e")  # "1111"
+
+    table = DecodeTable(code_lengths)
+    with pytest.raises(ValueError):
+        table.decode(bits.to_bytearray(), len(bits) - 1)
+
+
+def test_matches_encoder():
+    with open("test_data/example.txt", "r") as f:
+        text = f.read()
+
+    encoder = HuffmanEncoder(text)
+    encoded = encoder.encode(text)
+
+    table = DecodeTable(encoder.code_lengths, 4)
+    assert table.decode(encoded.to_bytearray(), len(encoded)) == text
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 64])
+def test_decode_chunks_across_boundaries(chunk_size):
+    code_lengths = _skewed_code_lengths(20)  # codes up to 19 bits span chunks
+    text = "abcdefghijklmnopqrst" * 5
+    bits = _encode(code_lengths, text)
+    data = bits.to_bytearray()
+
+    chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)]
+    table = DecodeTable(code_lengths, 4)
+
+    assert "".join(table.decode_chunks(chunks, len(bits))) == text
+
+
+def test_decode_chunks_truncated():
+    code_lengths = _skewed_code_lengths(5)
+    bits = _encode(code_lengths, "abcde" * 4)
+    data = bits.to_bytearray()
+
+    table = DecodeTable(code_lengths)
+    with pytest.raises(ValueError):
+        "".join(table.decode_chunks([data[:-1]], len(bits)))
@@ -0,0 +1,86 @@
+import os
+import tempfile
+
+import pytest
+
+from zipzap.compressor.estimate import (
+    entropy_bits,
+    estimate_encoder,
+    estimate_file,
+    should_store,
+)
+from zipzap.compressor.freq_counter import FreqCounter
+from zipzap.compressor.huffman_coder import ByteHuffmanEncoder, HuffmanEncoder
+from zipzap.io.writer import ZzWriter
+
+TEXT = "".join(f"line {i}: naïve café {i * i}\n" for i in range(2000))
+
+
+@pytest.fixture
+def tmp_dir():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        yield tmp_dir
+
+
+def test_estimate_matches_written_size(tmp_dir):
+    encoder = HuffmanEncoder(TEXT)
+    estimate = estimate_encoder(encoder)
+    assert not estimate.stored
+
+    path = os.path.join(tmp_dir, "text.zz")
+    num_chars, num_bytes = encoder.decoded_lengths()
+    ZzWriter(path).write_stream(
+        encoder.encode_chunks([TEXT]),
+        encoder.encoded_bit_len(),
+        encoder.code_lengths,
+        num_chars=num_chars,
+        num_bytes=num_bytes,
+    )
+    assert os.path.getsize(path) == estimate.total_size
+    assert estimate.entropy_bits <= 8 * estimate.payload_size
+    assert 0 < estimate.ratio < 1
+
+
+def test_estimate_stored_size(tmp_dir):
+    data = bytes(range(256)) * 4
+    estimate = estimate_encoder(ByteHuffmanEncoder(data))
+    assert estimate.stored
+    assert estimate.payload_size == len(data)
+
+    path = os.path.join(tmp_dir, "stored.zz")
+    ZzWriter(path).write_stored([data], len(data), len(data), is_bytes=True)
+    assert os.path.getsize(path) == estimate.total_size
+
+
+def test_should_store():
+    assert not should_store(HuffmanEncoder("the quick brown fox " * 50))
+    assert should_store(HuffmanEncoder("abc"))
+    assert should_store(HuffmanEncoder(""))
+    assert not should_store(ByteHuffmanEncoder(b"\x00\x01" * 2048))
+
+
+def test_entropy_bits():
+    assert entropy_bits(FreqCounter("aaaa")) == 0
+    assert entropy_bits(FreqCounter("abab")) == pytest.approx(4)
+    assert entropy_bits(FreqCounter("abcd")) == pytest.approx(8)
+
+
+def test_estimate_file(tmp_dir):
+    path = os.path.join(tmp_dir, "input.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(TEXT * 10)
+
+    exact = estimate_file(path)
+    assert exact.input_size == os.path.getsize(path)
+    assert exact.num_chars == 10 * len(TEXT)
+    assert exact.sample_rate is None
+
+    byte_estimate = estimate_file(path, is_bytes=True)
+    assert byte_estimate.num_chars == exact.input_size
+
+    sampled = estimate_file(path, rate=0.25)
+    assert sampled.sample_rate == 0.25
+    assert sampled.total_size == pytest.approx(exact.total_size, rel=0.05)
+
+    with pytest.raises(ValueError):
+        estimate_file(path, rate=0)
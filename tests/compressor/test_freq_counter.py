@@ -1,4 +1,9 @@
-from zipzap.compressor.freq_counter import FreqCounter
+import os
+import tempfile
+
+import pytest
+
+from zipzap.compressor.freq_counter import ByteFreqCounter, FreqCounter
 
 
 def test_empty_string():
@@ -44,3 +49,94 @@ def test_non_alpha_characters():
     assert counter.get("*") == 1
     assert counter.get("(") == 1
     assert counter.get(")") == 1
+
+
+def test_update_in_chunks():
+    text = "the quick brown fox jumps over the lazy dog"
+    counter = FreqCounter()
+    for i in range(0, len(text), 5):
+        counter.update(text[i : i + 5])
+
+    expected = FreqCounter(text)
+    assert len(counter) == len(expected)
+    for c, freq in expected.entries():
+        assert counter.get(c) == freq
+
+
+def test_byte_counter():
+    data = bytes(range(256)) + b"\x00\xffab"
+    counter = ByteFreqCounter(data)
+    assert counter.counts[0] == 2
+    assert counter.counts[255] == 2
+    assert counter.counts[ord("a")] == 2
+    assert counter.counts[ord("c")] == 1
+    assert counter.total() == len(data)
+
+
+def test_byte_counter_update_and_freq_table():
+    counter = ByteFreqCounter()
+    counter.update(b"aab")
+    counter.update(memoryview(b"\x00b"))
+
+    freq_table = counter.to_freq_table()
+    assert len(freq_table) == 3
+    assert freq_table.get("a") == 2
+    assert freq_table.get("b") == 2
+    assert freq_table.get("\x00") == 1
+    assert freq_table.get("c") is None
+
+
+def test_merge():
+    counter = FreqCounter("hello")
+    counter.merge(FreqCounter("world"))
+
+    expected = FreqCounter("helloworld")
+    assert len(counter) == len(expected)
+    for c, freq in expected.entries():
+        assert counter.get(c) == freq
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_from_chunks(jobs):
+    text = "the quick brown fox jumps over the lazy dog " * 20
+    chunks = [text[i : i + 50] for i in range(0, len(text), 50)]
+    counter = FreqCounter.from_chunks(chunks, jobs)
+
+    expected = FreqCounter(text)
+    assert len(counter) == len(expected)
+    for c, freq in expected.entries():
+        assert counter.get(c) == freq
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_byte_counter_from_chunks_and_merge(jobs):
+    data = bytes(range(256)) * 5
+    chunks = [data[i : i + 100] for i in range(0, len(data), 100)]
+    counter = ByteFreqCounter.from_chunks(chunks, jobs)
+    assert counter.counts == [5] * 256
+
+    counter.merge(ByteFreqCounter(b"ab"))
+    assert counter.counts[ord("a")] == 6
+    assert counter.total() == len(data) + 2
+
+
+def test_from_sample():
+    data = ("abc" * 1000 + "xyz" * 1000).encode("utf-8")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "sample.txt")
+        with open(path, "wb") as f:
+            f.write(data)
+
+        full = FreqCounter.from_sample(path, rate=1)
+        assert full.get("a") == 1000 and full.get("z") == 1000
+
+        sampled = FreqCounter.from_sample(path, budget=2048)
+        assert 0 < sum(sampled.values()) < len(data)
+
+        byte_counter = ByteFreqCounter.from_sample(path, rate=0.5)
+        assert 0 < byte_counter.total() < len(data)
+
+        with pytest.raises(ValueError):
+            FreqCounter.from_sample(path)
+        with pytest.raises(ValueError):
+            FreqCounter.from_sample(path, rate=0.5, budget=100)
@@ -1,4 +1,10 @@
-from zipzap.compressor.huffman_coder import HuffmanEncoder, HuffmanDecoder
+from zipzap.compressor.freq_counter import FreqCounter
+from zipzap.compressor.huffman_coder import (
+    ByteHuffmanEncoder,
+    HuffmanDecoder,
+    HuffmanEncoder,
+)
+from zipzap.compressor.codebook import ESCAPE
 from zipzap.ds.bits.bit_stream import BitStream
 
 
@@ -134,3 +140,77 @@ def test_consistency_multiple_encodes():
     # Decoded result must match (though codebooks may differ)
     assert decoded1 == text
     assert decoded2 == text
+
+
+def test_encode_chunks_matches_encode():
+    text = "this is a huffman test " * 100
+    encoder = HuffmanEncoder(text)
+    encoded = encoder.encode(text)
+
+    chunks = [text[i : i + 37] for i in range(0, len(text), 37)]
+    data = bytearray()
+    for part in encoder.encode_chunks(chunks):
+        data += part
+
+    assert data == encoded.to_bytearray()
+    assert encoder.encoded_bit_len() == len(encoded)
+
+
+def test_encoder_from_freq_table():
+    text = "this is a huffman test"
+    encoder = HuffmanEncoder(freq_table=FreqCounter(text))
+    encoded = encoder.encode(text)
+
+    assert encoded == HuffmanEncoder(text).encode(text)
+    assert HuffmanDecoder(encoder.code_lengths).decode(encoded) == text
+
+
+def test_byte_encoder_round_trip():
+    data = bytes(range(256)) * 3 + b"\x00\x00\xfe" * 50
+    encoder = ByteHuffmanEncoder(data)
+    encoded = encoder.encode(data)
+    assert encoder.encoded_bit_len() == len(encoded)
+
+    decoder = HuffmanDecoder(encoder.code_lengths)
+    packed = encoded.to_bytearray()
+    chunks = [packed[i : i + 5] for i in range(0, len(packed), 5)]
+    assert b"".join(decoder.decode_byte_stream(chunks, len(encoded))) == data
+
+
+def test_byte_encoder_chunks_and_single_byte():
+    data = b"\x07" * 20
+    encoder = ByteHuffmanEncoder(data)
+    encoded = encoder.encode(data)
+    assert len(encoded) == 20
+
+    chunks = [data[i : i + 3] for i in range(0, len(data), 3)]
+    assert b"".join(encoder.encode_chunks(chunks)) == encoded.to_bytearray()
+
+
+def test_escape_unseen_characters():
+    # A code built from a sample escapes characters the sample lacks
+    encoder = HuffmanEncoder(freq_table=FreqCounter("abcab a"), escape=True)
+    assert encoder.code_lengths.get(ESCAPE) is not None
+    assert encoder.decoded_lengths() == (7, 7)
+
+    text = "abc naïve 😀 cab" * 3
+    data = b"".join(encoder.encode_chunks([text[:10], text[10:]]))
+    bit_len, num_chars, num_bytes = encoder.encoded_lengths
+    assert (num_chars, num_bytes) == (len(text), len(text.encode("utf-8")))
+
+    decoder = HuffmanDecoder(encoder.code_lengths)
+    assert decoder.decode(BitStream.from_bytearray(bytearray(data), bit_len)) == text
+    assert "".join(decoder.decode_stream([data[:3], data[3:]], bit_len)) == text
+
+
+def test_byte_escape_codes_every_byte():
+    encoder = ByteHuffmanEncoder(b"aab", escape=True)
+    assert len(encoder.code_lengths) == 256
+
+    data = bytes(range(256))
+    decoder = HuffmanDecoder(encoder.code_lengths)
+    encoded = encoder.encode(data)
+    assert (
+        b"".join(decoder.decode_byte_stream([encoded.to_bytearray()], len(encoded)))
+        == data
+    )
@@ -1,4 +1,6 @@
 import pytest
+from zipzap.compressor.code_lengths import compute_code_lengths
+from zipzap.compressor.huffman_coder import HuffmanEncoder
 from zipzap.compressor.huffman_tree import HuffmanTreeBuilder, HuffmanNode
 
 
@@ -51,6 +53,36 @@ def test_huffman_structure():
     _check_node(tree, root)
 
 
+@pytest.mark.parametrize("max_code_len", [None, 4])
+def test_tree_of_code_lengths(max_code_len):
+    # Fibonacci frequencies tie often and need codes longer than 4 bits
+    freqs = [1, 1, 2, 3, 5, 8, 13, 21]
+    text = "".join(chr(ord("a") + i) * freq for i, freq in enumerate(freqs))
+    encoder = HuffmanEncoder(text, max_code_len=max_code_len)
+
+    tree = encoder.tree
+    tree_lengths = compute_code_lengths(tree)
+    assert {e.key: e.value for e in tree_lengths.entries()} == {
+        e.key: e.value for e in encoder.code_lengths.entries()
+    }
+    root = tree.root()
+    assert root is not None
+    assert root.element().freq == len(text)
+    _check_node(tree, root)
+
+
+def test_tree_of_code_lengths_empty_and_single():
+    assert HuffmanEncoder("").tree.is_empty()
+    # A lone symbol is written as a single 0 bit
+    tree = HuffmanEncoder("aaa").tree
+    root = tree.root()
+    assert root is not None
+    leaf = tree.left(root)
+    assert leaf is not None and tree.right(root) is None
+    assert (leaf.element().char, leaf.element().freq) == ("a", 3)
+    assert root.element().freq == 3
+
+
 def _check_node(tree, pos):
     """Helper to validate internal node frequencies sum to children's frequencies"""
     left = tree.left(pos)
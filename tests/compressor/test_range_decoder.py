@@ -0,0 +1,54 @@
+import os
+import tempfile
+
+import pytest
+
+from zipzap.compressor.block_encoder import encode_blocks
+from zipzap.compressor.huffman_coder import HuffmanEncoder
+from zipzap.compressor.range_decoder import decode_range
+from zipzap.io.reader import ZzReader
+from zipzap.io.writer import ZzWriter
+
+TEXT = "".join(f"line {i}: naïve café 😀\n" for i in range(300))
+
+
+@pytest.fixture(params=["plain", "blocks", "indexed", "stored"])
+def zz_path(request):
+    encoder = HuffmanEncoder(TEXT)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, f"{request.param}.zz")
+        writer = ZzWriter(path)
+
+        if request.param == "plain":
+            writer.write(encoder.encode(TEXT), encoder.code_lengths)
+        elif request.param == "stored":
+            data = TEXT.encode("utf-8")
+            writer.write_stored([data], len(TEXT), len(data))
+        else:
+            interval = 37 if request.param == "indexed" else 0
+            parts = [TEXT[i : i + 1000] for i in range(0, len(TEXT), 1000)]
+            blocks = encode_blocks(encoder.code_lengths, parts, 1, interval)
+            writer.write_blocks(blocks, len(parts), encoder.code_lengths, interval)
+
+        yield path
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    [(0, 0), (0, 10), (36, 38), (37, 74), (990, 1010), (999, 2001), (5000, None)],
+)
+def test_decode_range(zz_path, start, end):
+    assert decode_range(ZzReader(zz_path), start, end) == TEXT[start:end]
+
+
+def test_decode_range_past_end(zz_path):
+    assert decode_range(ZzReader(zz_path), len(TEXT) - 3, len(TEXT) + 10) == TEXT[-3:]
+    assert decode_range(ZzReader(zz_path), len(TEXT) + 5) == ""
+
+
+def test_decode_range_invalid(zz_path):
+    with pytest.raises(ValueError):
+        decode_range(ZzReader(zz_path), 10, 5)
+    with pytest.raises(ValueError):
+        decode_range(ZzReader(zz_path), -1)
@@ -1,3 +1,6 @@
+import mmap
+import tempfile
+
 import pytest
 
 from zipzap.ds.bits.bit_stream import BitStream
@@ -103,3 +106,133 @@ def test_equality_and_hash():
 def test_str():
     bs = BitStream("101")
     assert str(bs) == "101"
+
+
+def test_append_bits():
+    bs = BitStream("101")
+    bs.append_bits(0b110, 3)
+    assert str(bs) == "101110"
+
+    # Crosses a byte boundary and then appends whole bytes
+    bs.append_bits(0b1011001110001, 13)
+    assert str(bs) == "101110" + "1011001110001"
+    assert len(bs) == 19
+
+    bs.append_bits(0, 0)
+    assert len(bs) == 19
+
+
+def test_append_bits_invalid():
+    bs = BitStream()
+    with pytest.raises(ValueError):
+        bs.append_bits(4, 2)
+    with pytest.raises(ValueError):
+        bs.append_bits(-1, 3)
+    with pytest.raises(ValueError):
+        bs.append_bits(0, -1)
+
+
+def test_extend_invalid_string():
+    with pytest.raises(ValueError):
+        BitStream("1021")
+    with pytest.raises(ValueError):
+        BitStream("0b11")
+
+
+def test_extend_bitstream_aligned_and_unaligned():
+    tail = BitStream("110010101")
+    aligned = BitStream("10101010").extend(tail)
+    assert str(aligned) == "10101010110010101"
+
+    unaligned = BitStream("101").extend(tail)
+    assert str(unaligned) == "101110010101"
+    unaligned.append(1)
+    assert str(unaligned) == "1011100101011"
+
+
+def test_from_bytearray_clears_padding():
+    bs = BitStream.from_bytearray(bytearray([0b10111111, 0xFF]), 3)
+    assert bs.to_bytearray() == bytearray([0b10100000])
+    bs.extend("1")
+    assert str(bs) == "1011"
+    assert bs == BitStream("1011")
+
+
+def test_read_and_peek_bits():
+    bs = BitStream("1011001110001")
+    assert bs.read_bits(0, 4) == 0b1011
+    assert bs.read_bits(3, 7) == 0b1001110
+    assert bs.read_bits(5, 0) == 0
+    assert bs.peek_bits(10, 6) == 0b001000  # zero-padded past the end
+
+    with pytest.raises(IndexError):
+        bs.read_bits(10, 4)
+    with pytest.raises(IndexError):
+        bs.read_bits(-1, 2)
+
+
+def test_iter_bytes_and_words():
+    bs = BitStream("1011001110001")
+    assert list(bs.iter_bytes()) == [0b10110011, 0b10001000]
+    assert list(bs.iter_words(5)) == [0b10110, 0b01110, 0b00100]
+
+    with pytest.raises(ValueError):
+        list(bs.iter_words(0))
+
+
+def test_from_buffer_shares_bytes():
+    data = bytearray([0b10110011, 0b10001000])
+    bs = BitStream.from_buffer(data, 13)
+    assert bs.readonly
+    assert str(bs) == "1011001110001"
+
+    data[0] = 0b01110011  # the view sees changes to the buffer
+    assert str(bs) == "0111001110001"
+
+    with pytest.raises(TypeError):
+        bs.append(1)
+    with pytest.raises(ValueError):
+        BitStream.from_buffer(data, 17)
+
+
+def test_from_buffer_offset_and_mmap():
+    with tempfile.TemporaryFile() as f:
+        f.write(bytes([0b10110011, 0b10001000]))
+        f.flush()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            bs = BitStream.from_buffer(mm, 7, bit_offset=3)
+            assert str(bs) == "1001110"
+            assert bs == BitStream("1001110")
+            assert bs.to_bytearray() == bytearray([0b10011100])
+            del bs  # release the view before the mmap closes
+
+
+def test_slice_views():
+    bs = BitStream("1011001110001")
+    view = bs[3:10]
+    assert view.readonly
+    assert str(view) == "1001110"
+    assert view.read_bits(1, 3) == 0b001
+    assert view[0] == 1
+    assert str(view[2:5]) == "011"
+    assert str(bs[10:]) == "001"
+
+    copied = view.copy()
+    copied.append(1)
+    assert str(copied) == "10011101"
+
+    with pytest.raises(ValueError):
+        _ = bs[::2]
+
+
+def test_to_memoryview():
+    bs = BitStream("1011001110001")
+    mv = bs.to_memoryview()
+    assert mv.readonly
+    assert bytes(mv) == bytes([0b10110011, 0b10001000])
+    del mv
+
+    # Views off a byte boundary are shifted into fresh bytes
+    assert bytes(bs[3:11].to_memoryview()) == bytes([0b10011100])
+    # Set bits past the end are cleared in a copy
+    assert bytes(BitStream.from_buffer(b"\xff", 3).to_memoryview()) == b"\xe0"
@@ -0,0 +1,59 @@
+import pytest
+
+from zipzap.ds.maps.dense_char_map import DenseCharMap
+
+
+def test_put_get_remove():
+    m = DenseCharMap[int]()
+    assert m.is_empty()
+    assert m.get("a") is None
+
+    assert m.put("a", 1) is None
+    assert m.put("a", 2) == 1
+    assert m.get("a") == 2
+    assert len(m) == 1
+
+    assert m.remove("a") == 2
+    assert m.remove("a") is None
+    assert m.get("a") is None
+    assert m.is_empty()
+
+
+def test_high_codepoints_and_other_keys():
+    m = DenseCharMap[int](dense_size=128)
+    chars = ["a", "\x7f", "\x80", "é", "€", "\U0001f600", "ab", ""]
+    for i, char in enumerate(chars):
+        m.put(char, i)
+
+    assert len(m) == len(chars)
+    assert [m.get(char) for char in chars] == list(range(len(chars)))
+    assert m.get("b") is None
+    assert m.get("\U0001f601") is None
+
+    assert m.remove("€") == 4
+    assert m.get("€") is None
+    assert len(m) == len(chars) - 1
+
+
+def test_entries_in_codepoint_order():
+    m = DenseCharMap[int]()
+    for char in "zyx中ab":
+        m.put(char, ord(char))
+
+    assert list(m.keys()) == ["a", "b", "x", "y", "z", "中"]
+    assert all(entry.value == ord(entry.key) for entry in m.entries())
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        DenseCharMap(dense_size=0)
+    with pytest.raises(ValueError):
+        DenseCharMap().put("a", None)
+
+
+def test_bulk():
+    m = DenseCharMap[int].from_items([("a", 1), ("€", 2), ("a", 3)])
+    m.put_many([("b", 4), ("\U0001f600", 5)])
+
+    assert len(m) == 4
+    assert m.get_many(["a", "b", "€", "\U0001f600", "c"]) == [3, 4, 2, 5, None]
@@ -1,11 +1,32 @@
+import random
 import pytest
 from typing import Type
 
+from zipzap.ds.maps.chain_hashmap import ChainHashmap
+from zipzap.ds.maps.compact_probe_hashmap import CompactProbeHashmap
+from zipzap.ds.maps.hashmap import next_prime, polynomial_hash
 from zipzap.ds.maps.probe_hashmap import ProbeHashmap
+from zipzap.ds.maps.robin_hood_hashmap import RobinHoodHashmap
 from zipzap.ds.maps.map import Map
 
 
-@pytest.fixture(params=[ProbeHashmap])
+class BuiltinHashProbeHashmap(ProbeHashmap):
+    """A ProbeHashmap hashing keys with Python's hash."""
+
+    def __init__(self, slots: int = 211):
+        super().__init__(slots, hash_strategy="builtin")
+
+
+@pytest.fixture(
+    params=[
+        ProbeHashmap,
+        BuiltinHashProbeHashmap,
+        CompactProbeHashmap,
+        RobinHoodHashmap,
+        ChainHashmap,
+    ],
+    ids=["probe", "probe-builtin", "compact", "robin-hood", "chain"],
+)
 def hashmap_class(request) -> Type[Map]:
     return request.param
 
@@ -107,3 +128,181 @@ def test_full_table(hashmap_class):
 
     assert len(m) == len(items)
     assert not m.is_empty()
+
+
+def test_many_keys(hashmap_class):
+    m: Map = hashmap_class()
+
+    # More single characters than the default slots, as in random text
+    for i in range(3000):
+        m.put(chr(i), i)
+
+    assert len(m) == 3000
+    assert all(m.get(chr(i)) == i for i in range(3000))
+    assert m.get(chr(3000)) is None
+
+
+def test_remove_and_reinsert(hashmap_class):
+    m: Map = hashmap_class(slots=7)
+
+    for round in range(50):
+        for i in range(5):
+            m.put(f"k{i}", round)
+        for i in range(5):
+            assert m.remove(f"k{i}") == round
+
+    assert m.is_empty()
+    m.put("x", 1)
+    assert m.get("x") == 1
+    assert m.get("k0") is None
+
+
+def test_matches_dict(hashmap_class):
+    m = hashmap_class(slots=3)
+    expected: dict[str, int] = {}
+    rng = random.Random(0)
+
+    # Random puts and removes over few keys, so that deletions hit collisions
+    for i in range(3000):
+        key = chr(rng.randrange(200))
+        if rng.random() < 0.4:
+            assert m.remove(key) == expected.pop(key, None)
+        else:
+            assert m.put(key, i) == expected.get(key)
+            expected[key] = i
+
+    assert len(m) == len(expected)
+    assert dict(m.entries()) == expected
+    assert all(m.get(key) == value for key, value in expected.items())
+
+
+def test_probe_lengths(hashmap_class):
+    m = hashmap_class()
+    for i in range(500):
+        m.put(f"k{i}", i)
+
+    lengths = list(m.probe_lengths())
+    assert len(lengths) == 500
+    assert min(lengths) == 1
+
+
+def test_robin_hood_probe_lengths():
+    # Keys 0, 11, 22 share home slot 0 of 11, and 1 is displaced by them
+    m = RobinHoodHashmap[int, int](slots=11)
+    for key in (0, 1, 11, 22):
+        m.put(key, key)
+
+    assert sorted(m.probe_lengths()) == [1, 2, 3, 3]
+    # Removing 0 shifts the others back a slot each
+    m.remove(0)
+    assert sorted(m.probe_lengths()) == [1, 2, 2]
+    assert [m.get(key) for key in (0, 1, 11, 22)] == [None, 1, 11, 22]
+
+
+def test_from_items(hashmap_class):
+    items = [(f"k{i}", i) for i in range(1000)]
+    m = hashmap_class.from_items(items, unique=True)
+    assert len(m) == 1000
+    assert all(m.get(k) == v for k, v in items)
+
+    # Without unique, later pairs overwrite earlier ones
+    m = hashmap_class.from_items([("a", 1), ("b", 2), ("a", 3)])
+    assert len(m) == 2
+    assert m.get_many(["a", "b", "c"]) == [3, 2, None]
+
+
+def test_put_many(hashmap_class):
+    m: Map = hashmap_class()
+    m.put("a", 0)
+    m.put_many((chr(i), i) for i in range(97, 200))
+    m.put_many([("x", 1), ("y", 2)])
+
+    assert len(m) == 103
+    assert m.get_many("axyz") == [97, 1, 2, 122]
+
+
+class CountedKey:
+    """A key counting the calls to its hash."""
+
+    calls = 0
+
+    def __init__(self, value: int):
+        self.value = value
+
+    def __hash__(self) -> int:
+        CountedKey.calls += 1
+        return self.value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CountedKey) and self.value == other.value
+
+
+def test_probe_hashmap_load_factor():
+    m = ProbeHashmap[int, int](slots=5, max_load=0.5)
+
+    for i in range(1000):
+        m.put(i, i)
+        assert m.load_factor <= 0.5
+
+    assert all(m.get(i) == i for i in range(1000))
+
+
+def test_probe_hashmap_reuses_hashes():
+    m = ProbeHashmap[CountedKey, int](slots=3)
+    CountedKey.calls = 0
+
+    # Growing the table rehashes every entry, without hashing its key again
+    for i in range(100):
+        m.put(CountedKey(i), i)
+
+    assert CountedKey.calls == 100
+
+
+@pytest.mark.parametrize(
+    "hashmap_class", [ProbeHashmap, CompactProbeHashmap, RobinHoodHashmap, ChainHashmap]
+)
+def test_reserve(hashmap_class):
+    m = hashmap_class()
+    m.reserve(5000)
+    slots = m._slots
+
+    for i in range(5000):
+        m.put(i, i)
+    assert m._slots == slots
+
+    # A reserved table never shrinks
+    m.reserve(10)
+    assert m._slots == slots
+    assert hashmap_class.from_items((i, i) for i in range(5000))._slots == slots
+
+
+def test_probe_hashmap_invalid_options():
+    with pytest.raises(ValueError):
+        ProbeHashmap(max_load=1.0)
+    with pytest.raises(ValueError):
+        ProbeHashmap(hash_strategy="nope")
+
+
+def test_compact_hashmap_int_values():
+    m = CompactProbeHashmap[str, int](slots=3, value_typecode="q")
+
+    for i in range(100):
+        m.put(chr(i), i)
+    assert m.put("a", 1) == ord("a")
+    assert m.remove("b") == ord("b")
+
+    assert len(m) == 99
+    assert m.get("a") == 1
+    assert m.get("b") is None
+    assert sorted(m.values())[-1] == 99
+    assert [entry.value for entry in m.entries() if entry.key == "c"] == [ord("c")]
+
+
+def test_polynomial_hash():
+    assert polynomial_hash("a") == ord("a")
+    assert polynomial_hash("ab") == ord("a") * 31 + ord("b")
+    assert polynomial_hash(42) == 42
+
+
+def test_next_prime():
+    assert [next_prime(n) for n in (0, 3, 4, 211, 256, 423)] == [2, 3, 5, 211, 257, 431]
@@ -0,0 +1,61 @@
+import pytest
+
+from zipzap.compressor.code_lengths import compute_code_lengths_from_freqs
+from zipzap.ds.maps.probe_hashmap import ProbeHashmap
+from zipzap.io.code_table import decode_code_table, encode_code_table
+
+
+def _code_lengths(pairs) -> ProbeHashmap[str, int]:
+    code_lengths = ProbeHashmap[str, int]()
+    for char, length in pairs:
+        code_lengths.put(char, length)
+    return code_lengths
+
+
+def _round_trip(code_lengths: ProbeHashmap[str, int]) -> ProbeHashmap[str, int]:
+    decoded = decode_code_table(encode_code_table(code_lengths))
+    assert len(decoded) == len(code_lengths)
+    for char, length in code_lengths.entries():
+        assert decoded.get(char) == length
+    return decoded
+
+
+def test_round_trip_empty_and_single():
+    assert encode_code_table(ProbeHashmap[str, int]()) == b"\x00"
+    assert decode_code_table(b"\x00").is_empty()
+    _round_trip(_code_lengths([("x", 0)]))
+
+
+def test_round_trip_text():
+    text = "The quick brown fox jumps over the lazy dog, 0123 times! ¿Qué? 😀\n"
+    freq_table = ProbeHashmap[str, int]()
+    for i, char in enumerate(text):
+        freq_table.put(char, (freq_table.get(char) or 0) + i + 1)
+    code_lengths = compute_code_lengths_from_freqs(freq_table)
+    _round_trip(code_lengths)
+
+    # Far smaller than a varint table of UTF-8 bytes and lengths
+    varint_size = sum(2 + len(char.encode("utf-8")) for char in code_lengths.keys())
+    assert len(encode_code_table(code_lengths)) < varint_size // 2
+
+
+def test_round_trip_runs_and_long_lengths():
+    # 256 byte values of 8 bits each collapse to a handful of repeats
+    uniform = _code_lengths((chr(b), 8) for b in range(256))
+    _round_trip(uniform)
+    assert len(encode_code_table(uniform)) < 16
+
+    pairs = [(chr(c), 3 + c % 5) for c in range(40, 60)]
+    pairs += [("é", 16), ("ê", 16), ("ë", 16), ("ì", 16), ("\U0010ffff", 271)]
+    _round_trip(_code_lengths(pairs))
+
+    with pytest.raises(ValueError):
+        encode_code_table(_code_lengths([("a", 272), ("b", 1)]))
+
+
+def test_decode_corrupt_table():
+    data = encode_code_table(_code_lengths([("a", 1), ("b", 2), ("c", 2)]))
+    with pytest.raises(ValueError):
+        decode_code_table(data[:-1])
+    with pytest.raises(ValueError):
+        decode_code_table(b"\x01\x00\xff\xff\xff\x7f")
@@ -1,8 +1,21 @@
+import io
 import os
 import tempfile
 
+import pytest
+
+from zipzap.compressor.huffman_coder import HuffmanDecoder, HuffmanEncoder
 from zipzap.ds.bits.bit_stream import BitStream
 from zipzap.ds.maps.probe_hashmap import ProbeHashmap
+from zipzap.io.block_table import BlockInfo
+from zipzap.io.chunks import (
+    decode_sample,
+    read_byte_chunks,
+    read_sampled_chunks,
+    read_text_chunks,
+)
+from zipzap.io.header import pack_varint, read_varint, write_varint
+from zipzap.io.mapped_reader import MappedZzReader
 from zipzap.io.reader import ZzReader
 from zipzap.io.writer import ZzWriter
 
@@ -108,3 +121,430 @@ def test_write_read_large_bitstream():
         assert read_code_lenghts.get("a") == 1
     finally:
         os.remove(tmp_path)
+
+
+def test_write_stream_matches_write():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("a", 1)
+    code_lengths.put("b", 1)
+
+    bits = BitStream([i % 3 == 0 for i in range(100)])
+    data = bits.to_bytearray()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "whole.zz")
+        stream_path = os.path.join(tmp_dir, "stream.zz")
+
+        ZzWriter(path).write(bits, code_lengths)
+        chunks = [data[i : i + 3] for i in range(0, len(data), 3)]
+        ZzWriter(stream_path).write_stream(chunks, len(bits), code_lengths)
+
+        with open(path, "rb") as f1, open(stream_path, "rb") as f2:
+            assert f1.read() == f2.read()
+
+
+def test_write_stream_length_mismatch():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("a", 1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        writer = ZzWriter(os.path.join(tmp_dir, "bad.zz"))
+        with pytest.raises(ValueError):
+            writer.write_stream([b"\x00\x00"], 20, code_lengths)
+
+
+def test_read_text_chunks():
+    text = "héllo wörld\n" * 10
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "input.txt")
+        with open(path, "w", encoding="utf-8-sig") as f:
+            f.write(text)
+
+        chunks = list(read_text_chunks(path, 7))
+
+    assert "".join(chunks) == text  # BOM is stripped
+    assert all(len(chunk) <= 7 for chunk in chunks)
+
+
+def test_read_byte_chunks():
+    data = bytes(range(256)) * 4
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "input.bin")
+        with open(path, "wb") as f:
+            f.write(data)
+
+        chunks = list(read_byte_chunks(path, 100))
+
+    assert b"".join(chunks) == data
+    assert all(len(chunk) <= 100 for chunk in chunks)
+
+
+def test_write_read_byte_mode():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("\x00", 1)
+    code_lengths.put("\xff", 1)
+
+    bits = BitStream([i % 3 == 0 for i in range(100)])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "bytes.zz")
+        text_path = os.path.join(tmp_dir, "text.zz")
+        ZzWriter(path).write_stream([bits.to_bytearray()], 100, code_lengths, True)
+        ZzWriter(text_path).write(bits, code_lengths)
+
+        reader = ZzReader(path)
+        read_bits, read_code_lengths = reader.read()
+        assert reader.is_bytes()
+        assert not ZzReader(text_path).is_bytes()
+
+    assert read_bits == bits
+    assert read_code_lengths.get("\xff") == 1
+
+
+def test_read_header_and_data():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("a", 1)
+    code_lengths.put("b", 1)
+
+    bits = BitStream([i % 5 == 0 for i in range(1000)])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "chunks.zz")
+        ZzWriter(path).write(bits, code_lengths)
+
+        reader = ZzReader(path)
+        read_code_lengths, bit_len = reader.read_header()
+        chunks = list(reader.read_data(16))
+        blocks = reader.read_block_table()
+
+    assert bit_len == len(bits)
+    assert read_code_lengths.get("a") == 1
+    assert read_code_lengths.get("b") == 1
+    assert blocks == []
+    assert all(len(chunk) <= 16 for chunk in chunks)
+    assert b"".join(chunks) == bits.to_bytearray()
+
+
+def test_write_read_blocks():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("a", 1)
+    code_lengths.put("b", 1)
+
+    parts = [BitStream("1011"), BitStream("0" * 9 + "1"), BitStream("11111111")]
+    blocks = [(p.to_bytearray(), len(p), len(p), len(p), []) for p in parts]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "blocks.zz")
+        ZzWriter(path).write_blocks(blocks, len(blocks), code_lengths)
+
+        reader = ZzReader(path)
+        read_code_lengths, bit_len = reader.read_header()
+        table = reader.read_block_table()
+        block_data = [b"".join(reader.read_data(1, block)) for block in table]
+        read_bits, _ = reader.read()
+
+    assert read_code_lengths.get("a") == 1
+    assert bit_len == 22
+    assert table == [
+        BlockInfo(0, 4, 4, 4),
+        BlockInfo(1, 10, 10, 10),
+        BlockInfo(3, 8, 8, 8),
+    ]
+    assert block_data == [p.to_bytearray() for p in parts]
+    assert str(read_bits) == "".join(str(p) for p in parts)
+
+
+def test_write_blocks_count_mismatch():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("a", 1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        writer = ZzWriter(os.path.join(tmp_dir, "bad.zz"))
+        with pytest.raises(ValueError):
+            writer.write_blocks([(b"\x00", 1, 1, 1, [])], 2, code_lengths)
+
+
+def test_write_blocks_negative_index_interval():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("a", 1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "bad.zz")
+        with pytest.raises(ValueError):
+            ZzWriter(path).write_blocks([(b"\x00", 1, 1, 1, [])], 1, code_lengths, -1)
+        # Nothing is written before the interval is checked
+        assert not os.path.exists(path)
+
+
+def test_write_read_seek_index():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("a", 1)
+    code_lengths.put("b", 1)
+
+    blocks = [
+        (b"\xff\xff", 16, 16, 16, [5, 10, 15]),
+        (b"\x00", 7, 7, 7, [5]),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "index.zz")
+        ZzWriter(path).write_blocks(blocks, len(blocks), code_lengths, 5)
+
+        reader = ZzReader(path)
+        index_interval, table = reader.read_index()
+        plain_table = reader.read_block_table()
+        data = [b"".join(reader.read_data(block=block)) for block in table]
+
+    assert index_interval == 5
+    assert [block.checkpoints for block in table] == [[5, 10, 15], [5]]
+    assert [block.checkpoints for block in plain_table] == [[], []]
+    assert data == [b"\xff\xff", b"\x00"]
+
+
+def test_write_blocks_checkpoint_mismatch():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("a", 1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        writer = ZzWriter(os.path.join(tmp_dir, "bad.zz"))
+        with pytest.raises(ValueError):
+            writer.write_blocks([(b"\x00", 8, 8, 8, [])], 1, code_lengths, 4)
+
+
+def test_mapped_reader_matches_reader():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("a", 1)
+    code_lengths.put("b", 1)
+
+    bits = BitStream([i % 5 == 0 for i in range(1000)])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "mapped.zz")
+        ZzWriter(path).write(bits, code_lengths)
+
+        with MappedZzReader(path) as reader:
+            read_code_lengths, bit_len = reader.read_header()
+            assert read_code_lengths.get("b") == 1
+            assert bit_len == len(bits)
+            assert reader.read_block_table() == []
+            assert not reader.is_bytes()
+
+            chunks = list(reader.read_data(16, start=4))
+            assert all(isinstance(chunk, memoryview) for chunk in chunks)
+            assert b"".join(chunks) == bits.to_bytearray()[4:]
+            del chunks
+
+            read_bits, _ = reader.read()
+            assert read_bits.readonly
+            assert read_bits == bits
+            del read_bits
+
+
+def test_mapped_reader_blocks_and_index():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("a", 1)
+    code_lengths.put("b", 1)
+
+    blocks = [
+        (b"\xff\xff", 16, 16, 16, [5, 10, 15]),
+        (b"\x40", 7, 7, 7, [5]),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "mapped_index.zz")
+        ZzWriter(path).write_blocks(blocks, len(blocks), code_lengths, 5)
+
+        with MappedZzReader(path) as reader:
+            index_interval, table = reader.read_index()
+            assert index_interval == 5
+            assert [block.checkpoints for block in table] == [[5, 10, 15], [5]]
+            assert str(reader.bits(table[1])) == "0100000"
+            assert [bytes(c) for c in reader.read_data(1, table[0])] == [b"\xff"] * 2
+
+            read_bits, _ = reader.read()
+            assert str(read_bits) == "1" * 16 + "0100000"
+
+
+def test_mapped_reader_empty_file():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "empty.zz")
+        open(path, "wb").close()
+
+        with MappedZzReader(path) as reader:
+            code_lengths, bit_len = reader.read_header()
+            assert code_lengths.is_empty()
+            assert bit_len == 0
+            assert list(reader.read_data()) == []
+
+
+def test_mapped_reader_truncated_file():
+    text = "abracadabra" * 100
+    encoder = HuffmanEncoder(text)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "truncated.zz")
+        ZzWriter(path).write(encoder.encode(text), encoder.code_lengths)
+        with open(path, "r+b") as f:
+            f.truncate(os.path.getsize(path) - 10)
+
+        # The decode error surfaces, not a BufferError from unmapping in use
+        with pytest.raises(ValueError):
+            with MappedZzReader(path) as reader:
+                header = reader.read_header_info()
+                decoder = HuffmanDecoder(header.code_lengths)
+                for _ in decoder.decode_stream(reader.read_data(4), header.bit_len):
+                    pass
+
+
+def _legacy_code_lengths(pairs: list[tuple[str, int]]) -> bytes:
+    """Return a code length table in the legacy fixed-size layout."""
+    out = len(pairs).to_bytes(2, "big")
+    for char, length in pairs:
+        encoded = char.encode("utf-8")
+        out += len(encoded).to_bytes(2, "big") + encoded + length.to_bytes(2, "big")
+    return out
+
+
+def test_varint_round_trip():
+    values = [0, 1, 127, 128, 300, 1 << 32, (1 << 64) + 5]
+    f = io.BytesIO()
+    for value in values:
+        write_varint(f, value)
+    assert len(f.getvalue()) < 8 * len(values)
+
+    f.seek(0)
+    assert [read_varint(f) for _ in values] == values
+    with pytest.raises(ValueError):
+        read_varint(f)
+    with pytest.raises(ValueError):
+        write_varint(f, -1)
+
+
+def test_header_stores_decoded_lengths():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("é", 1)
+    code_lengths.put("b", 1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "sizes.zz")
+        ZzWriter(path).write_stream(
+            [b"\x80"], 3, code_lengths, num_chars=3, num_bytes=4
+        )
+
+        header = ZzReader(path).read_header_info()
+        assert header.version == 1
+        assert (header.num_chars, header.num_bytes) == (3, 4)
+        assert header.bit_len == 3
+        assert header.code_lengths.get("é") == 1
+        assert str(ZzReader(path).read()[0]) == "100"
+
+        # Without sizes, the decoded length is unknown
+        ZzWriter(path).write_stream([b"\x80"], 3, code_lengths)
+        header = MappedZzReader(path).read_header_info()
+        assert header.num_chars is None and header.num_bytes is None
+
+
+def test_read_legacy_plain_file():
+    legacy = _legacy_code_lengths([("a", 1), ("é", 1)]) + (9).to_bytes(4, "big")
+    data = bytes([0b01101001, 0b10000000])
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "legacy.zz")
+        with open(path, "wb") as f:
+            f.write(legacy + data)
+
+        for reader in (ZzReader(path), MappedZzReader(path)):
+            header = reader.read_header_info()
+            assert header.version == 0
+            assert not header.is_bytes and header.num_bytes is None
+            read_bits, code_lengths = reader.read()
+            assert str(read_bits) == "011010011"
+            assert code_lengths.get("é") == 1
+            del read_bits
+
+
+def test_read_unsupported_version():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "v3.zz")
+        with open(path, "wb") as f:
+            f.write(b"\x89ZZ\x02\x00")
+
+        with pytest.raises(ValueError, match="Unsupported"):
+            ZzReader(path).read_header_info()
+
+
+def test_write_read_stored():
+    data = "héllo".encode("utf-8")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "stored.zz")
+        ZzWriter(path).write_stored([data[:2], data[2:]], 5, len(data))
+
+        for reader in (ZzReader(path), MappedZzReader(path)):
+            header = reader.read_header_info()
+            assert header.is_stored and not header.is_bytes
+            assert header.code_lengths.is_empty()
+            assert (header.num_chars, header.num_bytes) == (5, 6)
+            assert b"".join(reader.read_data()) == data
+            # The data is not encoded, so it cannot be read as bits
+            with pytest.raises(ValueError, match="stored"):
+                reader.read()
+
+        # Only the preamble, an empty table and the lengths are added
+        assert os.path.getsize(path) - len(data) < 16
+
+        with pytest.raises(ValueError):
+            ZzWriter(path).write_stored([data], 5, len(data) + 1)
+
+
+def test_read_sampled_chunks_and_decode_sample():
+    data = ("naïve café\r\n" * 2000).encode("utf-8")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "sample.txt")
+        with open(path, "wb") as f:
+            f.write(data)
+
+        chunks = list(read_sampled_chunks(path, 0.25, 1000))
+        assert len(chunks) == -(-len(data) // 4000)
+        assert chunks[0] == data[:1000]
+        assert chunks[1] == data[4000:5000]
+        assert list(read_sampled_chunks(path, 1, 1000))[-1] == data[-1000:]
+
+        with pytest.raises(ValueError):
+            next(read_sampled_chunks(path, 1.5))
+
+    # Characters cut at either end are dropped, newlines are translated
+    assert decode_sample("aïb\r\nc".encode("utf-8")[2:]) == "b\nc"
+    assert decode_sample("abï".encode("utf-8")[:-1]) == "ab"
+    assert decode_sample(b"\xef\xbb\xbfab", at_start=True) == "ab"
+
+
+def test_padded_varint():
+    padded = pack_varint(300, 10)
+    assert len(padded) == 10
+    assert read_varint(io.BytesIO(padded + b"\x01")) == 300
+    assert pack_varint(0, 1) == b"\x00"
+    with pytest.raises(ValueError):
+        pack_varint(1 << 14, 2)
+
+
+def test_write_stream_unsized():
+    code_lengths = ProbeHashmap[str, int]()
+    code_lengths.put("a", 1)
+    code_lengths.put("b", 1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "unsized.zz")
+        ZzWriter(path).write_stream_unsized(
+            [b"\xa0", b"\x80"], code_lengths, lambda: (9, 9, 9)
+        )
+
+        header = ZzReader(path).read_header_info()
+        assert (header.bit_len, header.num_chars, header.num_bytes) == (9, 9, 9)
+        assert str(ZzReader(path).read()[0]) == "101000001"
+
+        with pytest.raises(ValueError):
+            ZzWriter(path).write_stream_unsized(
+                [b"\xa0"], code_lengths, lambda: (9, 9, 9)
+            )